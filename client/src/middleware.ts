@@ -32,13 +32,24 @@ export const onRequest = defineMiddleware(async (context, next) => {
   try {
     // Forward the request to the API server
     const response = await fetch(serverRequest);
-    const data = await response.arrayBuffer();
+    
+    // 204 and 304 responses (e.g. conditional GETs revalidated by ETag) must not carry a body.
+    // Server-Sent Event streams are passed through as they arrive instead of being buffered.
+    const isEventStream = response.headers.get('content-type')?.startsWith('text/event-stream');
+    const data = response.status === 204 || response.status === 304 ? null
+      : isEventStream ? response.body
+      : await response.arrayBuffer();
+    
+    // fetch has already decoded a gzip/brotli body, so drop the headers describing the encoded one
+    const headers = new Headers(response.headers);
+    headers.delete('content-encoding');
+    headers.delete('content-length');
     
     // Return the response from the API server
     return new Response(data, {
       status: response.status,
       statusText: response.statusText,
-      headers: response.headers,
+      headers,
     });
   } catch (error) {
     console.error('Error forwarding request to API:', error);
@@ -8,6 +8,19 @@ NC='\033[0m' # No Color
 INITIAL_DIR=$(pwd)
 SCRIPT_DIR=$(dirname "$(realpath "$0")")
 
+# Serving mode for the API: "development" (Flask dev server, default),
+# "production" (multi-process gunicorn, see server/gunicorn.conf.py) or
+# "async" (ASGI app on an asyncio engine served by hypercorn, see server/asgi.py).
+# Set APP_MODE or pass --production or --async.
+APP_MODE=${APP_MODE:-development}
+for arg in "$@"; do
+    if [[ "$arg" == "--production" ]]; then
+        APP_MODE=production
+    elif [[ "$arg" == "--async" ]]; then
+        APP_MODE=async
+    fi
+done
+
 # Check if we're in scripts, client, or server directory and navigate up one level
 current_directory=$(basename $(pwd))
 if [[ "$current_directory" =~ ^(scripts|client|server)$ ]]; then
@@ -25,14 +38,24 @@ cd server || {
     cd "$INITIAL_DIR"
     exit 1
 }
-export FLASK_DEBUG=1
-export FLASK_PORT=5100
-
-# Use appropriate Python command based on OS
-if [[ "$OSTYPE" == "msys" ]] || [[ "$OSTYPE" == "win32" ]]; then
-    py app.py &
+if [[ "$APP_MODE" == "production" ]] && [[ "$OSTYPE" != "msys" ]] && [[ "$OSTYPE" != "win32" ]]; then
+    # Gunicorn does not run on Windows; there the development server is used
+    echo "Serving the API with gunicorn (production mode)..."
+    export DATABASE_PROFILE=production
+    gunicorn -c gunicorn.conf.py app:app &
+elif [[ "$APP_MODE" == "async" ]]; then
+    echo "Serving the API with hypercorn (async mode)..."
+    hypercorn asgi:app --bind 0.0.0.0:5100 &
 else
-    python3 app.py &
+    export FLASK_DEBUG=1
+    export FLASK_PORT=5100
+
+    # Use appropriate Python command based on OS
+    if [[ "$OSTYPE" == "msys" ]] || [[ "$OSTYPE" == "win32" ]]; then
+        py app.py &
+    else
+        python3 app.py &
+    fi
 fi
 
 # Store the Python server process ID
@@ -54,7 +77,7 @@ CLIENT_PID=$!
 sleep 5
 
 # Display the server URLs
-echo -e "\n${GREEN}Server (Flask) running at: http://localhost:5100${NC}"
+echo -e "\n${GREEN}Server (Flask, ${APP_MODE} mode) running at: http://localhost:5100${NC}"
 echo -e "${GREEN}Client (Astro) server running at: http://localhost:4321${NC}\n"
 
 echo "Ctl-C to stop the servers"
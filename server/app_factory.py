@@ -0,0 +1,100 @@
+# Application factories for the API.
+# Kept apart from app.py so tools such as the benchmarks can build an app
+# for another database without importing the module-level app, which opens
+# the default database. create_app builds the WSGI (Flask) app and
+# create_async_app the ASGI (Quart) variant served from asgi.py.
+from typing import TYPE_CHECKING
+from flask import Flask
+from routes.games import games_bp
+from routes.games_bulk import games_bulk_bp
+from routes.game_changes import game_changes_bp
+from routes.publishers import publishers_bp
+from routes.categories import categories_bp
+from routes.facets import facets_bp
+from utils.compression import init_compression
+from utils.database import init_async_db, init_db
+from utils.json_provider import init_json
+from utils.metrics import init_metrics
+from utils.profiling import init_profiling
+from utils.reference_cache import init_reference_cache
+
+if TYPE_CHECKING:
+    from quart import Quart
+
+def create_app(connection_string: str | None = None, config: dict | None = None) -> Flask:
+    """
+    Create the API app with its database, instrumentation and blueprints.
+
+    Args:
+        connection_string (str | None): Optional database connection string, defaults to the app database
+        config (dict | None): Optional app config applied before the database is initialized
+
+    Returns:
+        Flask: The configured app
+    """
+    app = Flask(__name__)
+    app.config.update(config or {})
+
+    # Initialize the database with the app
+    init_db(app, connection_string=connection_string)
+
+    # Load the publishers and categories before the first request needs them
+    init_reference_cache(app)
+
+    # Encode JSON responses with orjson when it is installed, before profiling wraps the provider
+    init_json(app)
+
+    # Record request and SQL metrics, served on /metrics
+    init_metrics(app)
+
+    # Server-Timing for profiled requests and the slow-query log
+    init_profiling(app)
+
+    # gzip/brotli for large JSON responses, reusing compressed cached bodies
+    init_compression(app)
+
+    # Register blueprints
+    app.register_blueprint(games_bp)
+    app.register_blueprint(games_bulk_bp)
+    app.register_blueprint(game_changes_bp)
+    app.register_blueprint(publishers_bp)
+    app.register_blueprint(categories_bp)
+    app.register_blueprint(facets_bp)
+
+    return app
+
+def create_async_app(connection_string: str | None = None, config: dict | None = None) -> 'Quart':
+    """
+    Create the ASGI variant of the API, reading and writing through an asyncio engine.
+
+    It serves the games, publishers, categories and facets routes with the same JSON
+    contracts as create_app, without the response cache, ETags, metrics or
+    profiling. Quart is imported here so the WSGI app does not depend on it.
+
+    Args:
+        connection_string (str | None): Optional database connection string, defaults to the app database
+        config (dict | None): Optional app config applied before the database is initialized
+
+    Returns:
+        Quart: The configured app
+    """
+    from quart import Quart
+    from routes.games_async import games_async_bp
+    from routes.publishers_async import publishers_async_bp
+
+    app = Quart(__name__)
+    app.config.update(config or {})
+
+    # Create the schema and the async engine
+    engine = init_async_db(app, connection_string=connection_string)
+
+    @app.after_serving
+    async def dispose_engine() -> None:
+        """Close the pooled connections when the server shuts down."""
+        await engine.dispose()
+
+    # Register blueprints
+    app.register_blueprint(games_async_bp)
+    app.register_blueprint(publishers_async_bp)
+
+    return app
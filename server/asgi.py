@@ -0,0 +1,9 @@
+# ASGI entry point: the API served with an asyncio database engine, so one
+# process handles many concurrent slow clients without a thread for each.
+#
+# Start from the server directory with:
+#     hypercorn asgi:app --bind 0.0.0.0:5100
+from quart import Quart
+from app_factory import create_async_app
+
+app: Quart = create_async_app()
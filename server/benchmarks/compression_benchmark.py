@@ -0,0 +1,147 @@
+# Benchmark of response compression: bytes on the wire and server CPU time
+# per request for the games listings, sent uncompressed (identity) and with
+# each supported content coding, with the response cache off (every response
+# is serialized and compressed) and on (cached bodies and their compressed
+# forms are reused).
+#
+# Requests go through the Flask test client in this process, so CPU time is
+# that of the app plus a constant test client overhead, without network I/O.
+#
+# Run from the server directory:
+#     python -m benchmarks.compression_benchmark --games 5000 --output compression.json
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any
+from benchmarks.http_benchmark import DEFAULT_CATEGORIES, DEFAULT_GAMES, DEFAULT_PUBLISHERS, seed_catalog
+
+DEFAULT_REQUESTS: int = 50
+
+# Scenario name -> path of a listing worth compressing
+SCENARIOS: dict[str, str] = {
+    'games_list': '/api/games',
+    'games_page': '/api/games?limit=100',
+    'games_by_category': '/api/games?category_id=1'
+}
+
+def measure(client: Any, path: str, encoding: str, requests: int) -> dict[str, Any]:
+    """
+    Time repeated requests for one path and content coding.
+
+    One untimed request warms the caches first.
+
+    Args:
+        client (Any): A Flask test client
+        path (str): The path to request
+        encoding (str): The Accept-Encoding to send, 'identity' for none
+        requests (int): Number of timed requests
+
+    Returns:
+        dict[str, Any]: Body bytes, the Content-Encoding and mean CPU milliseconds per request
+    """
+    headers = {'Accept-Encoding': encoding}
+    response = client.get(path, headers=headers)
+    start = time.process_time()
+    for _ in range(requests):
+        response = client.get(path, headers=headers)
+    cpu = (time.process_time() - start) / requests
+    return {
+        "content_encoding": response.headers.get('Content-Encoding', 'identity'),
+        "bytes": len(response.data),
+        "cpu_ms": round(cpu * 1000, 3)
+    }
+
+def run_benchmark(game_count: int = DEFAULT_GAMES, publisher_count: int = DEFAULT_PUBLISHERS,
+                  category_count: int = DEFAULT_CATEGORIES, requests: int = DEFAULT_REQUESTS,
+                  seed: int = 0) -> dict[str, Any]:
+    """
+    Seed a temporary catalog and measure every scenario, coding and cache setting.
+
+    Args:
+        game_count (int): Number of seeded games
+        publisher_count (int): Number of seeded publishers
+        category_count (int): Number of seeded categories
+        requests (int): Timed requests per measurement
+        seed (int): Seed for the catalog
+
+    Returns:
+        dict[str, Any]: Run metadata and, per scenario, coding and cache setting,
+            the bytes, their ratio to the identity bytes and CPU milliseconds per request
+    """
+    from app_factory import create_app
+    from models import db
+    from utils.compression import supported_encodings
+
+    encodings = ['identity', *supported_encodings()]
+    results: dict[str, Any] = {name: {encoding: {} for encoding in encodings} for name in SCENARIOS}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connection_string = f"sqlite:///{os.path.join(temp_dir, 'benchmark.db')}"
+        seed_catalog(connection_string, game_count, publisher_count, category_count, seed)
+
+        for cache in ('uncached', 'cached'):
+            app = create_app(connection_string, {
+                'RESPONSE_CACHE_ENABLED': cache == 'cached',
+                'METRICS_ENABLED': False,
+                'SLOW_QUERY_THRESHOLD_MS': None
+            })
+            client = app.test_client()
+            for name, path in SCENARIOS.items():
+                for encoding in encodings:
+                    results[name][encoding][cache] = measure(client, path, encoding, requests)
+            with app.app_context():
+                db.engine.dispose()
+
+    for scenario in results.values():
+        identity_bytes = scenario['identity']['uncached']['bytes']
+        for by_cache in scenario.values():
+            for result in by_cache.values():
+                result['ratio'] = round(result['bytes'] / identity_bytes, 3) if identity_bytes else None
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "games": game_count,
+            "publishers": publisher_count,
+            "categories": category_count,
+            "requests": requests,
+            "seed": seed
+        },
+        "scenarios": results
+    }
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    Args:
+        argv (list[str] | None): Arguments, defaults to sys.argv
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description='Benchmark response compression of the Tailspin Toys API')
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES, help='Number of seeded games')
+    parser.add_argument('--publishers', type=int, default=DEFAULT_PUBLISHERS, help='Number of seeded publishers')
+    parser.add_argument('--categories', type=int, default=DEFAULT_CATEGORIES, help='Number of seeded categories')
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS, help='Timed requests per measurement')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the catalog')
+    parser.add_argument('--output', help='Write the results JSON to this file')
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.games, args.publishers, args.categories, args.requests, args.seed)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(output + '\n')
+    print(output)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
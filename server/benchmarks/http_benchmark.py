@@ -0,0 +1,403 @@
+# End-to-end HTTP benchmark for the games and publishers API.
+# Seeds a synthetic catalog into a temporary SQLite file, serves the app from
+# a real threaded WSGI server in a separate process, drives each scenario with
+# concurrent keep-alive clients and reports throughput and latency
+# percentiles as JSON. Results can be compared against a saved baseline, and
+# the run fails when a scenario regresses past the threshold.
+#
+# Run from the server directory:
+#     python -m benchmarks.http_benchmark --games 5000 --output results.json
+#     python -m benchmarks.http_benchmark --baseline results.json --threshold 0.2
+import argparse
+import http.client
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, NamedTuple
+
+DEFAULT_GAMES: int = 2000
+DEFAULT_PUBLISHERS: int = 100
+DEFAULT_CATEGORIES: int = 20
+DEFAULT_CONCURRENCY: int = 8
+DEFAULT_REQUESTS: int = 400
+DEFAULT_WARMUP: int = 20
+DEFAULT_THRESHOLD: float = 0.2
+DEFAULT_PROFILE: str = 'production'
+SERVER_START_TIMEOUT: float = 30.0
+
+class Scenario(NamedTuple):
+    """A named request pattern; make_request returns (method, path, JSON body or None)."""
+    name: str
+    make_request: Callable[[random.Random], tuple[str, str, Any]]
+
+def build_scenarios(game_count: int, publisher_count: int, category_count: int) -> list[Scenario]:
+    """
+    Build the benchmark scenarios for a seeded catalog.
+
+    Read scenarios run before write scenarios, so writes do not change the
+    catalog the reads are measured against.
+
+    Args:
+        game_count (int): Number of seeded games
+        publisher_count (int): Number of seeded publishers
+        category_count (int): Number of seeded categories
+
+    Returns:
+        list[Scenario]: The scenarios in run order
+    """
+    def new_game(rng: random.Random) -> dict[str, Any]:
+        """Build a valid game for the write scenarios."""
+        return {
+            "title": f"Benchmark Game {rng.randrange(10 ** 9)}",
+            "description": "A game created by the HTTP benchmark suite",
+            "category_id": rng.randint(1, category_count),
+            "publisher_id": rng.randint(1, publisher_count),
+            "star_rating": round(rng.uniform(1.0, 5.0), 1)
+        }
+
+    return [
+        Scenario('games_list', lambda rng: ('GET', '/api/games', None)),
+        Scenario('games_page', lambda rng: ('GET', '/api/games?limit=20', None)),
+        Scenario('games_by_category', lambda rng: (
+            'GET', f'/api/games?category_id={rng.randint(1, category_count)}', None
+        )),
+        Scenario('games_by_category_and_publisher', lambda rng: (
+            'GET',
+            f'/api/games?category_id={rng.randint(1, category_count)}'
+            f'&publisher_id={rng.randint(1, publisher_count)}',
+            None
+        )),
+        Scenario('game_detail', lambda rng: ('GET', f'/api/games/{rng.randint(1, game_count)}', None)),
+        Scenario('publishers', lambda rng: ('GET', '/api/publishers', None)),
+        Scenario('game_create', lambda rng: ('POST', '/api/games', new_game(rng))),
+        Scenario('game_update', lambda rng: (
+            'PUT', f'/api/games/{rng.randint(1, game_count)}',
+            {"star_rating": round(rng.uniform(1.0, 5.0), 1)}
+        ))
+    ]
+
+def seed_catalog(connection_string: str, game_count: int, publisher_count: int,
+                 category_count: int, seed: int) -> None:
+    """
+    Seed a synthetic catalog through the seed utilities.
+
+    Args:
+        connection_string (str): The database to seed
+        game_count (int): Number of games
+        publisher_count (int): Number of publishers
+        category_count (int): Number of categories
+        seed (int): Seed for the catalog generator
+    """
+    from models import db
+    from utils.seed_database import bulk_load_catalog, create_app, generate_synthetic_catalog
+
+    app = create_app(connection_string)
+    with app.app_context():
+        category_names, publisher_names, games = generate_synthetic_catalog(
+            game_count, publisher_count, category_count, seed
+        )
+        bulk_load_catalog(category_names, publisher_names, games)
+        db.session.commit()
+        db.engine.dispose()
+
+def _serve(connection_string: str, config: dict[str, Any], port_queue: Any) -> None:
+    """
+    Serve the API from a threaded WSGI server until the process is terminated.
+
+    Runs in a child process so the server and the clients do not share a GIL.
+
+    Args:
+        connection_string (str): The seeded database
+        config (dict[str, Any]): Extra app config
+        port_queue: Queue receiving the port the server listens on
+    """
+    from werkzeug.serving import WSGIRequestHandler, make_server
+    from app_factory import create_app
+
+    class KeepAliveRequestHandler(WSGIRequestHandler):
+        """Request handler that keeps HTTP/1.1 connections open between requests."""
+        protocol_version = 'HTTP/1.1'
+
+        def log_request(self, *args: Any, **kwargs: Any) -> None:
+            """Skip the per-request access log."""
+
+    app = create_app(connection_string, config)
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=KeepAliveRequestHandler)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values.
+
+    Args:
+        sorted_values (list[float]): The values in ascending order
+        fraction (float): The percentile as a fraction, e.g. 0.95
+
+    Returns:
+        float: The smallest value with at least that fraction of values at or below it
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * fraction))
+    return sorted_values[rank - 1]
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    """
+    Summarize the latencies of one scenario.
+
+    Args:
+        latencies (list[float]): Seconds per successful request
+        errors (int): Number of failed requests
+        elapsed (float): Wall-clock seconds the scenario ran for
+
+    Returns:
+        dict[str, Any]: Request counts, throughput and latency stats in milliseconds
+    """
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered) + errors,
+        "errors": errors,
+        "throughput_rps": round(len(ordered) / elapsed, 1) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(ordered) * 1000, 3) if ordered else 0.0,
+            "p50": round(percentile(ordered, 0.50) * 1000, 3),
+            "p95": round(percentile(ordered, 0.95) * 1000, 3),
+            "p99": round(percentile(ordered, 0.99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if ordered else 0.0
+        }
+    }
+
+def run_scenario(port: int, scenario: Scenario, requests: int, concurrency: int,
+                 warmup: int, seed: int) -> dict[str, Any]:
+    """
+    Drive one scenario with concurrent clients and summarize the results.
+
+    Each client owns a keep-alive connection and sends its share of the
+    requests back to back.
+
+    Args:
+        port (int): The port of the benchmark server
+        scenario (Scenario): The scenario to run
+        requests (int): Number of timed requests across all clients
+        concurrency (int): Number of concurrent clients
+        warmup (int): Untimed requests sent first by each client
+        seed (int): Seed for the request generators
+
+    Returns:
+        dict[str, Any]: The summary produced by summarize
+    """
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(concurrency + 1)
+    shares = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+
+    def client(index: int) -> None:
+        """Send the warmup and timed requests of one client."""
+        nonlocal errors
+        rng = random.Random(f'{seed}-{scenario.name}-{index}')
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+
+        def send() -> tuple[float, bool]:
+            method, path, body = scenario.make_request(rng)
+            payload = json.dumps(body) if body is not None else None
+            headers = {'Content-Type': 'application/json'} if body is not None else {}
+            started = time.perf_counter()
+            connection.request(method, path, body=payload, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            return time.perf_counter() - started, response.status < 400
+
+        try:
+            for _ in range(warmup):
+                send()
+            start_barrier.wait()
+            own_latencies = []
+            own_errors = 0
+            for _ in range(shares[index]):
+                latency, ok = send()
+                if ok:
+                    own_latencies.append(latency)
+                else:
+                    own_errors += 1
+        finally:
+            connection.close()
+        with lock:
+            latencies.extend(own_latencies)
+            errors += own_errors
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(client, i) for i in range(concurrency)]
+        start_barrier.wait()
+        started = time.perf_counter()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - started
+
+    return summarize(latencies, errors, elapsed)
+
+def run_benchmark(game_count: int = DEFAULT_GAMES, publisher_count: int = DEFAULT_PUBLISHERS,
+                  category_count: int = DEFAULT_CATEGORIES, requests: int = DEFAULT_REQUESTS,
+                  concurrency: int = DEFAULT_CONCURRENCY, warmup: int = DEFAULT_WARMUP,
+                  seed: int = 0, scenario_names: list[str] | None = None,
+                  profile: str = DEFAULT_PROFILE, config: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Seed a temporary catalog, start the server and run every scenario.
+
+    Args:
+        game_count (int): Number of seeded games
+        publisher_count (int): Number of seeded publishers
+        category_count (int): Number of seeded categories
+        requests (int): Timed requests per scenario
+        concurrency (int): Concurrent clients per scenario
+        warmup (int): Untimed requests per client before each scenario
+        seed (int): Seed for the catalog and the request generators
+        scenario_names (list[str] | None): Scenarios to run, defaults to all
+        profile (str): The database profile of the server, see utils.database.init_db
+        config (dict[str, Any] | None): Extra app config for the server
+
+    Returns:
+        dict[str, Any]: Run metadata and a summary per scenario
+    """
+    scenarios = build_scenarios(game_count, publisher_count, category_count)
+    if scenario_names:
+        unknown = set(scenario_names) - {s.name for s in scenarios}
+        if unknown:
+            raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+        scenarios = [s for s in scenarios if s.name in scenario_names]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connection_string = f"sqlite:///{os.path.join(temp_dir, 'benchmark.db')}"
+        seed_catalog(connection_string, game_count, publisher_count, category_count, seed)
+
+        # The slow-query log is off so logging does not skew the timings
+        server_config = {'DATABASE_PROFILE': profile, 'SLOW_QUERY_THRESHOLD_MS': None, **(config or {})}
+        context = multiprocessing.get_context('spawn')
+        port_queue = context.Queue()
+        server = context.Process(
+            target=_serve, args=(connection_string, server_config, port_queue), daemon=True
+        )
+        server.start()
+        try:
+            port = port_queue.get(timeout=SERVER_START_TIMEOUT)
+            results = {
+                scenario.name: run_scenario(port, scenario, requests, concurrency, warmup, seed)
+                for scenario in scenarios
+            }
+        finally:
+            server.terminate()
+            server.join()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "games": game_count,
+            "publishers": publisher_count,
+            "categories": category_count,
+            "requests": requests,
+            "concurrency": concurrency,
+            "profile": profile,
+            "warmup": warmup,
+            "seed": seed
+        },
+        "scenarios": results
+    }
+
+def compare_results(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """
+    Find the scenarios that regressed against a baseline run.
+
+    A scenario regresses when its throughput drops, or its p95 or p99 latency
+    grows, by more than the threshold. Scenarios missing from either run are
+    ignored.
+
+    Args:
+        current (dict[str, Any]): The result of run_benchmark
+        baseline (dict[str, Any]): A saved result to compare against
+        threshold (float): Allowed relative change, e.g. 0.2 for 20%
+
+    Returns:
+        list[str]: A description of each regression, empty if there are none
+    """
+    regressions = []
+    for name, result in current['scenarios'].items():
+        base = baseline.get('scenarios', {}).get(name)
+        if base is None:
+            continue
+        if result['errors'] > base['errors']:
+            regressions.append(f"{name}: {result['errors']} errors (baseline {base['errors']})")
+        if base['throughput_rps'] and result['throughput_rps'] < base['throughput_rps'] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {result['throughput_rps']} rps (baseline {base['throughput_rps']} rps)"
+            )
+        for stat in ('p95', 'p99'):
+            now, before = result['latency_ms'][stat], base['latency_ms'][stat]
+            if before and now > before * (1 + threshold):
+                regressions.append(f"{name}: {stat} {now} ms (baseline {before} ms)")
+    return regressions
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    Args:
+        argv (list[str] | None): Arguments, defaults to sys.argv
+
+    Returns:
+        int: Exit code, 1 if the run regressed against the baseline
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the Tailspin Toys API over HTTP')
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES, help='Number of seeded games')
+    parser.add_argument('--publishers', type=int, default=DEFAULT_PUBLISHERS, help='Number of seeded publishers')
+    parser.add_argument('--categories', type=int, default=DEFAULT_CATEGORIES, help='Number of seeded categories')
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS, help='Timed requests per scenario')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='Concurrent clients')
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP, help='Untimed requests per client')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the catalog and requests')
+    parser.add_argument('--profile', default=DEFAULT_PROFILE, choices=['default', 'production'],
+                        help='Database profile of the server')
+    parser.add_argument('--scenario', action='append', dest='scenarios',
+                        help='Scenario to run (repeatable), defaults to all')
+    parser.add_argument('--output', help='Write the results JSON to this file')
+    parser.add_argument('--baseline', help='Compare against the results JSON in this file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed relative regression against the baseline')
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        args.games, args.publishers, args.categories, args.requests,
+        args.concurrency, args.warmup, args.seed, args.scenarios, args.profile
+    )
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(output + '\n')
+    print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            regressions = compare_results(results, json.load(baseline_file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
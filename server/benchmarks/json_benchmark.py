@@ -0,0 +1,175 @@
+# Benchmark of the JSON encoders: CPU time to serialize the games catalog
+# with Flask's default stdlib provider and with the FastJSONProvider (orjson when
+# installed), and whether both produce the same bytes. It is measured twice:
+# once encoding the catalog's dictionaries directly, and once for full
+# requests to the games listings with the response cache off, so every
+# response is serialized.
+#
+# Requests go through the Flask test client in this process, so CPU time is
+# that of the app plus a constant test client overhead, without network I/O.
+#
+# Run from the server directory:
+#     python -m benchmarks.json_benchmark --games 5000 --output json.json
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+from benchmarks.compression_benchmark import SCENARIOS
+from benchmarks.http_benchmark import DEFAULT_CATEGORIES, DEFAULT_GAMES, DEFAULT_PUBLISHERS, seed_catalog
+
+DEFAULT_REQUESTS: int = 50
+
+# Encoder name -> whether the app uses the FastJSONProvider
+ENCODERS: dict[str, bool] = {
+    'default': False,
+    'fast': True
+}
+
+def time_encode(encode: Callable[[Any], bytes], payload: Any, repeats: int) -> dict[str, Any]:
+    """
+    Time repeated encodings of a payload.
+
+    Args:
+        encode (Callable[[Any], bytes]): The encoder
+        payload (Any): The data to encode
+        repeats (int): Number of timed encodings
+
+    Returns:
+        dict[str, Any]: Encoded bytes and mean CPU milliseconds per encoding
+    """
+    body = encode(payload)
+    start = time.process_time()
+    for _ in range(repeats):
+        encode(payload)
+    cpu = (time.process_time() - start) / repeats
+    return {"bytes": len(body), "cpu_ms": round(cpu * 1000, 3)}
+
+def measure(client: Any, path: str, requests: int) -> dict[str, Any]:
+    """
+    Time repeated requests for one path, after one untimed request.
+
+    Args:
+        client (Any): A Flask test client
+        path (str): The path to request
+        requests (int): Number of timed requests
+
+    Returns:
+        dict[str, Any]: The body, its size and mean CPU milliseconds per request
+    """
+    response = client.get(path)
+    start = time.process_time()
+    for _ in range(requests):
+        response = client.get(path)
+    cpu = (time.process_time() - start) / requests
+    return {"body": response.data, "bytes": len(response.data), "cpu_ms": round(cpu * 1000, 3)}
+
+def run_benchmark(game_count: int = DEFAULT_GAMES, publisher_count: int = DEFAULT_PUBLISHERS,
+                  category_count: int = DEFAULT_CATEGORIES, requests: int = DEFAULT_REQUESTS,
+                  seed: int = 0) -> dict[str, Any]:
+    """
+    Seed a temporary catalog and measure the catalog encoding and every
+    listing scenario with each encoder.
+
+    Args:
+        game_count (int): Number of seeded games
+        publisher_count (int): Number of seeded publishers
+        category_count (int): Number of seeded categories
+        requests (int): Timed encodings and requests per measurement
+        seed (int): Seed for the catalog
+
+    Returns:
+        dict[str, Any]: Run metadata, the encoder in use, and per scenario and
+            encoder the bytes and CPU milliseconds, with the speedup of the
+            fast encoder and whether its bytes match the default's
+    """
+    from flask.json.provider import DefaultJSONProvider
+    from app_factory import create_app
+    from models import db, Game
+    from routes.games import get_games_projection_query
+    from utils.json_provider import FastJSONProvider, json_encoder_name
+
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connection_string = f"sqlite:///{os.path.join(temp_dir, 'benchmark.db')}"
+        seed_catalog(connection_string, game_count, publisher_count, category_count, seed)
+
+        bodies: dict[str, dict[str, bytes]] = {}
+        for encoder, fast in ENCODERS.items():
+            app = create_app(connection_string, {
+                'FAST_JSON_ENABLED': fast,
+                'RESPONSE_CACHE_ENABLED': False,
+                'METRICS_ENABLED': False,
+                'SLOW_QUERY_THRESHOLD_MS': None
+            })
+            with app.app_context():
+                catalog = [Game.row_to_dict(row) for row in db.session.execute(get_games_projection_query())]
+                provider = FastJSONProvider(app) if fast else DefaultJSONProvider(app)
+                # jsonify's body: compact, with a trailing newline
+                encode = lambda obj: provider.response(obj).get_data()
+                bodies.setdefault('catalog', {})[encoder] = encode(catalog)
+                results.setdefault('catalog', {})[encoder] = time_encode(encode, catalog, requests)
+
+            client = app.test_client()
+            for name, path in SCENARIOS.items():
+                result = measure(client, path, requests)
+                bodies.setdefault(name, {})[encoder] = result.pop('body')
+                results.setdefault(name, {})[encoder] = result
+            with app.app_context():
+                db.engine.dispose()
+
+    for name, by_encoder in results.items():
+        default_ms = by_encoder['default']['cpu_ms']
+        fast_ms = by_encoder['fast']['cpu_ms']
+        by_encoder['speedup'] = round(default_ms / fast_ms, 2) if fast_ms else None
+        by_encoder['identical'] = bodies[name]['default'] == bodies[name]['fast']
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "encoder": json_encoder_name(),
+            "games": game_count,
+            "publishers": publisher_count,
+            "categories": category_count,
+            "requests": requests,
+            "seed": seed
+        },
+        "scenarios": results
+    }
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    Args:
+        argv (list[str] | None): Arguments, defaults to sys.argv
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description='Benchmark JSON encoding of the Tailspin Toys API')
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES, help='Number of seeded games')
+    parser.add_argument('--publishers', type=int, default=DEFAULT_PUBLISHERS, help='Number of seeded publishers')
+    parser.add_argument('--categories', type=int, default=DEFAULT_CATEGORIES, help='Number of seeded categories')
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS, help='Timed encodings and requests per measurement')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the catalog')
+    parser.add_argument('--output', help='Write the results JSON to this file')
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.games, args.publishers, args.categories, args.requests, args.seed)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(output + '\n')
+    print(output)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
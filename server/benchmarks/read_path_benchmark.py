@@ -0,0 +1,151 @@
+# Benchmark of the games read paths: wall time to read and serialize the
+# whole catalog through ORM instances plus Game.to_dict, which the API used
+# to do, and through the column-projected Core select plus Game.row_to_dict
+# it uses now. Each path runs several times on a seeded catalog and the
+# fastest run is reported, with whether both paths produced the same output.
+#
+# Run from the server directory:
+#     python -m benchmarks.read_path_benchmark --games 5000 --output read_paths.json
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+from benchmarks.http_benchmark import DEFAULT_CATEGORIES, DEFAULT_GAMES, DEFAULT_PUBLISHERS, seed_catalog
+
+DEFAULT_RUNS: int = 5
+
+def orm_read() -> list[dict]:
+    """
+    Read the catalog through ORM instances and to_dict.
+
+    Returns:
+        list[dict]: The serialized games in id order
+    """
+    from models import Game
+    from routes.games import get_games_base_query
+
+    return [game.to_dict() for game in get_games_base_query().order_by(Game.id).all()]
+
+def projected_read() -> list[dict]:
+    """
+    Read the catalog through the column-projected query and row_to_dict.
+
+    Returns:
+        list[dict]: The serialized games in id order
+    """
+    from models import db, Game
+    from routes.games import get_games_projection_query
+
+    rows = db.session.execute(get_games_projection_query().order_by(Game.id))
+    return [Game.row_to_dict(row) for row in rows]
+
+# Read path name -> function reading and serializing the catalog
+READ_PATHS: dict[str, Callable[[], list[dict]]] = {
+    'orm': orm_read,
+    'projected': projected_read
+}
+
+def best_time(read: Callable[[], list[dict]], runs: int) -> float:
+    """
+    Time several runs of a read path, each with an empty session.
+
+    Args:
+        read (Callable[[], list[dict]]): The read path
+        runs (int): Number of timed runs
+
+    Returns:
+        float: The fastest run, in seconds
+    """
+    from models import db
+
+    timings = []
+    for _ in range(runs):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        read()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def run_benchmark(game_count: int = DEFAULT_GAMES, publisher_count: int = DEFAULT_PUBLISHERS,
+                  category_count: int = DEFAULT_CATEGORIES, runs: int = DEFAULT_RUNS,
+                  seed: int = 0) -> dict[str, Any]:
+    """
+    Seed a temporary catalog and time every read path.
+
+    Args:
+        game_count (int): Number of seeded games
+        publisher_count (int): Number of seeded publishers
+        category_count (int): Number of seeded categories
+        runs (int): Timed runs per read path
+        seed (int): Seed for the catalog
+
+    Returns:
+        dict[str, Any]: Run metadata and, per read path, the fastest run in
+            milliseconds, with the speedup of the projected path and whether
+            both paths produced the same output
+    """
+    from app_factory import create_app
+    from models import db
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connection_string = f"sqlite:///{os.path.join(temp_dir, 'benchmark.db')}"
+        seed_catalog(connection_string, game_count, publisher_count, category_count, seed)
+
+        app = create_app(connection_string, {'METRICS_ENABLED': False, 'SLOW_QUERY_THRESHOLD_MS': None})
+        with app.app_context():
+            identical = orm_read() == projected_read()
+            timings = {name: best_time(read, runs) for name, read in READ_PATHS.items()}
+            db.session.remove()
+            db.engine.dispose()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "games": game_count,
+            "publishers": publisher_count,
+            "categories": category_count,
+            "runs": runs,
+            "seed": seed
+        },
+        "read_paths": {name: {"ms": round(seconds * 1000, 3)} for name, seconds in timings.items()},
+        "speedup": round(timings['orm'] / timings['projected'], 2) if timings['projected'] else None,
+        "identical": identical
+    }
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    Args:
+        argv (list[str] | None): Arguments, defaults to sys.argv
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the games read paths of the Tailspin Toys API')
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES, help='Number of seeded games')
+    parser.add_argument('--publishers', type=int, default=DEFAULT_PUBLISHERS, help='Number of seeded publishers')
+    parser.add_argument('--categories', type=int, default=DEFAULT_CATEGORIES, help='Number of seeded categories')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='Timed runs per read path')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the catalog')
+    parser.add_argument('--output', help='Write the results JSON to this file')
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.games, args.publishers, args.categories, args.runs, args.seed)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(output + '\n')
+    print(output)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# Gunicorn settings for serving the API in production.
+# The app is imported once in the master process (preload_app) and shared
+# copy-on-write with forked gthread workers, each running several threads.
+# Workers are recycled after a jittered number of requests, and every worker
+# drops the database connections it inherited from the master right after
+# fork, so no SQLite connection is shared between processes.
+#
+# Start from the server directory with:
+#     gunicorn -c gunicorn.conf.py app:app
+#
+# Settings can be overridden with environment variables:
+#     PORT                    - port to bind (default 5100)
+#     GUNICORN_WORKERS        - worker processes (default 2 x CPU cores + 1)
+#     GUNICORN_THREADS        - threads per worker (default 4). Each open change
+#                               stream (/api/games/changes/stream) holds one for
+#                               up to CHANGE_STREAM_MAX_AGE seconds, so keep the
+#                               app's CHANGE_STREAM_MAX_STREAMS (default 2) below it
+#     GUNICORN_MAX_REQUESTS   - requests before a worker is recycled (default 1000, 0 disables)
+#     GUNICORN_TIMEOUT        - seconds before a silent worker is restarted (default 30)
+import multiprocessing
+import os
+
+# Production engine settings (WAL, busy timeout, connection pool) unless overridden
+os.environ.setdefault('DATABASE_PROFILE', 'production')
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5100')}"
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+
+# Load the app before forking so workers start fast and share memory
+preload_app = True
+
+# Recycle workers gracefully; jitter keeps them from restarting together
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = max(max_requests // 10, 0)
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+
+def post_fork(server, worker):
+    """
+    Drop the pooled connections a worker inherited from the master.
+
+    close=False leaves the master's connections open for the master and only
+    discards the pool in the worker, which then opens its own connections.
+    """
+    from models import db
+    from app import app
+
+    with app.app_context():
+        db.engine.dispose(close=False)
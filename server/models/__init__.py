@@ -1,11 +1,57 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, select, func
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import column_property
 
 db = SQLAlchemy()
 
 # Import models after db is defined to avoid circular imports
+from .catalog_version import CatalogVersion, create_catalog_version_triggers
 from .category import Category
-from .game import Game
+from .game import Game, GAME_FIELDS
 from .publisher import Publisher
+from .game_search import create_game_search_index, games_fts
+from .catalog_facets import create_catalog_facets, catalog_facets
+from .game_changes import create_game_change_log, game_changes
+
+# Game counts are attached once all models are defined so the correlated COUNT
+# subquery can reference Game without a circular import. They are deferred, and
+# to_dict only includes them when loaded, so use undefer(...) to serialize them.
+Category.game_count = column_property(
+    select(func.count(Game.id))
+    .where(Game.category_id == Category.id)
+    .correlate_except(Game)
+    .scalar_subquery(),
+    deferred=True
+)
+Publisher.game_count = column_property(
+    select(func.count(Game.id))
+    .where(Game.publisher_id == Publisher.id)
+    .correlate_except(Game)
+    .scalar_subquery(),
+    deferred=True
+)
+
+def enable_foreign_keys(engine: Engine) -> None:
+    """
+    Enforce foreign keys on every new connection of a SQLite engine.
+    
+    SQLite ignores foreign keys unless each connection opts in, and game
+    writes rely on them to reject unknown publishers and categories.
+    
+    Args:
+        engine (Engine): The engine to configure, before it opens connections
+    """
+    if engine.dialect.name == 'sqlite' and not event.contains(engine, 'connect', _set_foreign_keys_pragma):
+        event.listen(engine, 'connect', _set_foreign_keys_pragma)
+
+def _set_foreign_keys_pragma(dbapi_connection, connection_record):
+    """
+    Turn on foreign key enforcement for a newly opened DBAPI connection.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
 
 def init_db(app, testing: bool = False):
     """Initialize the database
@@ -26,4 +72,16 @@ def init_db(app, testing: bool = False):
     
     # Create tables when initializing
     with app.app_context():
-        db.create_all()
\ No newline at end of file
+        enable_foreign_keys(db.engine)
+        db.create_all()
+        
+        # create_all skips tables that already exist, so add any indexes
+        # declared since an existing database was created
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
+        
+        create_catalog_version_triggers(db.engine)
+        create_game_search_index(db.engine)
+        create_catalog_facets(db.engine)
+        create_game_change_log(db.engine)
\ No newline at end of file
@@ -0,0 +1,158 @@
+from sqlalchemy import table, column
+from sqlalchemy.engine import Engine
+
+# Precomputed per-category and per-publisher game counts and rating stats.
+#
+# catalog_facets is a summary table with one row per category and publisher
+# that has (or had) games. Triggers on games maintain it incrementally:
+# counts and rating sums are adjusted in place, and min/max are only
+# recomputed for the affected group when the removed rating was the current
+# boundary. Reading facets therefore never touches the games table.
+FACETS = {
+    # facet name -> column of games it groups by
+    'category': 'category_id',
+    'publisher': 'publisher_id'
+}
+
+CATALOG_FACETS_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS catalog_facets (
+        facet VARCHAR(20) NOT NULL,
+        ref_id INTEGER NOT NULL,
+        game_count INTEGER NOT NULL DEFAULT 0,
+        rated_count INTEGER NOT NULL DEFAULT 0,
+        rating_sum FLOAT NOT NULL DEFAULT 0,
+        min_rating FLOAT,
+        max_rating FLOAT,
+        PRIMARY KEY (facet, ref_id)
+    )
+"""
+
+def _add_game_sql(facet: str, group_column: str) -> str:
+    """
+    Build the statement that adds the NEW games row to a facet group.
+    
+    Args:
+        facet (str): The facet name, e.g. 'category'
+        group_column (str): The games column the facet groups by
+    
+    Returns:
+        str: SQL statement for use inside a trigger body
+    """
+    return f"""
+        INSERT INTO catalog_facets (facet, ref_id, game_count, rated_count, rating_sum, min_rating, max_rating)
+        VALUES ('{facet}', new.{group_column}, 1, new.star_rating IS NOT NULL,
+                COALESCE(new.star_rating, 0), new.star_rating, new.star_rating)
+        ON CONFLICT (facet, ref_id) DO UPDATE SET
+            game_count = game_count + 1,
+            rated_count = rated_count + excluded.rated_count,
+            rating_sum = rating_sum + excluded.rating_sum,
+            min_rating = CASE
+                WHEN excluded.min_rating IS NULL THEN min_rating
+                WHEN min_rating IS NULL OR excluded.min_rating < min_rating THEN excluded.min_rating
+                ELSE min_rating END,
+            max_rating = CASE
+                WHEN excluded.max_rating IS NULL THEN max_rating
+                WHEN max_rating IS NULL OR excluded.max_rating > max_rating THEN excluded.max_rating
+                ELSE max_rating END;
+    """
+
+def _remove_game_sql(facet: str, group_column: str) -> str:
+    """
+    Build the statement that removes the OLD games row from a facet group.
+    
+    Min and max are recomputed from the group's remaining games only when the
+    removed rating was the current minimum or maximum.
+    
+    Args:
+        facet (str): The facet name, e.g. 'category'
+        group_column (str): The games column the facet groups by
+    
+    Returns:
+        str: SQL statement for use inside a trigger body
+    """
+    return f"""
+        UPDATE catalog_facets SET
+            game_count = game_count - 1,
+            rated_count = rated_count - (old.star_rating IS NOT NULL),
+            rating_sum = rating_sum - COALESCE(old.star_rating, 0),
+            min_rating = CASE
+                WHEN old.star_rating IS NOT NULL AND old.star_rating <= min_rating
+                THEN (SELECT MIN(star_rating) FROM games WHERE {group_column} = old.{group_column})
+                ELSE min_rating END,
+            max_rating = CASE
+                WHEN old.star_rating IS NOT NULL AND old.star_rating >= max_rating
+                THEN (SELECT MAX(star_rating) FROM games WHERE {group_column} = old.{group_column})
+                ELSE max_rating END
+        WHERE facet = '{facet}' AND ref_id = old.{group_column};
+    """
+
+CATALOG_FACETS_TRIGGERS_DDL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS catalog_facets_after_insert AFTER INSERT ON games BEGIN
+        {''.join(_add_game_sql(facet, group_column) for facet, group_column in FACETS.items())}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS catalog_facets_after_delete AFTER DELETE ON games BEGIN
+        {''.join(_remove_game_sql(facet, group_column) for facet, group_column in FACETS.items())}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS catalog_facets_after_update
+    AFTER UPDATE OF star_rating, category_id, publisher_id ON games BEGIN
+        {''.join(_remove_game_sql(facet, group_column) for facet, group_column in FACETS.items())}
+        {''.join(_add_game_sql(facet, group_column) for facet, group_column in FACETS.items())}
+    END
+    """
+]
+
+# Single GROUP BY per facet used to build the summary from scratch
+CATALOG_FACETS_REBUILD_SQL = [
+    "DELETE FROM catalog_facets",
+    *[
+        f"""
+        INSERT INTO catalog_facets (facet, ref_id, game_count, rated_count, rating_sum, min_rating, max_rating)
+        SELECT '{facet}', {group_column}, COUNT(*), COUNT(star_rating), TOTAL(star_rating),
+               MIN(star_rating), MAX(star_rating)
+        FROM games
+        GROUP BY {group_column}
+        """
+        for facet, group_column in FACETS.items()
+    ]
+]
+
+# Lightweight table construct for querying the summary from SQLAlchemy
+catalog_facets = table(
+    'catalog_facets',
+    column('facet'),
+    column('ref_id'),
+    column('game_count'),
+    column('rated_count'),
+    column('rating_sum'),
+    column('min_rating'),
+    column('max_rating')
+)
+
+def create_catalog_facets(engine: Engine) -> None:
+    """
+    Create the facet summary table and its triggers if they do not exist yet.
+    
+    A newly created summary is built from the games table, so existing
+    databases get facets on first start.
+    
+    Args:
+        engine (Engine): The engine of the application database
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+    
+    with engine.begin() as connection:
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'catalog_facets'"
+        ).first()
+        connection.exec_driver_sql(CATALOG_FACETS_TABLE_DDL)
+        for statement in CATALOG_FACETS_TRIGGERS_DDL:
+            connection.exec_driver_sql(statement)
+        if not exists:
+            for statement in CATALOG_FACETS_REBUILD_SQL:
+                connection.exec_driver_sql(statement)
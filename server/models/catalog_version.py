@@ -0,0 +1,61 @@
+from . import db
+from .base import BaseModel
+from sqlalchemy import event, DDL
+from sqlalchemy.engine import Engine
+
+class CatalogVersion(BaseModel):
+    """
+    Single-row table holding a counter that is bumped on every catalog write.
+    
+    Read endpoints derive their ETags from it, so clients can revalidate
+    cached responses without the games being re-queried.
+    """
+    __tablename__ = 'catalog_version'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        """
+        Return a string representation of the CatalogVersion object.
+        
+        Returns:
+            str: String representation showing the current version
+        """
+        return f'<CatalogVersion {self.version}>'
+
+# Seed the single row as soon as the table is created
+event.listen(
+    CatalogVersion.__table__,
+    'after_create',
+    DDL('INSERT INTO catalog_version (id, version) VALUES (1, 0)')
+)
+
+# Publishers and categories are bumped by triggers rather than by their
+# writers, so every process sees the change, whichever writer made it
+REFERENCE_TABLES = ('publishers', 'categories')
+
+CATALOG_VERSION_TRIGGERS_DDL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS catalog_version_after_{operation.lower()}_{table} AFTER {operation} ON {table} BEGIN
+        UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+    END
+    """
+    for table in REFERENCE_TABLES
+    for operation in ('INSERT', 'UPDATE', 'DELETE')
+]
+
+def create_catalog_version_triggers(engine: Engine) -> None:
+    """
+    Create the triggers bumping the catalog version on every publisher and
+    category write, if they do not exist yet.
+    
+    Args:
+        engine (Engine): The engine of the application database
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+    
+    with engine.begin() as connection:
+        for statement in CATALOG_VERSION_TRIGGERS_DDL:
+            connection.exec_driver_sql(statement)
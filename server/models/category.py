@@ -1,5 +1,6 @@
 from . import db
 from .base import BaseModel
+from sqlalchemy import inspect
 from sqlalchemy.orm import validates, relationship
 
 class Category(BaseModel):
@@ -59,12 +60,17 @@ class Category(BaseModel):
         """
         Convert the Category object to a dictionary representation.
         
+        The game count is only included when it was loaded, e.g. with
+        undefer(...), since reading the deferred column costs a query per row.
+        
         Returns:
-            dict: Dictionary containing category data including game count
+            dict: Dictionary containing category data, with the game count if loaded
         """
-        return {
+        data = {
             'id': self.id,
             'name': self.name,
-            'description': self.description,
-            'game_count': len(self.games) if self.games else 0
-        }
\ No newline at end of file
+            'description': self.description
+        }
+        if 'game_count' not in inspect(self).unloaded:
+            data['game_count'] = self.game_count or 0
+        return data
\ No newline at end of file
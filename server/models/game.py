@@ -4,15 +4,22 @@ from sqlalchemy.orm import validates, relationship
 
 class Game(BaseModel):
     __tablename__ = 'games'
+    __table_args__ = (
+        # Serves category filters, and category + publisher filters combined
+        db.Index('ix_games_category_id_publisher_id', 'category_id', 'publisher_id'),
+        # Serve rating-sorted listings within a category or publisher without a sort step
+        db.Index('ix_games_category_id_star_rating', 'category_id', 'star_rating'),
+        db.Index('ix_games_publisher_id_star_rating', 'publisher_id', 'star_rating'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(100), nullable=False)
+    title = db.Column(db.String(100), nullable=False, index=True)
     description = db.Column(db.Text, nullable=False)
-    star_rating = db.Column(db.Float, nullable=True)
+    star_rating = db.Column(db.Float, nullable=True, index=True)
     
     # Foreign keys for one-to-many relationships
     category_id = db.Column(db.Integer, db.ForeignKey('categories.id'), nullable=False)
-    publisher_id = db.Column(db.Integer, db.ForeignKey('publishers.id'), nullable=False)
+    publisher_id = db.Column(db.Integer, db.ForeignKey('publishers.id'), nullable=False, index=True)
     
     # One-to-many relationships (many games belong to one category/publisher)
     category = relationship("Category", back_populates="games")
@@ -77,4 +84,39 @@ class Game(BaseModel):
             'publisher': {'id': self.publisher.id, 'name': self.publisher.name} if self.publisher else None,
             'category': {'id': self.category.id, 'name': self.category.name} if self.category else None,
             'starRating': self.star_rating  # Changed from star_rating to starRating
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def row_to_dict(row, fields=None):
+        """
+        Convert a projected game row to the same dictionary representation as to_dict.
+        
+        Args:
+            row: Row with id, title, description, star_rating, publisher_id,
+                publisher_name, category_id and category_name columns, or
+                only the columns the requested fields need
+            fields: Optional API field names to include, see GAME_FIELDS; defaults to all
+            
+        Returns:
+            dict: Dictionary containing game data including related publisher and category info
+        """
+        if fields is not None:
+            return {field: GAME_FIELDS[field](row) for field in fields}
+        return {
+            'id': row.id,
+            'title': row.title,
+            'description': row.description,
+            'publisher': {'id': row.publisher_id, 'name': row.publisher_name} if row.publisher_id is not None else None,
+            'category': {'id': row.category_id, 'name': row.category_name} if row.category_id is not None else None,
+            'starRating': row.star_rating
+        }
+
+# API field name -> serializer reading it from a projected row, in output order
+GAME_FIELDS = {
+    'id': lambda row: row.id,
+    'title': lambda row: row.title,
+    'description': lambda row: row.description,
+    'publisher': lambda row: {'id': row.publisher_id, 'name': row.publisher_name} if row.publisher_id is not None else None,
+    'category': lambda row: {'id': row.category_id, 'name': row.category_name} if row.category_id is not None else None,
+    'starRating': lambda row: row.star_rating
+}
@@ -0,0 +1,79 @@
+from sqlalchemy import table, column
+from sqlalchemy.engine import Engine
+
+# Append-only log of game creates, updates and deletes.
+#
+# Every change gets a sequence number from an AUTOINCREMENT key, so numbers
+# only ever grow and are never reused, even after rows are removed. Triggers
+# on games write the log in the same transaction as the change, whether it
+# comes from the API, bulk Core statements or the seeder, so clients can sync
+# incrementally by asking for the changes after the last number they saw.
+GAME_CHANGES_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS game_changes (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        game_id INTEGER NOT NULL,
+        op VARCHAR(10) NOT NULL,
+        changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+GAME_CHANGES_TRIGGERS_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS game_changes_after_insert AFTER INSERT ON games BEGIN
+        INSERT INTO game_changes (game_id, op) VALUES (new.id, 'create');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS game_changes_after_update AFTER UPDATE ON games BEGIN
+        INSERT INTO game_changes (game_id, op) VALUES (new.id, 'update');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS game_changes_after_delete AFTER DELETE ON games BEGIN
+        INSERT INTO game_changes (game_id, op) VALUES (old.id, 'delete');
+    END
+    """
+]
+
+# Finds the latest change of each game after a sequence number
+GAME_CHANGES_INDEX_DDL = """
+    CREATE INDEX IF NOT EXISTS ix_game_changes_game_id_seq ON game_changes (game_id, seq)
+"""
+
+# Record the games of an existing database as created, so a sync from 0 sees them
+GAME_CHANGES_BACKFILL_SQL = """
+    INSERT INTO game_changes (game_id, op) SELECT id, 'create' FROM games ORDER BY id
+"""
+
+# Lightweight table construct for querying the log from SQLAlchemy
+game_changes = table(
+    'game_changes',
+    column('seq'),
+    column('game_id'),
+    column('op'),
+    column('changed_at')
+)
+
+def create_game_change_log(engine: Engine) -> None:
+    """
+    Create the change log table and its triggers if they do not exist yet.
+
+    A newly created log is seeded with a create entry for every existing
+    game, so existing databases can be synced from sequence number 0.
+
+    Args:
+        engine (Engine): The engine of the application database
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+
+    with engine.begin() as connection:
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'game_changes'"
+        ).first()
+        connection.exec_driver_sql(GAME_CHANGES_TABLE_DDL)
+        connection.exec_driver_sql(GAME_CHANGES_INDEX_DDL)
+        for statement in GAME_CHANGES_TRIGGERS_DDL:
+            connection.exec_driver_sql(statement)
+        if not exists:
+            connection.exec_driver_sql(GAME_CHANGES_BACKFILL_SQL)
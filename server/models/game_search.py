@@ -0,0 +1,66 @@
+from sqlalchemy import table, column
+from sqlalchemy.engine import Engine
+
+# Full-text index over game titles and descriptions.
+#
+# games_fts is an external-content FTS5 table: it stores only the search
+# index and reads the text from games by rowid. Triggers keep it in sync with
+# every insert, update and delete on games, whether they come from the ORM,
+# bulk Core statements or the seeder.
+GAME_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS games_fts USING fts5(
+        title,
+        description,
+        content='games',
+        content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS games_fts_after_insert AFTER INSERT ON games BEGIN
+        INSERT INTO games_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS games_fts_after_delete AFTER DELETE ON games BEGIN
+        INSERT INTO games_fts(games_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS games_fts_after_update AFTER UPDATE OF title, description ON games BEGIN
+        INSERT INTO games_fts(games_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO games_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """
+]
+
+# Lightweight table construct for querying the index from SQLAlchemy
+games_fts = table('games_fts', column('rowid'), column('title'), column('description'))
+
+def create_game_search_index(engine: Engine) -> None:
+    """
+    Create the full-text index and its triggers if they do not exist yet.
+    
+    A newly created index is rebuilt from the games table, so existing
+    databases are indexed on first start.
+    
+    Args:
+        engine (Engine): The engine of the application database
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+    
+    with engine.begin() as connection:
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'games_fts'"
+        ).first()
+        for statement in GAME_SEARCH_DDL:
+            connection.exec_driver_sql(statement)
+        if not exists:
+            connection.exec_driver_sql("INSERT INTO games_fts(games_fts) VALUES ('rebuild')")
@@ -1,5 +1,6 @@
 from . import db
 from .base import BaseModel
+from sqlalchemy import inspect
 from sqlalchemy.orm import validates, relationship
 
 class Publisher(BaseModel):
@@ -59,12 +60,17 @@ class Publisher(BaseModel):
         """
         Convert the Publisher object to a dictionary representation.
         
+        The game count is only included when it was loaded, e.g. with
+        undefer(...), since reading the deferred column costs a query per row.
+        
         Returns:
-            dict: Dictionary containing publisher data including game count
+            dict: Dictionary containing publisher data, with the game count if loaded
         """
-        return {
+        data = {
             'id': self.id,
             'name': self.name,
-            'description': self.description,
-            'game_count': len(self.games) if self.games else 0
-        }
\ No newline at end of file
+            'description': self.description
+        }
+        if 'game_count' not in inspect(self).unloaded:
+            data['game_count'] = self.game_count or 0
+        return data
\ No newline at end of file
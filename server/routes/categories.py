@@ -0,0 +1,14 @@
+from flask import jsonify, Response, Blueprint, g
+from utils.http_cache import conditional_get
+from utils.reference_cache import get_reference_data
+
+# Create a Blueprint for category routes
+categories_bp = Blueprint('categories', __name__)
+
+@categories_bp.route('/api/categories', methods=['GET'])
+@conditional_get
+def get_categories() -> Response:
+    """Get all categories, served from the reference cache"""
+    categories = get_reference_data(g.catalog_version).categories
+    categories_list = [category.to_dict() for category in categories.values()]
+    return jsonify(categories_list)
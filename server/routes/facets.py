@@ -0,0 +1,84 @@
+from flask import jsonify, Response, Blueprint
+from models import db, Category, Publisher, catalog_facets
+from sqlalchemy import Row, Select, select, and_
+from utils.http_cache import conditional_get
+from utils.response_cache import CacheScope, cached_response
+
+# Create a Blueprint for facet routes
+facets_bp = Blueprint('facets', __name__)
+
+def get_facet_query(model, facet: str) -> Select:
+    """
+    Create a query for one facet, read from the precomputed summary.
+
+    Every row of the model is returned, including those without games. The
+    games table itself is never read.
+
+    Args:
+        model: Category or Publisher
+        facet (str): The facet name in catalog_facets, 'category' or 'publisher'
+
+    Returns:
+        Select: SQLAlchemy Core select of the model's rows with their facet stats
+    """
+    return select(
+        model.id,
+        model.name,
+        catalog_facets.c.game_count,
+        catalog_facets.c.rated_count,
+        catalog_facets.c.rating_sum,
+        catalog_facets.c.min_rating,
+        catalog_facets.c.max_rating
+    ).select_from(model).join(
+        catalog_facets,
+        and_(catalog_facets.c.facet == facet, catalog_facets.c.ref_id == model.id),
+        isouter=True
+    ).order_by(model.name, model.id)
+
+def facet_to_dict(row: Row) -> dict:
+    """
+    Convert a facet row to a dictionary for API responses.
+
+    Args:
+        row (Row): A row produced by get_facet_query
+
+    Returns:
+        dict: The facet's id, name, game count and rating stats
+    """
+    rated_count = row.rated_count or 0
+    return {
+        'id': row.id,
+        'name': row.name,
+        'game_count': row.game_count or 0,
+        'rating': {
+            'min': row.min_rating,
+            'avg': round(row.rating_sum / rated_count, 2) if rated_count else None,
+            'max': row.max_rating
+        }
+    }
+
+def _facets_cache_scope() -> CacheScope:
+    """
+    Build the response cache scope for the facets; any game write affects them.
+
+    Returns:
+        CacheScope: Unfiltered scope for the facets response
+    """
+    return CacheScope(key=('facets',))
+
+@facets_bp.route('/api/facets', methods=['GET'])
+@conditional_get
+@cached_response(_facets_cache_scope)
+def get_facets() -> Response:
+    """
+    Get categories and publishers with game counts and rating stats.
+
+    Returns:
+        Response: JSON with categories and publishers lists
+    """
+    categories = db.session.execute(get_facet_query(Category, 'category'))
+    publishers = db.session.execute(get_facet_query(Publisher, 'publisher'))
+    return jsonify({
+        'categories': [facet_to_dict(row) for row in categories],
+        'publishers': [facet_to_dict(row) for row in publishers]
+    })
@@ -0,0 +1,272 @@
+# Change feed of the games catalog, read from the game_changes log.
+# GET /api/games/changes returns the games changed after a sequence number,
+# one delta per game with its latest operation and current state, so clients
+# and caches can sync incrementally instead of re-fetching the catalog.
+# GET /api/games/changes/stream pushes the same deltas as Server-Sent Events.
+# On the WSGI app every open stream holds a worker thread for its lifetime, so
+# the streams of a worker are capped and the rest get 503 with Retry-After.
+# The async app has no cap, since its streams hold no thread.
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any
+from flask import jsonify, Response, Blueprint, request, current_app, stream_with_context
+from sqlalchemy import Row, Select, and_, exists, select
+from models import db, Game, Publisher, Category, GAME_FIELDS, game_changes
+from routes.games import FIELD_COLUMNS
+from utils.http_cache import conditional_get
+from utils.pagination import parse_limit
+
+SSE_MIMETYPE: str = 'text/event-stream'
+
+# Seconds between polls of the change log while a stream is idle
+DEFAULT_POLL_INTERVAL: float = 1.0
+# Seconds after which a stream is closed; EventSource clients reconnect with Last-Event-ID
+DEFAULT_STREAM_MAX_AGE: float = 300.0
+# Seconds of silence after which a comment is sent to keep proxies from dropping the stream
+HEARTBEAT_INTERVAL: float = 15.0
+# Reconnection delay suggested to EventSource clients, in milliseconds
+SSE_RETRY_MS: int = 3000
+# Changes read from the log per poll
+STREAM_BATCH_SIZE: int = 100
+# Open streams per app (i.e. per worker process); keep it below the worker's
+# threads (GUNICORN_THREADS, default 4) so ordinary requests are still served
+DEFAULT_MAX_STREAMS: int = 2
+
+# Create a Blueprint for the change feed routes
+game_changes_bp = Blueprint('game_changes', __name__)
+
+def parse_since(value: str | None) -> int:
+    """
+    Parse the sequence number a client has synced up to.
+
+    Args:
+        value (str | None): The raw since parameter or Last-Event-ID header, None for 0
+
+    Returns:
+        int: The sequence number
+
+    Raises:
+        ValueError: If the value is not a non-negative integer
+    """
+    if value is None:
+        return 0
+    try:
+        since = int(value)
+    except ValueError:
+        raise ValueError("since must be a non-negative integer")
+    if since < 0:
+        raise ValueError("since must be a non-negative integer")
+    return since
+
+def get_changes_query(since: int) -> Select:
+    """
+    Create a query for the latest change of every game changed after a sequence number.
+
+    Each change is joined with the current state of its game. Changes are
+    read in sequence order from the primary key, skipping any change that a
+    later one to the same game supersedes.
+
+    Args:
+        since (int): The last sequence number the client has seen
+
+    Returns:
+        Select: SQLAlchemy Core select of the changes, oldest first
+    """
+    later = game_changes.alias('later')
+    superseded = exists().where(and_(
+        later.c.game_id == game_changes.c.game_id,
+        later.c.seq > game_changes.c.seq
+    ))
+    game_columns = [column for field in GAME_FIELDS for column in FIELD_COLUMNS[field]]
+    return select(
+        game_changes.c.seq,
+        game_changes.c.op,
+        game_changes.c.changed_at,
+        game_changes.c.game_id.label('change_game_id'),
+        *game_columns
+    ).select_from(game_changes).join(
+        Game,
+        Game.id == game_changes.c.game_id,
+        isouter=True
+    ).join(
+        Publisher,
+        Game.publisher_id == Publisher.id,
+        isouter=True
+    ).join(
+        Category,
+        Game.category_id == Category.id,
+        isouter=True
+    ).where(
+        game_changes.c.seq > since,
+        ~superseded
+    ).order_by(game_changes.c.seq)
+
+def change_to_dict(row: Row) -> dict:
+    """
+    Convert a change row to a dictionary for API responses.
+
+    Args:
+        row (Row): A row produced by get_changes_query
+
+    Returns:
+        dict: The sequence number, operation, game id, UTC change time and the
+            current game, or None for a deleted game
+    """
+    return {
+        'seq': row.seq,
+        'op': row.op,
+        'game_id': row.change_game_id,
+        # SQLite's CURRENT_TIMESTAMP is UTC in 'YYYY-MM-DD HH:MM:SS' format
+        'changed_at': f"{str(row.changed_at).replace(' ', 'T')}Z",
+        'game': Game.row_to_dict(row) if row.id is not None else None
+    }
+
+def changes_body(rows: Sequence[Row], since: int, limit: int) -> dict:
+    """
+    Build the JSON body of a change feed page.
+
+    Args:
+        rows (Sequence[Row]): Up to limit + 1 rows of get_changes_query
+        since (int): The sequence number the page starts after
+        limit (int): The page size
+
+    Returns:
+        dict: {"changes": [...], "next_since": ..., "has_more": ...}
+    """
+    changes = [change_to_dict(row) for row in rows[:limit]]
+    return {
+        "changes": changes,
+        "next_since": changes[-1]['seq'] if changes else since,
+        "has_more": len(rows) > limit
+    }
+
+def format_change_event(change: dict, dumps: Callable[[Any], str]) -> str:
+    """
+    Encode a change as a Server-Sent Event whose id is its sequence number.
+
+    Args:
+        change (dict): A change produced by change_to_dict
+        dumps (Callable[[Any], str]): The JSON encoder of the app
+
+    Returns:
+        str: The event, terminated by a blank line
+    """
+    return f"id: {change['seq']}\nevent: change\ndata: {dumps(change)}\n\n"
+
+@game_changes_bp.route('/api/games/changes', methods=['GET'])
+@conditional_get
+def get_game_changes() -> tuple[Response, int] | Response:
+    """
+    Get the games changed after the since sequence number (default 0).
+
+    Each game appears once, with its latest operation (create, update or
+    delete) and, unless deleted, its current state. Returns
+    {"changes": [...], "next_since": ..., "has_more": ...}; pass next_since
+    back as since to continue. Supports limit (default 20).
+
+    Returns:
+        tuple[Response, int] | Response: JSON response with the changes,
+            or 400 error if since or limit is invalid
+    """
+    try:
+        since = parse_since(request.args.get('since'))
+        limit = parse_limit(request.args.get('limit'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    rows = db.session.execute(get_changes_query(since).limit(limit + 1)).all()
+    return jsonify(changes_body(rows, since, limit))
+
+def _acquire_stream_slot() -> Callable[[], None] | None:
+    """
+    Take one of the app's CHANGE_STREAM_MAX_STREAMS stream slots.
+
+    Returns:
+        Callable[[], None] | None: Releases the slot (safe to call more than
+            once), or None if every slot is taken
+    """
+    extensions = current_app.extensions
+    slots = extensions.get('change_stream_slots')
+    if slots is None:
+        limit = current_app.config.get('CHANGE_STREAM_MAX_STREAMS', DEFAULT_MAX_STREAMS)
+        slots = extensions.setdefault('change_stream_slots', threading.BoundedSemaphore(limit))
+    if not slots.acquire(blocking=False):
+        return None
+
+    released = threading.Event()
+
+    def release() -> None:
+        """Give the slot back the first time it is called."""
+        if not released.is_set():
+            released.set()
+            slots.release()
+
+    return release
+
+@game_changes_bp.route('/api/games/changes/stream', methods=['GET'])
+def stream_game_changes() -> tuple[Response, int] | Response:
+    """
+    Push game changes as Server-Sent Events, starting after the since
+    sequence number, or after the Last-Event-ID of a reconnecting client.
+
+    The change log is polled every CHANGE_STREAM_POLL_INTERVAL seconds
+    (default 1), and the stream is closed after CHANGE_STREAM_MAX_AGE seconds
+    (default 300) so the client reconnects and connections are not held
+    forever. Each stream holds a worker thread, so at most
+    CHANGE_STREAM_MAX_STREAMS (default 2) are open per worker process.
+
+    Returns:
+        tuple[Response, int] | Response: text/event-stream response of change events,
+            400 error if since is invalid, or 503 error with Retry-After if
+            the worker already serves its maximum of streams
+    """
+    try:
+        since = parse_since(request.headers.get('Last-Event-ID', request.args.get('since')))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    config = current_app.config
+    poll_interval = config.get('CHANGE_STREAM_POLL_INTERVAL', DEFAULT_POLL_INTERVAL)
+    max_age = config.get('CHANGE_STREAM_MAX_AGE', DEFAULT_STREAM_MAX_AGE)
+    dumps = current_app.json.dumps
+
+    release = _acquire_stream_slot()
+    if release is None:
+        response = jsonify({"error": "Too many open change streams, retry later"})
+        response.headers['Retry-After'] = str(math.ceil(SSE_RETRY_MS / 1000))
+        return response, 503
+
+    def generate() -> Iterator[str]:
+        """Poll the change log and yield new changes until the stream is too old."""
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        last_seq = since
+        started = last_sent = time.monotonic()
+        while True:
+            rows = db.session.execute(get_changes_query(last_seq).limit(STREAM_BATCH_SIZE)).all()
+            # End the read transaction so the next poll sees newly committed changes
+            db.session.close()
+            for row in rows:
+                change = change_to_dict(row)
+                last_seq = change['seq']
+                yield format_change_event(change, dumps)
+            now = time.monotonic()
+            if rows:
+                last_sent = now
+            if len(rows) == STREAM_BATCH_SIZE:
+                continue
+            if now - started >= max_age:
+                return
+            if now - last_sent >= HEARTBEAT_INTERVAL:
+                yield ": keep-alive\n\n"
+                last_sent = now
+            time.sleep(poll_interval)
+
+    response = Response(stream_with_context(generate()), mimetype=SSE_MIMETYPE)
+    # The server closes the response when the stream ends or the client goes away
+    response.call_on_close(release)
+    response.headers['Cache-Control'] = 'no-cache'
+    # Ask reverse proxies such as nginx not to buffer the events
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
@@ -1,7 +1,58 @@
-from flask import jsonify, Response, Blueprint, request
-from models import db, Game, Publisher, Category
-from sqlalchemy.orm import Query
+import re
+from collections.abc import Collection, Iterator, Sequence
+from types import SimpleNamespace
+from typing import NamedTuple
+from flask import jsonify, Response, Blueprint, request, current_app, stream_with_context
+from models import db, Game, Publisher, Category, GAME_FIELDS, games_fts
+from sqlalchemy import ColumnElement, Row, Select, select, insert, update, func, literal, literal_column, tuple_, and_, or_
+from sqlalchemy.orm import Query, contains_eager
 from sqlalchemy.exc import IntegrityError
+from utils.catalog_version import bump_catalog_version
+from utils.http_cache import conditional_get
+from utils.pagination import encode_cursor, decode_cursor, is_sql_int, parse_limit
+from utils.reference_cache import ReferenceData, apply_game_write, get_reference_data, get_reference_data_after_write
+from utils.response_cache import CacheScope, cached_response, invalidate_games
+from werkzeug.datastructures import MIMEAccept, MultiDict
+
+# Number of rows fetched from the database per batch when streaming
+STREAM_BATCH_SIZE: int = 500
+NDJSON_MIMETYPE: str = 'application/x-ndjson'
+
+# Columns the games listing can be sorted by
+SORT_COLUMNS = {
+    'id': Game.id,
+    'rating': Game.star_rating,
+    'title': Game.title
+}
+
+# API field each sort reads its cursor value from
+SORT_FIELDS = {
+    'id': 'id',
+    'rating': 'starRating',
+    'title': 'title'
+}
+
+# Largest number of games a single lookup by ids may request
+MAX_LOOKUP_IDS: int = 100
+
+# Listing parameters that do not apply to a lookup by ids, which keeps the requested order
+LOOKUP_CONFLICTS: tuple[str, ...] = ('category_id', 'publisher_id', 'sort', 'order', 'top', 'limit', 'cursor', 'stream')
+
+# Fields of a game that PUT /api/games/<id> can change
+UPDATABLE_FIELDS: tuple[str, ...] = ('title', 'description', 'star_rating', 'publisher_id', 'category_id')
+
+# Columns a write returns to serialize the written game, see written_game_to_dict
+WRITTEN_GAME_COLUMNS = (Game.id, Game.title, Game.description, Game.star_rating, Game.publisher_id, Game.category_id)
+
+# Columns selected for each API field of a game, see Game.row_to_dict
+FIELD_COLUMNS = {
+    'id': (Game.id,),
+    'title': (Game.title,),
+    'description': (Game.description,),
+    'publisher': (Publisher.id.label('publisher_id'), Publisher.name.label('publisher_name')),
+    'category': (Category.id.label('category_id'), Category.name.label('category_name')),
+    'starRating': (Game.star_rating,)
+}
 
 # Create a Blueprint for games routes
 games_bp = Blueprint('games', __name__)
@@ -10,6 +61,9 @@ def get_games_base_query() -> Query:
     """
     Create a base SQL query for games with joined publisher and category data.
     
+    The joined rows populate Game.publisher and Game.category, so calling
+    to_dict on the results does not trigger further lazy loads.
+    
     Returns:
         Query: SQLAlchemy query object with Game, Publisher, and Category joined
     """
@@ -21,61 +75,780 @@ def get_games_base_query() -> Query:
         Category, 
         Game.category_id == Category.id, 
         isouter=True
+    ).options(
+        contains_eager(Game.publisher),
+        contains_eager(Game.category)
+    )
+
+def get_games_projection_query(fields: Collection[str] | None = None) -> Select:
+    """
+    Create a column-projected SQL query for reading games.
+    
+    Selects only the columns needed to serialize a game (see Game.row_to_dict)
+    as plain rows, skipping ORM instance construction and relationship loads.
+    With fields, only the columns of those fields and the game id are
+    selected, and publishers and categories are only joined when requested.
+    
+    Args:
+        fields (Collection[str] | None): Optional API field names, see GAME_FIELDS; defaults to all
+        
+    Returns:
+        Select: SQLAlchemy Core select with Game, Publisher, and Category columns joined
+    """
+    if fields is None:
+        fields = GAME_FIELDS
+    columns = [column for field in GAME_FIELDS if field in fields or field == 'id' for column in FIELD_COLUMNS[field]]
+    games_query = select(*columns).select_from(Game)
+    
+    if 'publisher' in fields:
+        games_query = games_query.join(
+            Publisher,
+            Game.publisher_id == Publisher.id,
+            isouter=True
+        )
+    if 'category' in fields:
+        games_query = games_query.join(
+            Category,
+            Game.category_id == Category.id,
+            isouter=True
+        )
+    return games_query
+
+def parse_game_fields(args: MultiDict) -> tuple[str, ...] | None:
+    """
+    Parse the fields query parameter selecting which game fields to return.
+    
+    Args:
+        args (MultiDict): The request query parameters
+        
+    Returns:
+        tuple[str, ...] | None: The requested fields in output order, or None for all fields
+        
+    Raises:
+        ValueError: If fields is empty or names an unknown field
+    """
+    value = args.get('fields')
+    if value is None:
+        return None
+    
+    requested = [field.strip() for field in value.split(',') if field.strip()]
+    valid = ', '.join(GAME_FIELDS)
+    if not requested:
+        raise ValueError(f"fields must be a comma-separated list of: {valid}")
+    unknown = [field for field in requested if field not in GAME_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. fields must be a comma-separated list of: {valid}")
+    return tuple(field for field in GAME_FIELDS if field in requested)
+
+def parse_game_ids(values: str | Sequence) -> tuple[int, ...]:
+    """
+    Validate the game ids of a lookup, dropping repeated ids.
+    
+    Args:
+        values (str | Sequence): The comma-separated ids query parameter, or the JSON ids list
+        
+    Returns:
+        tuple[int, ...]: The distinct ids in requested order
+        
+    Raises:
+        ValueError: If there are no ids, too many, or one is not a positive integer
+    """
+    if isinstance(values, str):
+        values = [value for value in values.split(',') if value.strip()]
+    if not values:
+        raise ValueError("ids must list at least one game id")
+    
+    # A dict keeps the first occurrence of each id in order
+    ids = {}
+    for value in values:
+        if isinstance(value, str) and value.strip().isdecimal():
+            value = int(value)
+        if not is_sql_int(value) or value < 1:
+            raise ValueError("ids must be positive integers")
+        ids[value] = None
+    
+    if len(ids) > MAX_LOOKUP_IDS:
+        raise ValueError(f"ids must list at most {MAX_LOOKUP_IDS} games")
+    return tuple(ids)
+
+def get_games_lookup_query(ids: Collection[int], fields: Collection[str] | None = None) -> Select:
+    """
+    Create a query reading the games with the given ids in a single IN query.
+    
+    Args:
+        ids (Collection[int]): The ids of the games to read
+        fields (Collection[str] | None): Optional API field names, see GAME_FIELDS; defaults to all
+        
+    Returns:
+        Select: The projected games query filtered to those ids
+    """
+    return get_games_projection_query(fields).where(Game.id.in_(ids))
+
+def games_lookup_body(rows: Sequence[Row], ids: Sequence[int], fields: tuple[str, ...] | None = None) -> dict:
+    """
+    Build the JSON body of a lookup by ids, in requested order.
+    
+    Args:
+        rows (Sequence[Row]): The rows returned by get_games_lookup_query
+        ids (Sequence[int]): The requested ids, in order
+        fields (tuple[str, ...] | None): API fields to include, None for all
+        
+    Returns:
+        dict: {"games": [...], "missing": [...]}, missing listing the ids that do not exist
+    """
+    rows_by_id = {row.id: row for row in rows}
+    return {
+        "games": [Game.row_to_dict(rows_by_id[id], fields) for id in ids if id in rows_by_id],
+        "missing": [id for id in ids if id not in rows_by_id]
+    }
+
+def _games_cache_scope() -> CacheScope | None:
+    """
+    Build the response cache scope for a games listing request.
+    
+    Returns:
+        CacheScope | None: Scope keyed on the query parameters, or None for streamed responses
+    """
+    if _wants_ndjson() or request.args.get('stream') in ('1', 'true'):
+        return None
+    key = (request.path, tuple(sorted(request.args.items(multi=True))))
+    if 'ids' in request.args:
+        try:
+            ids = parse_game_ids(request.args['ids'])
+        except ValueError:
+            # Rejected with 400, which is never cached
+            return CacheScope(key=key)
+        # Only writes to the requested games, including creating a missing one, change the lookup
+        return CacheScope(key=key, game_ids=frozenset(ids))
+    return _filtered_cache_scope(key)
+
+def _search_cache_scope() -> CacheScope:
+    """
+    Build the response cache scope for a games search request.
+    
+    Search ignores ids, so unlike a listing it is never scoped to the
+    requested games: a write to any game may change the results.
+    
+    Returns:
+        CacheScope: Scope keyed on the query parameters
+    """
+    return _filtered_cache_scope((request.path, tuple(sorted(request.args.items(multi=True)))))
+
+def _filtered_cache_scope(key: tuple) -> CacheScope:
+    """
+    Build a response cache scope narrowed by the category_id and publisher_id filters.
+    
+    Args:
+        key (tuple): The cache key of the request
+        
+    Returns:
+        CacheScope: Scope covering the filtered category or publisher, or every game
+    """
+    return CacheScope(
+        key=key,
+        category_id=request.args.get('category_id', type=int),
+        publisher_id=request.args.get('publisher_id', type=int)
     )
 
+def _game_cache_scope(id: int) -> CacheScope:
+    """
+    Build the response cache scope for a single game request.
+    
+    Args:
+        id (int): The unique identifier of the game
+        
+    Returns:
+        CacheScope: Scope covering only that game
+    """
+    return CacheScope(key=('game', id, request.args.get('fields')), game_id=id)
+
 @games_bp.route('/api/games', methods=['GET'])
-def get_games() -> Response:
+@conditional_get
+@cached_response(_games_cache_scope)
+def get_games() -> tuple[Response, int] | Response:
     """
     Get all games with their publisher and category information.
     Supports filtering by category_id and publisher_id through query parameters.
     
+    Games are ordered by the sort query parameter (id, rating or title) in the
+    direction given by order (asc or desc), with ties broken by id in the same
+    direction. Unrated games sort before every rating, as NULLs do in SQLite.
+    
+    Supplying top returns only the first top games. Supplying a limit and/or
+    cursor switches to keyset pagination: games are returned as
+    {"games": [...], "next_cursor": ...}, and the next_cursor value is passed
+    back as cursor, with the same sort and order, to fetch the following page.
+    
+    The full list can be streamed instead of built in memory, either as
+    newline-delimited JSON (Accept: application/x-ndjson) or as a JSON
+    array (?stream=1).
+    
+    A fields query parameter, e.g. fields=id,title,starRating, limits each
+    game to those fields; columns and joins of other fields are not queried.
+    
+    An ids query parameter, e.g. ids=3,1,2, looks up those games with a
+    single IN query instead, returning {"games": [...], "missing": [...]}
+    with the games in requested order and the ids that do not exist.
+    
     Returns:
-        Response: JSON response containing a list of all games with their details
+        tuple[Response, int] | Response: JSON response containing the games with their details,
+            or 400 error if the sort, fields, ids or pagination parameters are invalid
     """
-    # Use the base query for all games
+    try:
+        listing = parse_games_listing(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     
+    # Without pagination parameters, the full list can be streamed
+    if listing.mode == 'full':
+        if _wants_ndjson():
+            return _stream_games(listing.query, ndjson=True, fields=listing.fields)
+        if request.args.get('stream') in ('1', 'true'):
+            return _stream_games(listing.query, ndjson=False, fields=listing.fields)
     
-    # Start with base query
-    games_query = get_games_base_query()
+    return jsonify(games_listing_body(db.session.execute(listing.query).all(), listing))
+
+class GamesListing(NamedTuple):
+    """A parsed games listing request, shared by the sync and async APIs."""
+    query: Select
+    # 'full' for the whole list, 'top' for the first top games, 'page' for keyset pagination,
+    # 'ids' for a lookup of specific games
+    mode: str
+    sort: str
+    descending: bool
+    # Page size, only set in 'page' mode
+    limit: int | None = None
+    # Requested API fields, None for all
+    fields: tuple[str, ...] | None = None
+    # Requested game ids in order, only set in 'ids' mode
+    ids: tuple[int, ...] | None = None
+
+def parse_games_listing(args: MultiDict) -> GamesListing:
+    """
+    Parse the query parameters of a games listing into the query to run.
     
+    Args:
+        args (MultiDict): The request query parameters
+        
+    Returns:
+        GamesListing: The filtered, ordered and limited query with its mode
+        
+    Raises:
+        ValueError: If the sort, fields, ids, top or pagination parameters are invalid
+    """
+    sort, descending = _parse_game_sort(args)
+    fields = parse_game_fields(args)
+    
+    # Lookup of specific games by id, in the order requested
+    if 'ids' in args:
+        conflicts = [name for name in LOOKUP_CONFLICTS if name in args]
+        if conflicts:
+            raise ValueError(f"ids cannot be combined with {', '.join(conflicts)}")
+        ids = parse_game_ids(args['ids'])
+        return GamesListing(get_games_lookup_query(ids, fields), 'ids', sort, descending, fields=fields, ids=ids)
+    
+    # Start with the projected query, ordered by the requested sort key; the
+    # sort column is selected for the cursor even when it is not returned
+    columns = None if fields is None else (*fields, SORT_FIELDS[sort])
+    games_query = _apply_game_filters(_apply_game_sort(get_games_projection_query(columns), sort, descending), args)
+    
+    cursor = args.get('cursor')
+    paginated = cursor is not None or 'limit' in args
+    
+    # Top-N: let the database stop after the first rows in sort order
+    if 'top' in args:
+        if paginated:
+            raise ValueError("top cannot be combined with limit or cursor")
+        top = parse_limit(args.get('top'), name='top')
+        return GamesListing(games_query.limit(top), 'top', sort, descending, fields=fields)
+    
+    if not paginated:
+        return GamesListing(games_query, 'full', sort, descending, fields=fields)
+    
+    limit = parse_limit(args.get('limit'))
+    
+    # Seek past the last game of the previous page so deep pages cost the same as the first
+    if cursor is not None:
+        after = _decode_game_cursor(cursor, sort, descending)
+        games_query = games_query.filter(_after_sort_key(sort, descending, after))
+    
+    # Fetch one extra row to know whether another page exists
+    return GamesListing(games_query.limit(limit + 1), 'page', sort, descending, limit, fields)
+
+def games_listing_body(rows: Sequence[Row], listing: GamesListing) -> list[dict] | dict:
+    """
+    Build the JSON body of a games listing from the rows its query returned.
+    
+    Args:
+        rows (Sequence[Row]): The rows returned by listing.query
+        listing (GamesListing): The parsed listing request
+        
+    Returns:
+        list[dict] | dict: The list of games, for a page {"games": [...], "next_cursor": ...},
+            or for a lookup {"games": [...], "missing": [...]}
+    """
+    if listing.mode == 'ids':
+        return games_lookup_body(rows, listing.ids, listing.fields)
+    if listing.mode != 'page':
+        return [Game.row_to_dict(row, listing.fields) for row in rows]
+    
+    limit = listing.limit
+    next_cursor = (
+        encode_cursor(_game_cursor_key(rows[limit - 1], listing.sort, listing.descending))
+        if len(rows) > limit else None
+    )
+    return {
+        "games": [Game.row_to_dict(row, listing.fields) for row in rows[:limit]],
+        "next_cursor": next_cursor
+    }
+
+def _apply_game_filters(games_query: Select, args: MultiDict) -> Select:
+    """
+    Apply the category_id and publisher_id query parameter filters to a games query.
+    
+    Args:
+        games_query (Select): The games query to filter
+        args (MultiDict): The request query parameters
+        
+    Returns:
+        Select: The filtered query
+    """
     # Apply category filter if provided
-    category_id = request.args.get('category_id', type=int)
+    category_id = args.get('category_id', type=int)
     if category_id is not None:
         games_query = games_query.filter(Game.category_id == category_id)
     
     # Apply publisher filter if provided
-    publisher_id = request.args.get('publisher_id', type=int)
+    publisher_id = args.get('publisher_id', type=int)
     if publisher_id is not None:
         games_query = games_query.filter(Game.publisher_id == publisher_id)
     
-    # Execute query and convert results
-    games_list = [game.to_dict() for game in games_query.all()]
+    return games_query
+
+def _wants_ndjson() -> bool:
+    """
+    Check whether the client prefers newline-delimited JSON over a JSON array.
+    
+    Returns:
+        bool: True if application/x-ndjson is the best match for the Accept header
+    """
+    return prefers_ndjson(request.accept_mimetypes)
+
+def prefers_ndjson(accept_mimetypes: MIMEAccept) -> bool:
+    """
+    Check whether an Accept header prefers newline-delimited JSON over a JSON array.
+    
+    Args:
+        accept_mimetypes (MIMEAccept): The parsed Accept header of the request
+        
+    Returns:
+        bool: True if application/x-ndjson is the best match
+    """
+    best = accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+def _stream_games(games_query: Select, ndjson: bool, fields: tuple[str, ...] | None = None) -> Response:
+    """
+    Stream games to the client as they are read from the database.
+    
+    Rows are fetched in batches with yield_per and each game is encoded and
+    written on its own, so peak memory does not grow with the catalog size.
+    
+    Args:
+        games_query (Select): The filtered projected games query to stream
+        ndjson (bool): True for newline-delimited JSON, False for a JSON array
+        fields (tuple[str, ...] | None): API fields to include, None for all
+        
+    Returns:
+        Response: Streaming response with the encoded games
+    """
+    def generate() -> Iterator[str]:
+        """Yield the encoded games one at a time."""
+        dumps = current_app.json.dumps
+        rows = db.session.execute(games_query.execution_options(yield_per=STREAM_BATCH_SIZE))
+        if ndjson:
+            for row in rows:
+                yield dumps(Game.row_to_dict(row, fields)) + '\n'
+            return
+        
+        yield '['
+        separator = ''
+        for row in rows:
+            yield separator + dumps(Game.row_to_dict(row, fields))
+            separator = ','
+        yield ']\n'
+    
+    mimetype = NDJSON_MIMETYPE if ndjson else 'application/json'
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
+def _parse_game_sort(args: MultiDict) -> tuple[str, bool]:
+    """
+    Parse the sort and order query parameters of a games listing.
+    
+    Args:
+        args (MultiDict): The request query parameters
+        
+    Returns:
+        tuple[str, bool]: The sort name and whether the order is descending
+        
+    Raises:
+        ValueError: If the sort or order is not supported
+    """
+    sort = args.get('sort', 'id')
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f"sort must be one of: {', '.join(SORT_COLUMNS)}")
+    
+    order = args.get('order', 'asc')
+    if order not in ('asc', 'desc'):
+        raise ValueError("order must be asc or desc")
+    
+    return sort, order == 'desc'
+
+def _apply_game_sort(games_query: Select, sort: str, descending: bool) -> Select:
+    """
+    Order a games query by a sort key, breaking ties by id in the same direction.
+    
+    Using one direction for both columns lets SQLite walk an index on the sort
+    column (which ends in the rowid) forwards or backwards instead of sorting.
+    
+    Args:
+        games_query (Select): The games query to order
+        sort (str): The sort name, a key of SORT_COLUMNS
+        descending (bool): True to sort in descending order
+        
+    Returns:
+        Select: The ordered query
+    """
+    columns = [SORT_COLUMNS[sort]] if sort == 'id' else [SORT_COLUMNS[sort], Game.id]
+    return games_query.order_by(*(c.desc() if descending else c.asc() for c in columns))
+
+def _game_cursor_key(row: Row, sort: str, descending: bool) -> list:
+    """
+    Build the cursor key of the last game on a page.
+    
+    The default id order keeps the plain [id] key. Other orders record the
+    sort and direction too, so a cursor cannot be replayed against another
+    order.
+    
+    Args:
+        row (Row): A projected game row
+        sort (str): The sort name, a key of SORT_COLUMNS
+        descending (bool): True if the order is descending
+        
+    Returns:
+        list: The sort key to encode into the cursor
+    """
+    if sort == 'id' and not descending:
+        return [row.id]
+    value = row.id if sort == 'id' else getattr(row, SORT_COLUMNS[sort].key)
+    return [sort, 'desc' if descending else 'asc', value, row.id]
+
+def _decode_game_cursor(cursor: str, sort: str, descending: bool) -> tuple:
+    """
+    Decode a games listing cursor into the sort key of the last game already returned.
+    
+    Args:
+        cursor (str): The cursor string supplied by the client
+        sort (str): The sort name of the current request
+        descending (bool): True if the current request sorts in descending order
+        
+    Returns:
+        tuple: The (sort value, id) to continue after
+        
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another order
+    """
+    key = decode_cursor(cursor)
+    if sort == 'id' and not descending:
+        if len(key) != 1 or not _is_cursor_int(key[0]):
+            raise ValueError("Invalid cursor")
+        return key[0], key[0]
+    
+    if len(key) != 4 or key[:2] != [sort, 'desc' if descending else 'asc'] or not _is_cursor_int(key[3]):
+        raise ValueError("Invalid cursor")
+    value = key[2]
+    valid = {
+        'id': _is_cursor_int(value),
+        'rating': value is None or isinstance(value, float) or is_sql_int(value),
+        'title': isinstance(value, str)
+    }[sort]
+    if not valid:
+        raise ValueError("Invalid cursor")
+    return value, key[3]
+
+def _is_cursor_int(value) -> bool:
+    """
+    Check whether a decoded cursor value is an integer id.
+    
+    Args:
+        value: The decoded JSON value
+        
+    Returns:
+        bool: True for ints other than booleans that SQLite can bind
+    """
+    return is_sql_int(value)
+
+def _after_sort_key(sort: str, descending: bool, after: tuple) -> ColumnElement[bool]:
+    """
+    Build the keyset condition selecting games that come after a sort key.
+    
+    star_rating is nullable and NULL sorts lowest, so unrated games come first
+    in ascending order and last in descending order.
+    
+    Args:
+        sort (str): The sort name, a key of SORT_COLUMNS
+        descending (bool): True if the order is descending
+        after (tuple): The (sort value, id) of the last game already returned
+        
+    Returns:
+        ColumnElement[bool]: The SQL condition
+    """
+    value, last_id = after
+    if sort == 'id':
+        return Game.id < last_id if descending else Game.id > last_id
+    
+    column = SORT_COLUMNS[sort]
+    if value is None:
+        # Only reachable for ratings: continue within the unrated games
+        if descending:
+            return and_(column.is_(None), Game.id < last_id)
+        return or_(column.is_not(None), and_(column.is_(None), Game.id > last_id))
+    
+    if descending:
+        after_value = tuple_(column, Game.id) < tuple_(literal(value), literal(last_id))
+        return or_(after_value, column.is_(None)) if sort == 'rating' else after_value
+    return tuple_(column, Game.id) > tuple_(literal(value), literal(last_id))
+
+def get_games_search_query(match: str) -> Select:
+    """
+    Create a projected games query ranked by full-text relevance.
+    
+    Args:
+        match (str): An FTS5 match expression, see _to_fts_query
+        
+    Returns:
+        Select: Projected games query limited to matches, best matches first
+    """
+    fts = literal_column('games_fts')
+    # Title matches weigh more than description matches
+    rank = func.bm25(fts, 10.0, 1.0)
+    return get_games_projection_query().join(
+        games_fts,
+        games_fts.c.rowid == Game.id
+    ).where(
+        fts.op('MATCH')(match)
+    ).order_by(rank, Game.id)
+
+def _to_fts_query(text: str) -> str:
+    """
+    Turn free text from the client into a safe FTS5 prefix query.
+    
+    Each word becomes a quoted prefix term, so FTS5 syntax characters in the
+    input are never interpreted and "pipe dev" matches "Pipeline DevOps".
+    
+    Args:
+        text (str): The search text supplied by the client
+        
+    Returns:
+        str: The FTS5 match expression, matching games that contain every word
+        
+    Raises:
+        ValueError: If the text contains no words
+    """
+    words = re.findall(r'\w+', text)
+    if not words:
+        raise ValueError("Search query must contain at least one word")
+    return ' '.join(f'"{word}"*' for word in words)
+
+@games_bp.route('/api/games/search', methods=['GET'])
+@conditional_get
+@cached_response(_search_cache_scope)
+def search_games() -> tuple[Response, int] | Response:
+    """
+    Search games by title and description, best matches first.
+    
+    Requires a q query parameter. Each word is matched as a prefix and all
+    words must match. Supports the same category_id and publisher_id filters
+    as the listing, and a limit (default 20).
+    
+    Returns:
+        tuple[Response, int] | Response: JSON response with the matching games,
+            or 400 error if the query or limit is invalid
+    """
+    try:
+        games_query = parse_games_search(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    games_list = [Game.row_to_dict(row) for row in db.session.execute(games_query)]
     
     return jsonify(games_list)
 
+def parse_games_search(args: MultiDict) -> Select:
+    """
+    Parse the query parameters of a games search into the query to run.
+    
+    Args:
+        args (MultiDict): The request query parameters
+        
+    Returns:
+        Select: The filtered, ranked and limited search query
+        
+    Raises:
+        ValueError: If the search text or limit is invalid
+    """
+    match = _to_fts_query(args.get('q', ''))
+    limit = parse_limit(args.get('limit'))
+    return _apply_game_filters(get_games_search_query(match), args).limit(limit)
+
 @games_bp.route('/api/games/<int:id>', methods=['GET'])
+@conditional_get
+@cached_response(_game_cache_scope)
 def get_game(id: int) -> tuple[Response, int] | Response:
     """
     Get a specific game by its ID with publisher and category information.
     
+    A fields query parameter, e.g. fields=id,title,starRating, limits the
+    game to those fields.
+    
     Args:
         id (int): The unique identifier of the game
         
     Returns:
-        tuple[Response, int] | Response: JSON response with game data, or 404 error if not found
+        tuple[Response, int] | Response: JSON response with game data, 404 error if not found,
+            or 400 error if fields is invalid
     """
-    # Use the base query and add filter for specific game
-    game_query = get_games_base_query().filter(Game.id == id).first()
+    try:
+        fields = parse_game_fields(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    # Use the projected query and add filter for specific game
+    game_row = db.session.execute(
+        get_games_projection_query(fields).filter(Game.id == id)
+    ).first()
     
     # Return 404 if game not found
-    if not game_query: 
+    if not game_row: 
         return jsonify({"error": "Game not found"}), 404
     
-    # Convert the result using the model's to_dict method
-    game = game_query.to_dict()
+    # Convert the result using the model's row_to_dict method
+    game = Game.row_to_dict(game_row, fields)
     
     return jsonify(game)
 
+@games_bp.route('/api/games/lookup', methods=['POST'])
+def lookup_games() -> tuple[Response, int] | Response:
+    """
+    Look up games by id with a single IN query, for id lists too long for
+    the ids query parameter of GET /api/games.
+    
+    The body is {"ids": [...]}, and a fields query parameter limits the
+    games to those fields.
+    
+    Returns:
+        tuple[Response, int] | Response: {"games": [...], "missing": [...]} with the games
+            in requested order, or 400 error if the body or fields is invalid
+    """
+    try:
+        fields = parse_game_fields(request.args)
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or not isinstance(data.get('ids'), list):
+            raise ValueError("Request body must contain an 'ids' list")
+        ids = parse_game_ids(data['ids'])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    rows = db.session.execute(get_games_lookup_query(ids, fields)).all()
+    return jsonify(games_lookup_body(rows, ids, fields))
+
+def _validate_game_values(values: dict) -> None:
+    """
+    Run the Game model validators over column values without loading or adding a game.
+    
+    Args:
+        values (dict): Column values of a game write
+        
+    Raises:
+        ValueError: If a value is rejected by a validator
+    """
+    Game(**values)
+
+def written_game_to_dict(row: Row, reference: ReferenceData) -> dict:
+    """
+    Serialize a game returned by a write, naming its publisher and category
+    from the reference cache instead of joining them again.
+    
+    Args:
+        row (Row): The WRITTEN_GAME_COLUMNS returned by the write
+        reference (ReferenceData): Publisher and category names at the write's catalog version
+        
+    Returns:
+        dict: The game in the same representation as Game.to_dict
+    """
+    publisher = reference.publishers.get(row.publisher_id)
+    category = reference.categories.get(row.category_id)
+    # RETURNING gives back the value as bound, before SQLite stores an integer
+    # rating as REAL, so 4 is turned into the 4.0 a later read returns
+    star_rating = float(row.star_rating) if row.star_rating is not None else None
+    return Game.row_to_dict(SimpleNamespace(
+        **{**row._mapping, 'star_rating': star_rating},
+        publisher_name=publisher.name if publisher else None,
+        category_name=category.name if category else None
+    ))
+
+def _reference_id(value):
+    """
+    Normalize a publisher or category id from a request body the way SQLite
+    stores it in an INTEGER column, so "1" refers to publisher 1.
+    
+    Args:
+        value: The id supplied by the client
+        
+    Returns:
+        The id as stored
+    """
+    if isinstance(value, str) and value.strip().isdecimal():
+        return int(value)
+    return value
+
+def _reference_error(data: dict) -> str:
+    """
+    Explain an integrity error of a game write, which foreign keys raise
+    without naming the reference that does not exist.
+    
+    Args:
+        data (dict): The request body of the write
+        
+    Returns:
+        str: "Publisher not found", "Category not found" or a generic integrity error message
+    """
+    reference = get_reference_data()
+    try:
+        if 'publisher_id' in data and _reference_id(data['publisher_id']) not in reference.publishers:
+            return "Publisher not found"
+        if 'category_id' in data and _reference_id(data['category_id']) not in reference.categories:
+            return "Category not found"
+    except TypeError:
+        # Unhashable ids, such as lists, match no row
+        pass
+    return "Database integrity error"
+
+def _update_rejected(id: int, message: str) -> tuple[Response, int]:
+    """
+    Reject an invalid update, reporting a game that does not exist first.
+    
+    Args:
+        id (int): The unique identifier of the game
+        message (str): The error to report for an existing game
+        
+    Returns:
+        tuple[Response, int]: 404 if the game does not exist, otherwise 400 with the message
+    """
+    if db.session.execute(select(Game.id).where(Game.id == id)).first() is None:
+        return jsonify({"error": "Game not found"}), 404
+    return jsonify({"error": message}), 400
+
 @games_bp.route('/api/games', methods=['POST'])
 def create_game() -> tuple[Response, int]:
     try:
@@ -95,39 +868,33 @@ def create_game() -> tuple[Response, int]:
             if field not in data:
                 return jsonify({"error": f"Missing required field: {field}"}), 400
         
-        # Validate publisher exists
-        publisher = db.session.query(Publisher).filter(Publisher.id == data['publisher_id']).first()
-        if not publisher:
-            return jsonify({"error": "Publisher not found"}), 400
-        
-        # Validate category exists
-        category = db.session.query(Category).filter(Category.id == data['category_id']).first()
-        if not category:
-            return jsonify({"error": "Category not found"}), 400
-        
-        # Create new game
-        new_game = Game(
-            title=data['title'],
-            description=data['description'],
-            category_id=data['category_id'],
-            publisher_id=data['publisher_id'],
-            star_rating=data.get('star_rating')  # Optional field
-        )
+        # Validate the new game
+        values = {
+            'title': data['title'],
+            'description': data['description'],
+            'category_id': data['category_id'],
+            'publisher_id': data['publisher_id'],
+            'star_rating': data.get('star_rating')  # Optional field
+        }
+        _validate_game_values(values)
         
-        # Add to database
-        db.session.add(new_game)
+        # Insert it in one statement; foreign keys reject unknown publishers and categories
+        row = db.session.execute(
+            insert(Game).values(**values).returning(*WRITTEN_GAME_COLUMNS)
+        ).one()
+        version = bump_catalog_version()
         db.session.commit()
+        invalidate_games(version, [row.id], [row.category_id], [row.publisher_id])
         
         # Return the created game with full details
-        created_game = get_games_base_query().filter(Game.id == new_game.id).first()
-        return jsonify(created_game.to_dict()), 201
+        return jsonify(written_game_to_dict(row, get_reference_data_after_write(version))), 201
         
     except ValueError as e:
         db.session.rollback()
         return jsonify({"error": str(e)}), 400
     except IntegrityError as e:
         db.session.rollback()
-        return jsonify({"error": "Database integrity error"}), 400
+        return jsonify({"error": _reference_error(data)}), 400
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": "Internal server error"}), 500
@@ -135,58 +902,67 @@ def create_game() -> tuple[Response, int]:
 @games_bp.route('/api/games/<int:id>', methods=['PUT'])
 def update_game(id: int) -> tuple[Response, int] | Response:
     try:
-        # Find the game to update
-        game = db.session.query(Game).filter(Game.id == id).first()
-        if not game:
-            return jsonify({"error": "Game not found"}), 404
-        
         # Get JSON data from request
         try:
             data = request.get_json()
         except Exception:
-            return jsonify({"error": "No JSON data provided"}), 400
+            return _update_rejected(id, "No JSON data provided")
         
         # Validate JSON data exists
         if data is None:
-            return jsonify({"error": "No JSON data provided"}), 400
+            return _update_rejected(id, "No JSON data provided")
         
-        # Update fields if provided
-        if 'title' in data:
-            game.title = data['title']
-        
-        if 'description' in data:
-            game.description = data['description']
+        # Validate the fields provided
+        values = {field: data[field] for field in UPDATABLE_FIELDS if field in data}
+        try:
+            _validate_game_values(values)
+        except ValueError as e:
+            return _update_rejected(id, str(e))
         
-        if 'star_rating' in data:
-            game.star_rating = data['star_rating']
+        # Nothing to change, so return the game as it is
+        if not values:
+            game_row = db.session.execute(get_games_projection_query().filter(Game.id == id)).first()
+            if not game_row:
+                return jsonify({"error": "Game not found"}), 404
+            return jsonify(Game.row_to_dict(game_row))
         
-        if 'publisher_id' in data:
-            # Validate publisher exists
-            publisher = db.session.query(Publisher).filter(Publisher.id == data['publisher_id']).first()
-            if not publisher:
-                return jsonify({"error": "Publisher not found"}), 400
-            game.publisher_id = data['publisher_id']
+        # Remember where a moved game was listed so cached listings can be invalidated
+        old = None
+        if 'category_id' in values or 'publisher_id' in values:
+            old = db.session.execute(
+                select(Game.category_id, Game.publisher_id).where(Game.id == id)
+            ).first()
+            if not old:
+                return jsonify({"error": "Game not found"}), 404
         
-        if 'category_id' in data:
-            # Validate category exists
-            category = db.session.query(Category).filter(Category.id == data['category_id']).first()
-            if not category:
-                return jsonify({"error": "Category not found"}), 400
-            game.category_id = data['category_id']
+        # Update the game in one statement; foreign keys reject unknown publishers and categories
+        row = db.session.execute(
+            update(Game).where(Game.id == id).values(**values).returning(*WRITTEN_GAME_COLUMNS),
+            execution_options={'synchronize_session': False}
+        ).first()
+        if not row:
+            db.session.rollback()
+            return jsonify({"error": "Game not found"}), 404
         
         # Commit changes
+        version = bump_catalog_version()
         db.session.commit()
+        old = old or row
+        invalidate_games(
+            version, [id],
+            [old.category_id, row.category_id],
+            [old.publisher_id, row.publisher_id]
+        )
         
         # Return the updated game with full details
-        updated_game = get_games_base_query().filter(Game.id == id).first()
-        return jsonify(updated_game.to_dict())
+        return jsonify(written_game_to_dict(row, get_reference_data_after_write(version)))
         
     except ValueError as e:
         db.session.rollback()
         return jsonify({"error": str(e)}), 400
     except IntegrityError as e:
         db.session.rollback()
-        return jsonify({"error": "Database integrity error"}), 400
+        return _update_rejected(id, _reference_error(data))
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": "Internal server error"}), 500
@@ -200,8 +976,12 @@ def delete_game(id: int) -> tuple[Response, int]:
             return jsonify({"error": "Game not found"}), 404
         
         # Delete the game
+        category_id, publisher_id = game.category_id, game.publisher_id
         db.session.delete(game)
+        version = bump_catalog_version()
         db.session.commit()
+        invalidate_games(version, [id], [category_id], [publisher_id])
+        apply_game_write(version)
         
         return jsonify({"message": "Game deleted successfully"}), 200
         
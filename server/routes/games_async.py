@@ -0,0 +1,419 @@
+# Games routes of the ASGI variant of the API (see create_async_app).
+# Same paths, parameters, validation and JSON contracts as routes/games.py,
+# sharing its query builders, but every statement is awaited on an asyncio
+# engine so one process serves many slow clients without a thread each.
+# The ASGI variant has no response cache, ETags or metrics.
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from quart import Blueprint, Response, current_app, jsonify, request
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import Game, Publisher, Category
+from routes.games import (
+    NDJSON_MIMETYPE, STREAM_BATCH_SIZE, get_games_lookup_query, get_games_projection_query,
+    games_listing_body, games_lookup_body, parse_game_fields, parse_game_ids, parse_games_listing,
+    parse_games_search, prefers_ndjson
+)
+from routes.game_changes import (
+    DEFAULT_POLL_INTERVAL, DEFAULT_STREAM_MAX_AGE, HEARTBEAT_INTERVAL, SSE_MIMETYPE, SSE_RETRY_MS,
+    STREAM_BATCH_SIZE as CHANGE_STREAM_BATCH_SIZE, change_to_dict, changes_body, format_change_event,
+    get_changes_query, parse_since
+)
+from utils.catalog_version import bump_catalog_version_async
+from utils.pagination import parse_limit
+
+# Create a Blueprint for the async games routes
+games_async_bp = Blueprint('games_async', __name__)
+
+def _session() -> AsyncSession:
+    """
+    Returns:
+        AsyncSession: A new session on the app's async engine, to be used as an async context manager
+    """
+    return current_app.extensions['async_db']()
+
+async def _fetch_game(session: AsyncSession, id: int, fields: tuple[str, ...] | None = None) -> dict | None:
+    """
+    Read one game with its publisher and category.
+
+    Args:
+        session (AsyncSession): The session to read with
+        id (int): The unique identifier of the game
+        fields (tuple[str, ...] | None): API fields to include, None for all
+
+    Returns:
+        dict | None: The serialized game, or None if it does not exist
+    """
+    row = (await session.execute(get_games_projection_query(fields).filter(Game.id == id))).first()
+    return Game.row_to_dict(row, fields) if row else None
+
+async def _exists(session: AsyncSession, model, id) -> bool:
+    """
+    Check whether a publisher or category exists.
+
+    Args:
+        session (AsyncSession): The session to read with
+        model: Publisher or Category
+        id: The identifier supplied by the client
+
+    Returns:
+        bool: True if a row with that id exists
+    """
+    return await session.scalar(select(model.id).where(model.id == id)) is not None
+
+@games_async_bp.route('/api/games', methods=['GET'])
+async def get_games() -> tuple[Response, int] | Response:
+    """
+    Get games with their publisher and category information.
+    Supports the same filters, sorting, top, pagination, field selection,
+    lookup by ids and streaming as the WSGI listing.
+
+    Returns:
+        tuple[Response, int] | Response: JSON response containing the games with their details,
+            or 400 error if the sort, fields, ids or pagination parameters are invalid
+    """
+    try:
+        listing = parse_games_listing(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Without pagination parameters, the full list can be streamed
+    if listing.mode == 'full':
+        if prefers_ndjson(request.accept_mimetypes):
+            return _stream_games(listing.query, ndjson=True, fields=listing.fields)
+        if request.args.get('stream') in ('1', 'true'):
+            return _stream_games(listing.query, ndjson=False, fields=listing.fields)
+
+    async with _session() as session:
+        rows = (await session.execute(listing.query)).all()
+    return jsonify(games_listing_body(rows, listing))
+
+def _stream_games(games_query, ndjson: bool, fields: tuple[str, ...] | None = None) -> Response:
+    """
+    Stream games to the client as they are read from the database.
+
+    Args:
+        games_query (Select): The filtered projected games query to stream
+        ndjson (bool): True for newline-delimited JSON, False for a JSON array
+        fields (tuple[str, ...] | None): API fields to include, None for all
+
+    Returns:
+        Response: Streaming response with the encoded games
+    """
+    dumps = current_app.json.dumps
+    session_factory = current_app.extensions['async_db']
+
+    async def generate() -> AsyncIterator[bytes]:
+        """Yield the encoded games one at a time, holding a session until the last one."""
+        async with session_factory() as session:
+            rows = await session.stream(games_query.execution_options(yield_per=STREAM_BATCH_SIZE))
+            if ndjson:
+                async for row in rows:
+                    yield (dumps(Game.row_to_dict(row, fields)) + '\n').encode()
+                return
+
+            yield b'['
+            separator = ''
+            async for row in rows:
+                yield (separator + dumps(Game.row_to_dict(row, fields))).encode()
+                separator = ','
+            yield b']\n'
+
+    mimetype = NDJSON_MIMETYPE if ndjson else 'application/json'
+    return Response(generate(), mimetype=mimetype)
+
+@games_async_bp.route('/api/games/search', methods=['GET'])
+async def search_games() -> tuple[Response, int] | Response:
+    """
+    Search games by title and description, best matches first.
+
+    Returns:
+        tuple[Response, int] | Response: JSON response with the matching games,
+            or 400 error if the query or limit is invalid
+    """
+    try:
+        games_query = parse_games_search(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    async with _session() as session:
+        rows = await session.execute(games_query)
+        games_list = [Game.row_to_dict(row) for row in rows]
+
+    return jsonify(games_list)
+
+@games_async_bp.route('/api/games/changes', methods=['GET'])
+async def get_game_changes() -> tuple[Response, int] | Response:
+    """
+    Get the games changed after the since sequence number (default 0),
+    one entry per game with its latest operation and current state.
+
+    Returns:
+        tuple[Response, int] | Response: JSON response with the changes,
+            or 400 error if since or limit is invalid
+    """
+    try:
+        since = parse_since(request.args.get('since'))
+        limit = parse_limit(request.args.get('limit'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    async with _session() as session:
+        rows = (await session.execute(get_changes_query(since).limit(limit + 1))).all()
+    return jsonify(changes_body(rows, since, limit))
+
+@games_async_bp.route('/api/games/changes/stream', methods=['GET'])
+async def stream_game_changes() -> tuple[Response, int] | Response:
+    """
+    Push game changes as Server-Sent Events, starting after the since
+    sequence number, or after the Last-Event-ID of a reconnecting client.
+    Polls and closes the stream like the WSGI stream, awaiting between polls
+    so an idle stream does not hold a worker.
+
+    Returns:
+        tuple[Response, int] | Response: text/event-stream response of change events,
+            or 400 error if since is invalid
+    """
+    try:
+        since = parse_since(request.headers.get('Last-Event-ID', request.args.get('since')))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    config = current_app.config
+    poll_interval = config.get('CHANGE_STREAM_POLL_INTERVAL', DEFAULT_POLL_INTERVAL)
+    max_age = config.get('CHANGE_STREAM_MAX_AGE', DEFAULT_STREAM_MAX_AGE)
+    dumps = current_app.json.dumps
+    session_factory = current_app.extensions['async_db']
+
+    async def generate() -> AsyncIterator[bytes]:
+        """Poll the change log and yield new changes until the stream is too old."""
+        yield f"retry: {SSE_RETRY_MS}\n\n".encode()
+        last_seq = since
+        started = last_sent = time.monotonic()
+        while True:
+            # A session per poll, so the next poll sees newly committed changes
+            async with session_factory() as session:
+                query = get_changes_query(last_seq).limit(CHANGE_STREAM_BATCH_SIZE)
+                rows = (await session.execute(query)).all()
+            for row in rows:
+                change = change_to_dict(row)
+                last_seq = change['seq']
+                yield format_change_event(change, dumps).encode()
+            now = time.monotonic()
+            if rows:
+                last_sent = now
+            if len(rows) == CHANGE_STREAM_BATCH_SIZE:
+                continue
+            if now - started >= max_age:
+                return
+            if now - last_sent >= HEARTBEAT_INTERVAL:
+                yield b": keep-alive\n\n"
+                last_sent = now
+            await asyncio.sleep(poll_interval)
+
+    response = Response(generate(), mimetype=SSE_MIMETYPE)
+    response.headers['Cache-Control'] = 'no-cache'
+    # Ask reverse proxies such as nginx not to buffer the events
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@games_async_bp.route('/api/games/<int:id>', methods=['GET'])
+async def get_game(id: int) -> tuple[Response, int] | Response:
+    """
+    Get a specific game by its ID with publisher and category information.
+
+    Args:
+        id (int): The unique identifier of the game
+
+    Returns:
+        tuple[Response, int] | Response: JSON response with game data, 404 error if not found,
+            or 400 error if fields is invalid
+    """
+    try:
+        fields = parse_game_fields(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    async with _session() as session:
+        game = await _fetch_game(session, id, fields)
+
+    if game is None:
+        return jsonify({"error": "Game not found"}), 404
+    return jsonify(game)
+
+@games_async_bp.route('/api/games/lookup', methods=['POST'])
+async def lookup_games() -> tuple[Response, int] | Response:
+    """
+    Look up the games listed in the {"ids": [...]} body with a single IN query.
+
+    Returns:
+        tuple[Response, int] | Response: {"games": [...], "missing": [...]} with the games
+            in requested order, or 400 error if the body or fields is invalid
+    """
+    try:
+        fields = parse_game_fields(request.args)
+        data = await request.get_json(silent=True)
+        if not isinstance(data, dict) or not isinstance(data.get('ids'), list):
+            raise ValueError("Request body must contain an 'ids' list")
+        ids = parse_game_ids(data['ids'])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    async with _session() as session:
+        rows = (await session.execute(get_games_lookup_query(ids, fields))).all()
+    return jsonify(games_lookup_body(rows, ids, fields))
+
+@games_async_bp.route('/api/games', methods=['POST'])
+async def create_game() -> tuple[Response, int]:
+    """
+    Create a game.
+
+    Returns:
+        tuple[Response, int]: The created game with 201, or an error with 400 or 500
+    """
+    async with _session() as session:
+        try:
+            # Get JSON data from request
+            try:
+                data = await request.get_json()
+            except Exception:
+                return jsonify({"error": "No JSON data provided"}), 400
+
+            # Validate JSON data exists
+            if data is None:
+                return jsonify({"error": "No JSON data provided"}), 400
+
+            # Validate required fields
+            required_fields = ['title', 'description', 'category_id', 'publisher_id']
+            for field in required_fields:
+                if field not in data:
+                    return jsonify({"error": f"Missing required field: {field}"}), 400
+
+            # Validate publisher and category exist
+            if not await _exists(session, Publisher, data['publisher_id']):
+                return jsonify({"error": "Publisher not found"}), 400
+            if not await _exists(session, Category, data['category_id']):
+                return jsonify({"error": "Category not found"}), 400
+
+            # Create new game
+            new_game = Game(
+                title=data['title'],
+                description=data['description'],
+                category_id=data['category_id'],
+                publisher_id=data['publisher_id'],
+                star_rating=data.get('star_rating')  # Optional field
+            )
+
+            session.add(new_game)
+            await session.flush()
+            game_id = new_game.id
+            await bump_catalog_version_async(session)
+            await session.commit()
+
+            # Return the created game with full details
+            return jsonify(await _fetch_game(session, game_id)), 201
+
+        except ValueError as e:
+            await session.rollback()
+            return jsonify({"error": str(e)}), 400
+        except IntegrityError as e:
+            await session.rollback()
+            return jsonify({"error": "Database integrity error"}), 400
+        except Exception as e:
+            await session.rollback()
+            return jsonify({"error": "Internal server error"}), 500
+
+@games_async_bp.route('/api/games/<int:id>', methods=['PUT'])
+async def update_game(id: int) -> tuple[Response, int] | Response:
+    """
+    Update the fields of a game supplied in the JSON body.
+
+    Args:
+        id (int): The unique identifier of the game
+
+    Returns:
+        tuple[Response, int] | Response: The updated game, or an error with 400, 404 or 500
+    """
+    async with _session() as session:
+        try:
+            # Find the game to update
+            game = await session.scalar(select(Game).where(Game.id == id))
+            if not game:
+                return jsonify({"error": "Game not found"}), 404
+
+            # Get JSON data from request
+            try:
+                data = await request.get_json()
+            except Exception:
+                return jsonify({"error": "No JSON data provided"}), 400
+
+            # Validate JSON data exists
+            if data is None:
+                return jsonify({"error": "No JSON data provided"}), 400
+
+            # Update fields if provided
+            if 'title' in data:
+                game.title = data['title']
+
+            if 'description' in data:
+                game.description = data['description']
+
+            if 'star_rating' in data:
+                game.star_rating = data['star_rating']
+
+            if 'publisher_id' in data:
+                if not await _exists(session, Publisher, data['publisher_id']):
+                    return jsonify({"error": "Publisher not found"}), 400
+                game.publisher_id = data['publisher_id']
+
+            if 'category_id' in data:
+                if not await _exists(session, Category, data['category_id']):
+                    return jsonify({"error": "Category not found"}), 400
+                game.category_id = data['category_id']
+
+            # Commit changes
+            await bump_catalog_version_async(session)
+            await session.commit()
+
+            # Return the updated game with full details
+            return jsonify(await _fetch_game(session, id))
+
+        except ValueError as e:
+            await session.rollback()
+            return jsonify({"error": str(e)}), 400
+        except IntegrityError as e:
+            await session.rollback()
+            return jsonify({"error": "Database integrity error"}), 400
+        except Exception as e:
+            await session.rollback()
+            return jsonify({"error": "Internal server error"}), 500
+
+@games_async_bp.route('/api/games/<int:id>', methods=['DELETE'])
+async def delete_game(id: int) -> tuple[Response, int]:
+    """
+    Delete a game.
+
+    Args:
+        id (int): The unique identifier of the game
+
+    Returns:
+        tuple[Response, int]: A confirmation message, or an error with 404 or 500
+    """
+    async with _session() as session:
+        try:
+            # Find the game to delete
+            game = await session.scalar(select(Game).where(Game.id == id))
+            if not game:
+                return jsonify({"error": "Game not found"}), 404
+
+            await session.delete(game)
+            await bump_catalog_version_async(session)
+            await session.commit()
+
+            return jsonify({"message": "Game deleted successfully"}), 200
+
+        except Exception as e:
+            await session.rollback()
+            return jsonify({"error": "Internal server error"}), 500
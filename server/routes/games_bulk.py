@@ -0,0 +1,336 @@
+from typing import Any
+from flask import jsonify, Response, Blueprint, request
+from models import db, Game
+from models.base import BaseModel
+from sqlalchemy import select, insert, update, delete
+from routes.games import WRITTEN_GAME_COLUMNS, get_games_projection_query, written_game_to_dict
+from utils.catalog_version import bump_catalog_version
+from utils.pagination import is_sql_int
+from utils.reference_cache import ReferenceData, apply_game_write, get_reference_data, get_reference_data_after_write
+from utils.response_cache import invalidate_games
+
+# Create a Blueprint for bulk games routes
+games_bulk_bp = Blueprint('games_bulk', __name__)
+
+# Largest number of games accepted in a single bulk request
+MAX_BULK_SIZE: int = 1000
+
+REQUIRED_FIELDS: tuple[str, ...] = ('title', 'description', 'category_id', 'publisher_id')
+
+def _get_batch(key: str) -> list[Any]:
+    """
+    Read and validate the list of items from a bulk request body.
+
+    Args:
+        key (str): The body key holding the items, e.g. "games" or "ids"
+
+    Returns:
+        list[Any]: The items to process
+
+    Raises:
+        ValueError: If the body is missing, not a list, empty or too large
+    """
+    data = request.get_json(silent=True)
+    if data is None:
+        raise ValueError("No JSON data provided")
+    if not isinstance(data, dict) or not isinstance(data.get(key), list):
+        raise ValueError(f"Request body must contain a '{key}' list")
+
+    items = data[key]
+    if not items:
+        raise ValueError(f"'{key}' must not be empty")
+    if len(items) > MAX_BULK_SIZE:
+        raise ValueError(f"Batch exceeds maximum of {MAX_BULK_SIZE} games")
+    return items
+
+def _is_int(value: Any) -> bool:
+    """
+    Check that a JSON value is an integer (and not a boolean) SQLite can bind.
+
+    Args:
+        value (Any): The value to check
+
+    Returns:
+        bool: True if value is an int within the 64-bit range
+    """
+    return is_sql_int(value)
+
+def _validate_game_fields(item: Any, partial: bool) -> dict[str, Any]:
+    """
+    Validate one game from a bulk request and map it to column values.
+
+    Applies the same rules as the Game model validators, since bulk writes
+    bypass ORM instances.
+
+    Args:
+        item (Any): The game object from the request
+        partial (bool): If True, only the fields present are validated (for updates)
+
+    Returns:
+        dict[str, Any]: Column values to write
+
+    Raises:
+        ValueError: If a field is missing or invalid
+    """
+    if not isinstance(item, dict):
+        raise ValueError("Each game must be a JSON object")
+
+    if not partial:
+        for field in REQUIRED_FIELDS:
+            if field not in item:
+                raise ValueError(f"Missing required field: {field}")
+
+    values: dict[str, Any] = {}
+    if 'title' in item:
+        values['title'] = BaseModel.validate_string_length('Game title', item['title'], min_length=2)
+    if 'description' in item:
+        values['description'] = BaseModel.validate_string_length('Description', item['description'], min_length=10)
+    if 'star_rating' in item:
+        star_rating = item['star_rating']
+        if star_rating is not None and (not isinstance(star_rating, (int, float)) or isinstance(star_rating, bool)):
+            raise ValueError("Star rating must be a number")
+        values['star_rating'] = star_rating
+    for field in ('category_id', 'publisher_id'):
+        if field in item:
+            if not _is_int(item[field]):
+                raise ValueError(f"{field} must be an integer")
+            values[field] = item[field]
+    return values
+
+def _check_references(values: dict[str, Any], reference: ReferenceData) -> None:
+    """
+    Check that a game's publisher and category exist.
+
+    Args:
+        values (dict[str, Any]): Validated column values for the game
+        reference (ReferenceData): The current publishers and categories
+
+    Raises:
+        ValueError: With the same messages as the single-game endpoints
+    """
+    if 'publisher_id' in values and values['publisher_id'] not in reference.publishers:
+        raise ValueError("Publisher not found")
+    if 'category_id' in values and values['category_id'] not in reference.categories:
+        raise ValueError("Category not found")
+
+def _games_by_id(ids: list[int]) -> dict[int, dict]:
+    """
+    Load the serialized form of several games with one query.
+
+    Args:
+        ids (list[int]): The game ids to load
+
+    Returns:
+        dict[int, dict]: Game dictionaries keyed by id
+    """
+    if not ids:
+        return {}
+    rows = db.session.execute(get_games_projection_query().where(Game.id.in_(ids)))
+    return {row.id: Game.row_to_dict(row) for row in rows}
+
+@games_bulk_bp.route('/api/games/bulk', methods=['POST'])
+def bulk_create_games() -> tuple[Response, int]:
+    """
+    Create many games in one transaction.
+
+    The body is {"games": [...]} with the same fields as POST /api/games.
+    Publishers and categories are checked against the reference cache and
+    valid games are inserted with a single executemany, returning the rows
+    the response is built from. Invalid games are skipped and reported.
+
+    Returns:
+        tuple[Response, int]: JSON response with a result per game in request
+            order, or 400 error if the batch itself is invalid
+    """
+    try:
+        items = _get_batch('games')
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        # Validate every item before touching the database
+        validated: list[dict[str, Any] | str] = []
+        for item in items:
+            try:
+                validated.append(_validate_game_fields(item, partial=False))
+            except ValueError as e:
+                validated.append(str(e))
+
+        # Reference checks for the whole batch against the cached publishers and categories
+        reference = get_reference_data()
+
+        rows: list[dict[str, Any]] = []
+        row_indexes: list[int] = []
+        results: list[dict[str, Any]] = []
+        for index, values in enumerate(validated):
+            if isinstance(values, dict):
+                try:
+                    _check_references(values, reference)
+                except ValueError as e:
+                    values = str(e)
+            if isinstance(values, str):
+                results.append({"index": index, "status": 400, "error": values})
+                continue
+            row_indexes.append(index)
+            rows.append({"star_rating": None, **values})
+            results.append({"index": index, "status": 201})
+
+        if rows:
+            # Batched into multi-row INSERT ... RETURNING statements. SQLite
+            # assigns rowids in ascending order within a statement, so sorting
+            # the returned ids restores the order of the batch without paying
+            # for sort_by_parameter_order's row-at-a-time fallback.
+            created = sorted(
+                db.session.execute(insert(Game).returning(*WRITTEN_GAME_COLUMNS), rows),
+                key=lambda row: row.id
+            )
+            version = bump_catalog_version()
+            db.session.commit()
+            invalidate_games(
+                version, [row.id for row in created],
+                {row['category_id'] for row in rows},
+                {row['publisher_id'] for row in rows}
+            )
+
+            # Serialize the returned games with the cached names instead of re-fetching them
+            reference = get_reference_data_after_write(version)
+            for index, row in zip(row_indexes, created):
+                results[index]["game"] = written_game_to_dict(row, reference)
+
+        return jsonify({"created": len(rows), "failed": len(items) - len(rows), "results": results}), 200
+
+    except Exception:
+        db.session.rollback()
+        return jsonify({"error": "Internal server error"}), 500
+
+@games_bulk_bp.route('/api/games/bulk', methods=['PATCH'])
+def bulk_update_games() -> tuple[Response, int]:
+    """
+    Update many games in one transaction.
+
+    The body is {"games": [{"id": ..., <fields to change>}, ...]}. Games are
+    checked with one query, publishers and categories against the reference
+    cache, and the changes are written with a single executemany. Invalid
+    items are skipped and reported.
+
+    Returns:
+        tuple[Response, int]: JSON response with a result per game in request
+            order, or 400 error if the batch itself is invalid
+    """
+    try:
+        items = _get_batch('games')
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        validated: list[tuple[int, dict[str, Any]] | str] = []
+        for item in items:
+            try:
+                if not isinstance(item, dict) or not _is_int(item.get('id')):
+                    raise ValueError("Each game must have an integer id")
+                validated.append((item['id'], _validate_game_fields(item, partial=True)))
+            except ValueError as e:
+                validated.append(str(e))
+
+        # Set-based lookup for the games; references are checked against the cache
+        candidates = [entry for entry in validated if isinstance(entry, tuple)]
+        existing = {
+            row.id: row for row in db.session.execute(
+                select(Game.id, Game.category_id, Game.publisher_id)
+                .where(Game.id.in_({game_id for game_id, _ in candidates}))
+            )
+        } if candidates else {}
+        reference = get_reference_data()
+
+        rows: list[dict[str, Any]] = []
+        results: list[dict[str, Any]] = []
+        affected_categories: set[int] = set()
+        affected_publishers: set[int] = set()
+        for index, entry in enumerate(validated):
+            if isinstance(entry, str):
+                results.append({"index": index, "status": 400, "error": entry})
+                continue
+            game_id, values = entry
+            if game_id not in existing:
+                results.append({"index": index, "id": game_id, "status": 404, "error": "Game not found"})
+                continue
+            try:
+                _check_references(values, reference)
+            except ValueError as e:
+                results.append({"index": index, "id": game_id, "status": 400, "error": str(e)})
+                continue
+
+            current = existing[game_id]
+            affected_categories.update({current.category_id, values.get('category_id', current.category_id)})
+            affected_publishers.update({current.publisher_id, values.get('publisher_id', current.publisher_id)})
+            if values:
+                rows.append({"id": game_id, **values})
+            results.append({"index": index, "id": game_id, "status": 200})
+
+        if rows:
+            db.session.execute(update(Game), rows)
+            version = bump_catalog_version()
+            db.session.commit()
+            invalidate_games(version, [row['id'] for row in rows], affected_categories, affected_publishers)
+            apply_game_write(version)
+
+        updated = _games_by_id([result['id'] for result in results if result['status'] == 200])
+        for result in results:
+            if result['status'] == 200:
+                result["game"] = updated[result['id']]
+
+        updated_count = sum(1 for result in results if result['status'] == 200)
+        return jsonify({"updated": updated_count, "failed": len(items) - updated_count, "results": results}), 200
+
+    except Exception:
+        db.session.rollback()
+        return jsonify({"error": "Internal server error"}), 500
+
+@games_bulk_bp.route('/api/games/bulk', methods=['DELETE'])
+def bulk_delete_games() -> tuple[Response, int]:
+    """
+    Delete many games in one transaction.
+
+    The body is {"ids": [...]}. Existing games are found and deleted with one
+    query each; ids that do not exist are reported.
+
+    Returns:
+        tuple[Response, int]: JSON response with a result per id in request
+            order, or 400 error if the batch itself is invalid
+    """
+    try:
+        ids = _get_batch('ids')
+        if not all(_is_int(game_id) for game_id in ids):
+            raise ValueError("'ids' must contain only integers")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        existing = {
+            row.id: row for row in db.session.execute(
+                select(Game.id, Game.category_id, Game.publisher_id).where(Game.id.in_(set(ids)))
+            )
+        }
+
+        if existing:
+            db.session.execute(delete(Game).where(Game.id.in_(existing.keys())))
+            version = bump_catalog_version()
+            db.session.commit()
+            invalidate_games(
+                version, existing.keys(),
+                {row.category_id for row in existing.values()},
+                {row.publisher_id for row in existing.values()}
+            )
+            apply_game_write(version)
+
+        results = [
+            {"index": index, "id": game_id, "status": 200} if game_id in existing
+            else {"index": index, "id": game_id, "status": 404, "error": "Game not found"}
+            for index, game_id in enumerate(ids)
+        ]
+        failed = sum(1 for result in results if result['status'] != 200)
+        return jsonify({"deleted": len(existing), "failed": failed, "results": results}), 200
+
+    except Exception:
+        db.session.rollback()
+        return jsonify({"error": "Internal server error"}), 500
@@ -1,12 +1,14 @@
-from flask import jsonify, Response, Blueprint
-from models import db, Publisher
+from flask import jsonify, Response, Blueprint, g
+from utils.http_cache import conditional_get
+from utils.reference_cache import get_reference_data
 
 # Create a Blueprint for publisher routes
 publishers_bp = Blueprint('publishers', __name__)
 
 @publishers_bp.route('/api/publishers', methods=['GET'])
+@conditional_get
 def get_publishers() -> Response:
-    """Get all publishers"""
-    publishers = Publisher.query.all()
-    publishers_list = [{"id": p.id, "name": p.name} for p in publishers]
+    """Get all publishers, served from the reference cache"""
+    publishers = get_reference_data(g.catalog_version).publishers
+    publishers_list = [publisher.to_dict() for publisher in publishers.values()]
     return jsonify(publishers_list)
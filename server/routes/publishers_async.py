@@ -0,0 +1,52 @@
+# Publisher, category and facet routes of the ASGI variant of the API (see
+# create_async_app), with the same JSON contracts as routes/publishers.py,
+# routes/categories.py and routes/facets.py. They read the database on every
+# request, as the ASGI variant has no reference cache.
+from quart import Blueprint, Response, current_app, jsonify
+from sqlalchemy import select
+from models import Category, Publisher
+from routes.facets import facet_to_dict, get_facet_query
+from utils.reference_cache import Reference
+
+# Create a Blueprint for the async publisher and facet routes
+publishers_async_bp = Blueprint('publishers_async', __name__)
+
+async def _list_references(model) -> list[dict]:
+    """
+    Read every publisher or category in id order.
+
+    Args:
+        model: Publisher or Category
+
+    Returns:
+        list[dict]: The rows in the same representation as the reference cache
+    """
+    async with current_app.extensions['async_db']() as session:
+        rows = await session.execute(select(model.id, model.name).order_by(model.id))
+        return [Reference(*row).to_dict() for row in rows]
+
+@publishers_async_bp.route('/api/publishers', methods=['GET'])
+async def get_publishers() -> Response:
+    """Get all publishers"""
+    return jsonify(await _list_references(Publisher))
+
+@publishers_async_bp.route('/api/categories', methods=['GET'])
+async def get_categories() -> Response:
+    """Get all categories"""
+    return jsonify(await _list_references(Category))
+
+@publishers_async_bp.route('/api/facets', methods=['GET'])
+async def get_facets() -> Response:
+    """
+    Get categories and publishers with game counts and rating stats.
+
+    Returns:
+        Response: JSON with categories and publishers lists
+    """
+    async with current_app.extensions['async_db']() as session:
+        categories = await session.execute(get_facet_query(Category, 'category'))
+        publishers = await session.execute(get_facet_query(Publisher, 'publisher'))
+        return jsonify({
+            'categories': [facet_to_dict(row) for row in categories],
+            'publishers': [facet_to_dict(row) for row in publishers]
+        })
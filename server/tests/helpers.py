@@ -0,0 +1,159 @@
+# Shared helpers of the server tests.
+#
+# QueryCounter counts the SQL statements an engine executes within a block of
+# code. The tests use it to pin the number of queries each endpoint issues, so
+# N+1 lazy-load regressions show up as test failures.
+#
+# ASGITestClient is a synchronous test client for the ASGI (Quart) variant of
+# the API. It runs each request to completion on a private event loop and
+# returns a Werkzeug response, so tests written against the Flask test client
+# can be run unchanged against the async app. Quart is only imported for type
+# checking, so these helpers load without it.
+import asyncio
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from werkzeug.wrappers import Response
+
+if TYPE_CHECKING:
+    from quart import Quart
+
+class QueryCounter:
+    """
+    Context manager that records every SQL statement executed on an engine.
+
+    Example:
+        with QueryCounter(db.engine) as counter:
+            client.get('/api/games')
+        assert counter.count == 1
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        """
+        Args:
+            engine (Engine): The engine whose statements should be counted
+        """
+        self.engine = engine
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        """
+        Returns:
+            int: Number of statements executed inside the block
+        """
+        return len(self.statements)
+
+    def _record(self, conn: Any, cursor: Any, statement: str, parameters: Any,
+                context: Any, executemany: bool) -> None:
+        """Event handler that stores each statement before it executes."""
+        self.statements.append(statement)
+
+    def __enter__(self) -> 'QueryCounter':
+        """Start listening for statements."""
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        """Stop listening for statements."""
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+class ASGITestResponse(Response):
+    """
+    Fully read response of the ASGI app, remembering whether it was streamed.
+    """
+
+    def __init__(self, body: bytes, status: int, headers: Any, streamed: bool) -> None:
+        """
+        Args:
+            body (bytes): The complete response body
+            status (int): The status code
+            headers (Any): The response headers
+            streamed (bool): True if the app produced the body as a stream
+        """
+        super().__init__(body, status=status, headers=headers)
+        self._streamed = streamed
+
+    @property
+    def is_streamed(self) -> bool:
+        """
+        Returns:
+            bool: True if the app produced the body as a stream
+        """
+        return self._streamed
+
+class ASGITestClient:
+    """
+    Blocking client with the request methods of the Flask test client.
+
+    Example:
+        client = ASGITestClient(create_async_app(connection_string))
+        response = client.get('/api/games')
+        client.close()
+    """
+
+    def __init__(self, app: 'Quart') -> None:
+        """
+        Start the app on a new event loop.
+
+        Args:
+            app (Quart): The ASGI app to test
+        """
+        self.app = app
+        self.loop = asyncio.new_event_loop()
+        self.loop.run_until_complete(app.startup())
+
+    def open(self, path: str, method: str = 'GET', headers: dict | None = None,
+             data: str | bytes | None = None, content_type: str | None = None) -> ASGITestResponse:
+        """
+        Send a request and read the whole response.
+
+        Args:
+            path (str): The request path, with any query string
+            method (str): The HTTP method
+            headers (dict | None): Optional request headers
+            data (str | bytes | None): Optional request body
+            content_type (str | None): Optional Content-Type of the body
+
+        Returns:
+            ASGITestResponse: The response
+        """
+        headers = dict(headers or {})
+        if content_type is not None:
+            headers['Content-Type'] = content_type
+        return self.loop.run_until_complete(self._open(path, method, headers, data))
+
+    async def _open(self, path: str, method: str, headers: dict, data: str | bytes | None) -> ASGITestResponse:
+        """Send a request on the app's event loop."""
+        async with self.app.test_client().request(path, method=method, headers=headers) as connection:
+            if data:
+                await connection.send(data.encode() if isinstance(data, str) else data)
+            await connection.send_complete()
+        # Bodies the app sends in one piece carry a Content-Length; streamed bodies do not
+        streamed = 'Content-Length' not in connection.headers
+        response = await connection.as_response()
+        body = await response.get_data()
+        return ASGITestResponse(body, connection.status_code, list(connection.headers.items()), streamed)
+
+    def get(self, path: str, **kwargs: Any) -> ASGITestResponse:
+        """Send a GET request, see open."""
+        return self.open(path, method='GET', **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> ASGITestResponse:
+        """Send a POST request, see open."""
+        return self.open(path, method='POST', **kwargs)
+
+    def put(self, path: str, **kwargs: Any) -> ASGITestResponse:
+        """Send a PUT request, see open."""
+        return self.open(path, method='PUT', **kwargs)
+
+    def delete(self, path: str, **kwargs: Any) -> ASGITestResponse:
+        """Send a DELETE request, see open."""
+        return self.open(path, method='DELETE', **kwargs)
+
+    def close(self) -> None:
+        """Shut the app down and close the event loop."""
+        self.loop.run_until_complete(self.app.shutdown())
+        self.loop.close()
@@ -0,0 +1,100 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+import json
+from flask import Flask
+from models import Category, db, init_db
+from routes.categories import categories_bp
+
+class TestCategoriesRoutes(unittest.TestCase):
+    # Test data
+    TEST_CATEGORIES = [
+        {"name": "Strategy", "description": "Plan your way to victory one turn at a time"},
+        {"name": "Card Game", "description": None}
+    ]
+    
+    # API paths
+    CATEGORIES_API_PATH = '/api/categories'
+    
+    # Database the Flask app under test uses
+    DATABASE_URI = 'sqlite:///:memory:'
+
+    def setUp(self) -> None:
+        """Set up test database and seed data"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = self.DATABASE_URI
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        
+        self.app.register_blueprint(categories_bp)
+        self.client = self.app.test_client()
+        
+        init_db(self.app, testing=True)
+        
+        with self.app.app_context():
+            db.create_all()
+            self._seed_test_data()
+
+    def tearDown(self) -> None:
+        """Clean up test database"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _seed_test_data(self) -> None:
+        """Helper method to seed test data"""
+        categories = [Category(**data) for data in self.TEST_CATEGORIES]
+        db.session.add_all(categories)
+        db.session.commit()
+
+    def test_get_categories_success(self) -> None:
+        """Test successful retrieval of categories in id order"""
+        response = self.client.get(self.CATEGORIES_API_PATH)
+        data = json.loads(response.data)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data, [
+            {"id": i + 1, "name": category["name"]} for i, category in enumerate(self.TEST_CATEGORIES)
+        ])
+
+    def test_get_categories_after_change(self) -> None:
+        """Test that a new category is listed once committed"""
+        self.client.get(self.CATEGORIES_API_PATH)
+        with self.app.app_context():
+            db.session.add(Category(name="Puzzle"))
+            db.session.commit()
+        
+        response = self.client.get(self.CATEGORIES_API_PATH)
+        data = json.loads(response.data)
+        
+        self.assertEqual([c['name'] for c in data], [c['name'] for c in self.TEST_CATEGORIES] + ["Puzzle"])
+
+@unittest.skipUnless(
+    importlib.util.find_spec('quart') and importlib.util.find_spec('aiosqlite'),
+    "quart and aiosqlite are required for the ASGI variant"
+)
+class TestAsyncCategoriesRoutes(TestCategoriesRoutes):
+    """Run the categories route tests against the ASGI variant of the API"""
+
+    def setUp(self) -> None:
+        """Seed a file database through Flask, then serve it with the async app"""
+        from app_factory import create_async_app
+        from tests.helpers import ASGITestClient
+        
+        # The async engine cannot see a Flask in-memory database
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.DATABASE_URI = f"sqlite:///{os.path.join(self.temp_dir.name, 'test.db')}"
+        super().setUp()
+        
+        self.client = ASGITestClient(create_async_app(self.DATABASE_URI))
+
+    def tearDown(self) -> None:
+        """Shut down the async app before dropping the database"""
+        self.client.close()
+        super().tearDown()
+        self.temp_dir.cleanup()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import gzip
+import json
+import unittest
+from unittest import mock
+from flask import Flask
+from models import Game, Publisher, Category, db, init_db
+from routes.games import games_bp
+from utils import compression
+from utils.compression import init_compression
+from utils.response_cache import get_response_cache
+
+class TestCompression(unittest.TestCase):
+    # Number of seeded games, enough for the listing to pass the threshold
+    GAME_COUNT: int = 20
+
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+
+    def setUp(self) -> None:
+        """Set up test database, seed data and compression"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.config['COMPRESSION_MIN_SIZE'] = 1024
+
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+
+        init_db(self.app, testing=True)
+        init_compression(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            publisher = Publisher(name="DevGames Inc")
+            category = Category(name="Strategy")
+            db.session.add_all(
+                Game(
+                    title=f"Pipeline Panic {i}",
+                    description="Build your DevOps pipeline before chaos ensues, one stage at a time",
+                    publisher=publisher,
+                    category=category,
+                    star_rating=4.5
+                )
+                for i in range(self.GAME_COUNT)
+            )
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def test_gzip_listing(self) -> None:
+        """Test that a large listing is gzipped for clients that accept gzip"""
+        # Arrange
+        plain = self.client.get(self.GAMES_API_PATH)
+
+        # Act
+        response = self.client.get(self.GAMES_API_PATH, headers={'Accept-Encoding': 'gzip'})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.vary)
+        self.assertLess(len(response.data), len(plain.data))
+        self.assertEqual(gzip.decompress(response.data), plain.data)
+        self.assertEqual(int(response.headers['Content-Length']), len(response.data))
+
+    @unittest.skipUnless(compression.brotli is not None, "brotli is not installed")
+    def test_brotli_preferred(self) -> None:
+        """Test that brotli is chosen when the client accepts it alongside gzip"""
+        # Arrange
+        plain = self.client.get(self.GAMES_API_PATH)
+
+        # Act
+        response = self.client.get(self.GAMES_API_PATH, headers={'Accept-Encoding': 'gzip, deflate, br'})
+        gzip_only = self.client.get(self.GAMES_API_PATH, headers={'Accept-Encoding': 'br;q=0.5, gzip'})
+
+        # Assert
+        self.assertEqual(response.headers['Content-Encoding'], 'br')
+        self.assertEqual(compression.brotli.decompress(response.data), plain.data)
+        self.assertEqual(gzip_only.headers['Content-Encoding'], 'gzip')
+
+    def test_uncompressed_responses(self) -> None:
+        """Test that small bodies and clients without Accept-Encoding get plain JSON"""
+        # Act
+        plain = self.client.get(self.GAMES_API_PATH)
+        refused = self.client.get(self.GAMES_API_PATH, headers={'Accept-Encoding': 'gzip;q=0'})
+        small = self.client.get(f'{self.GAMES_API_PATH}/1', headers={'Accept-Encoding': 'gzip'})
+
+        # Assert
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertIn('Accept-Encoding', plain.vary)
+        self.assertEqual(len(json.loads(plain.data)), self.GAME_COUNT)
+        self.assertNotIn('Content-Encoding', refused.headers)
+        self.assertNotIn('Content-Encoding', small.headers)
+        self.assertEqual(json.loads(small.data)['id'], 1)
+
+    def test_cached_listing_compressed_once(self) -> None:
+        """Test that the compressed form of a cached listing is reused"""
+        # Arrange
+        headers = {'Accept-Encoding': 'gzip'}
+
+        # Act
+        with mock.patch.object(compression.gzip, 'compress', wraps=gzip.compress) as compress:
+            first = self.client.get(self.GAMES_API_PATH, headers=headers)
+            second = self.client.get(self.GAMES_API_PATH, headers=headers)
+        with self.app.app_context():
+            stats = get_response_cache().stats()
+
+        # Assert
+        self.assertEqual(compress.call_count, 1)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(stats['encoded_hits'], 1)
+
+    def test_compressed_listing_follows_writes(self) -> None:
+        """Test that a write replaces the cached compressed listing"""
+        # Arrange
+        headers = {'Accept-Encoding': 'gzip'}
+        self.client.get(self.GAMES_API_PATH, headers=headers)
+
+        # Act
+        self.client.put(
+            f'{self.GAMES_API_PATH}/1',
+            data=json.dumps({"title": "Kubernetes Kingdom"}),
+            content_type='application/json'
+        )
+        response = self.client.get(self.GAMES_API_PATH, headers=headers)
+
+        # Assert
+        games = json.loads(gzip.decompress(response.data))
+        self.assertEqual(games[0]['title'], "Kubernetes Kingdom")
+
+    def test_etag_varies_by_accept_encoding(self) -> None:
+        """Test that compressed and plain representations have different ETags"""
+        # Act
+        plain = self.client.get(self.GAMES_API_PATH)
+        compressed = self.client.get(self.GAMES_API_PATH, headers={'Accept-Encoding': 'gzip'})
+        revalidated = self.client.get(
+            self.GAMES_API_PATH,
+            headers={'Accept-Encoding': 'gzip', 'If-None-Match': compressed.headers['ETag']}
+        )
+
+        # Assert
+        self.assertNotEqual(plain.headers['ETag'], compressed.headers['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,21 @@
+import unittest
+from benchmarks.compression_benchmark import SCENARIOS, run_benchmark
+
+class TestCompressionBenchmark(unittest.TestCase):
+    def test_run_benchmark_smoke(self) -> None:
+        """Test a tiny run and that compression shrinks every listing"""
+        results = run_benchmark(game_count=50, publisher_count=5, category_count=3, requests=2)
+
+        self.assertEqual(set(results['scenarios']), set(SCENARIOS))
+        for name, by_encoding in results['scenarios'].items():
+            with self.subTest(scenario=name):
+                identity = by_encoding['identity']['uncached']
+                gzipped = by_encoding['gzip']['uncached']
+                self.assertEqual(identity['content_encoding'], 'identity')
+                self.assertEqual(gzipped['content_encoding'], 'gzip')
+                self.assertLess(gzipped['bytes'], identity['bytes'])
+                self.assertEqual(by_encoding['gzip']['cached']['bytes'], gzipped['bytes'])
+                self.assertGreater(identity['cpu_ms'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
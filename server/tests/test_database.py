@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from flask import Flask
+from sqlalchemy import text
+from models import db
+from utils.database import init_db
+
+class TestDatabaseProfiles(unittest.TestCase):
+    def setUp(self) -> None:
+        """Create a Flask app and a temporary SQLite file; pragmas like WAL need a real file"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.connection_string = f'sqlite:///{os.path.join(self.temp_dir.name, "test.db")}'
+
+    def tearDown(self) -> None:
+        """Close connections and remove the temporary database"""
+        if 'sqlalchemy' in self.app.extensions:
+            with self.app.app_context():
+                db.session.remove()
+                db.engine.dispose()
+        self.temp_dir.cleanup()
+
+    def _pragma(self, name: str) -> object:
+        """Helper method to read a pragma from a pooled connection"""
+        with self.app.app_context():
+            return db.session.execute(text(f'PRAGMA {name}')).scalar()
+
+    def test_production_profile_applies_pragmas(self) -> None:
+        """Test that the production profile configures WAL and the other pragmas"""
+        init_db(self.app, self.connection_string, testing=True, profile='production')
+
+        self.assertEqual(self._pragma('journal_mode'), 'wal')
+        self.assertEqual(self._pragma('synchronous'), 1)  # NORMAL
+        self.assertEqual(self._pragma('busy_timeout'), 5000)
+        self.assertEqual(self._pragma('cache_size'), -65536)
+        self.assertEqual(self.app.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_size'], 10)
+
+    def test_production_profile_pragma_override(self) -> None:
+        """Test that SQLITE_PRAGMAS overrides individual production pragmas"""
+        self.app.config['SQLITE_PRAGMAS'] = {'busy_timeout': 250}
+        init_db(self.app, self.connection_string, testing=True, profile='production')
+
+        self.assertEqual(self._pragma('busy_timeout'), 250)
+        self.assertEqual(self._pragma('journal_mode'), 'wal')
+
+    def test_default_profile_keeps_sqlite_defaults(self) -> None:
+        """Test that the default profile leaves journaling untouched"""
+        init_db(self.app, self.connection_string, testing=True, profile='default')
+
+        self.assertEqual(self._pragma('journal_mode'), 'delete')
+        self.assertEqual(self.app.config['SQLALCHEMY_ENGINE_OPTIONS'], {})
+
+    def test_unknown_profile(self) -> None:
+        """Test that an unknown profile name is rejected"""
+        with self.assertRaises(ValueError):
+            init_db(self.app, self.connection_string, testing=True, profile='turbo')
+
+if __name__ == '__main__':
+    unittest.main()
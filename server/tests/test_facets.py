@@ -0,0 +1,295 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+import json
+from typing import Any, Dict
+from flask import Flask, Response
+from sqlalchemy import func, select
+from models import Game, Publisher, Category, db, init_db
+from routes.facets import facets_bp, get_facet_query
+from routes.games import games_bp
+from routes.games_bulk import games_bulk_bp
+from utils.query_plan import explain_query_plan
+from tests.helpers import QueryCounter
+
+class TestFacetsRoutes(unittest.TestCase):
+    # Test data as complete objects
+    TEST_DATA: Dict[str, Any] = {
+        "publishers": [
+            {"name": "DevGames Inc"},
+            {"name": "Scrum Masters"},
+            {"name": "Unpublished Studio"}
+        ],
+        "categories": [
+            {"name": "Strategy"},
+            {"name": "Card Game"}
+        ],
+        "games": [
+            {
+                "title": "Pipeline Panic",
+                "description": "Build your DevOps pipeline before chaos ensues",
+                "publisher_index": 0,
+                "category_index": 0,
+                "star_rating": 4.5
+            },
+            {
+                "title": "Agile Adventures",
+                "description": "Navigate your team through sprints and releases",
+                "publisher_index": 1,
+                "category_index": 1,
+                "star_rating": 4.2
+            },
+            {
+                "title": "Code Review Chronicles",
+                "description": "Battle bugs and conquer code smells",
+                "publisher_index": 0,
+                "category_index": 0,
+                "star_rating": 3.5
+            },
+            {
+                "title": "Unrated Rush",
+                "description": "A game nobody has rated yet",
+                "publisher_index": 1,
+                "category_index": 0,
+                "star_rating": None
+            }
+        ]
+    }
+
+    # API paths
+    FACETS_API_PATH: str = '/api/facets'
+    GAMES_API_PATH: str = '/api/games'
+
+    # Database the Flask app under test uses
+    DATABASE_URI: str = 'sqlite:///:memory:'
+
+    def setUp(self) -> None:
+        """Set up test database and seed data"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = self.DATABASE_URI
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        self.app.register_blueprint(facets_bp)
+        self.app.register_blueprint(games_bp)
+        self.app.register_blueprint(games_bulk_bp)
+        self.client = self.app.test_client()
+
+        init_db(self.app, testing=True)
+
+        with self.app.app_context():
+            db.create_all()
+            self._seed_test_data()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _seed_test_data(self) -> None:
+        """Helper method to seed test data"""
+        publishers = [Publisher(**data) for data in self.TEST_DATA["publishers"]]
+        categories = [Category(**data) for data in self.TEST_DATA["categories"]]
+        db.session.add_all(publishers + categories)
+        db.session.commit()
+
+        for game_data in self.TEST_DATA["games"]:
+            game_dict = game_data.copy()
+            publisher_index = game_dict.pop("publisher_index")
+            category_index = game_dict.pop("category_index")
+            db.session.add(Game(
+                **game_dict,
+                publisher=publishers[publisher_index],
+                category=categories[category_index]
+            ))
+        db.session.commit()
+
+    def _get_facets(self) -> Dict[str, Any]:
+        """Helper method to fetch the facets"""
+        response = self.client.get(self.FACETS_API_PATH)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.data)
+
+    def _by_name(self, facets: list) -> Dict[str, Any]:
+        """Helper method to index facets by name"""
+        return {facet['name']: facet for facet in facets}
+
+    def _assert_matches_games(self) -> None:
+        """Helper method to compare the facets with a GROUP BY over games"""
+        data = self._get_facets()
+        with self.app.app_context():
+            for key, column, model in (
+                ('categories', Game.category_id, Category),
+                ('publishers', Game.publisher_id, Publisher)
+            ):
+                expected = {
+                    row.id: (row.count, row.min, row.max)
+                    for row in db.session.execute(
+                        select(
+                            column.label('id'),
+                            func.count().label('count'),
+                            func.min(Game.star_rating).label('min'),
+                            func.max(Game.star_rating).label('max')
+                        ).group_by(column)
+                    )
+                }
+                model_ids = db.session.execute(select(model.id)).scalars()
+                for model_id in model_ids:
+                    facet = next(f for f in data[key] if f['id'] == model_id)
+                    count, low, high = expected.get(model_id, (0, None, None))
+                    self.assertEqual(
+                        (facet['game_count'], facet['rating']['min'], facet['rating']['max']),
+                        (count, low, high),
+                        f"{key} {model_id}"
+                    )
+
+    def _send(self, method: str, path: str, body: Any) -> Response:
+        """Helper method to send a JSON body"""
+        return self.client.open(
+            path,
+            method=method,
+            data=json.dumps(body),
+            content_type='application/json'
+        )
+
+    def test_get_facets_counts_and_ratings(self) -> None:
+        """Test that facets report game counts and rating stats"""
+        # Act
+        data = self._get_facets()
+        categories = self._by_name(data['categories'])
+        publishers = self._by_name(data['publishers'])
+
+        # Assert
+        self.assertEqual([c['name'] for c in data['categories']], ["Card Game", "Strategy"])
+        self.assertEqual(categories["Strategy"]['game_count'], 3)
+        self.assertEqual(categories["Strategy"]['rating'], {"min": 3.5, "avg": 4.0, "max": 4.5})
+        self.assertEqual(categories["Card Game"]['game_count'], 1)
+        self.assertEqual(publishers["Scrum Masters"]['rating'], {"min": 4.2, "avg": 4.2, "max": 4.2})
+        self.assertEqual(publishers["Unpublished Studio"]['game_count'], 0)
+        self.assertEqual(publishers["Unpublished Studio"]['rating'], {"min": None, "avg": None, "max": None})
+
+    def test_facets_follow_game_writes(self) -> None:
+        """Test that creating, updating and deleting games keeps the facets current"""
+        # Act
+        self._send('POST', self.GAMES_API_PATH, {
+            "title": "Deploy Duel",
+            "description": "Race to ship before the release train departs",
+            "category_id": 2,
+            "publisher_id": 3,
+            "star_rating": 2.0
+        })
+        self._send('PUT', f'{self.GAMES_API_PATH}/1', {"category_id": 2})
+        self._send('PUT', f'{self.GAMES_API_PATH}/2', {"star_rating": 5.0})
+        self.client.delete(f'{self.GAMES_API_PATH}/3')
+        data = self._get_facets()
+        categories = self._by_name(data['categories'])
+        publishers = self._by_name(data['publishers'])
+
+        # Assert
+        self.assertEqual(categories["Strategy"]['game_count'], 1)
+        self.assertEqual(categories["Strategy"]['rating'], {"min": None, "avg": None, "max": None})
+        self.assertEqual(categories["Card Game"]['game_count'], 3)
+        self.assertEqual(categories["Card Game"]['rating'], {"min": 2.0, "avg": 3.83, "max": 5.0})
+        self.assertEqual(publishers["Unpublished Studio"]['game_count'], 1)
+        self._assert_matches_games()
+
+    def test_facets_follow_bulk_writes(self) -> None:
+        """Test that bulk endpoints keep the facets current"""
+        # Act
+        self._send('POST', '/api/games/bulk', {"games": [
+            {
+                "title": f"Bulk Game {i}",
+                "description": "A game created in bulk for facet testing",
+                "category_id": 2,
+                "publisher_id": 3,
+                "star_rating": float(i)
+            }
+            for i in range(1, 4)
+        ]})
+        self._send('PATCH', '/api/games/bulk', {"games": [
+            {"id": 1, "star_rating": 1.0},
+            {"id": 5, "category_id": 1}
+        ]})
+        self._send('DELETE', '/api/games/bulk', {"ids": [3, 7]})
+
+        # Assert
+        self._assert_matches_games()
+
+    def test_facets_invalidated_after_write(self) -> None:
+        """Test that a cached facets response is refreshed by a game write"""
+        # Arrange
+        self._get_facets()
+
+        # Act
+        self.client.delete(f'{self.GAMES_API_PATH}/2')
+        categories = self._by_name(self._get_facets()['categories'])
+
+        # Assert
+        self.assertEqual(categories["Card Game"]['game_count'], 0)
+
+    def test_facets_query_does_not_read_games(self) -> None:
+        """Test that facet reads use the summary rather than the games table"""
+        with self.app.app_context():
+            for model, facet in ((Category, 'category'), (Publisher, 'publisher')):
+                plan = explain_query_plan(db.session.connection(), get_facet_query(model, facet))
+                with self.subTest(facet=facet):
+                    self.assertFalse(any(' games' in step for step in plan), plan)
+            engine = db.engine
+
+        # Catalog version lookup, categories query, publishers query
+        with QueryCounter(engine) as counter:
+            response = self.client.get(self.FACETS_API_PATH)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(counter.count, 3, counter.statements)
+
+    def test_facets_etag_not_modified(self) -> None:
+        """Test that revalidating with a current ETag returns 304"""
+        response = self.client.get(self.FACETS_API_PATH)
+        etag = response.headers['ETag']
+
+        response = self.client.get(self.FACETS_API_PATH, headers={'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, 304)
+
+@unittest.skipUnless(
+    importlib.util.find_spec('quart') and importlib.util.find_spec('aiosqlite'),
+    "quart and aiosqlite are required for the ASGI variant"
+)
+class TestAsyncFacetsRoutes(TestFacetsRoutes):
+    """Run the facets route tests against the ASGI variant of the API"""
+
+    def setUp(self) -> None:
+        """Seed a file database through Flask, then serve it with the async app"""
+        from app_factory import create_async_app
+        from tests.helpers import ASGITestClient
+
+        # The async engine cannot see a Flask in-memory database
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.DATABASE_URI = f"sqlite:///{os.path.join(self.temp_dir.name, 'test.db')}"
+        super().setUp()
+
+        self.client = ASGITestClient(create_async_app(self.DATABASE_URI))
+
+    def tearDown(self) -> None:
+        """Shut down the async app before dropping the database"""
+        self.client.close()
+        super().tearDown()
+        self.temp_dir.cleanup()
+
+    @unittest.skip("Bulk writes are only available on the WSGI app")
+    def test_facets_follow_bulk_writes(self) -> None:
+        pass
+
+    @unittest.skip("Statement counts are pinned for the Flask app's engine")
+    def test_facets_query_does_not_read_games(self) -> None:
+        pass
+
+    @unittest.skip("The ASGI variant does not send ETags")
+    def test_facets_etag_not_modified(self) -> None:
+        pass
+
+if __name__ == '__main__':
+    unittest.main()
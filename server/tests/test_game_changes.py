@@ -0,0 +1,268 @@
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+from typing import Any
+from flask import Flask
+from models import Game, Publisher, Category, db, init_db, create_game_change_log
+from routes.games import games_bp
+from routes.game_changes import game_changes_bp
+
+class TestGameChangesRoutes(unittest.TestCase):
+    # Test data
+    TEST_GAMES: list[dict[str, Any]] = [
+        {
+            "title": "Pipeline Panic",
+            "description": "Build your DevOps pipeline before chaos ensues",
+            "star_rating": 4.5
+        },
+        {
+            "title": "Agile Adventures",
+            "description": "Navigate your team through sprints and releases",
+            "star_rating": 4.2
+        }
+    ]
+
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+    CHANGES_API_PATH: str = '/api/games/changes'
+    STREAM_API_PATH: str = '/api/games/changes/stream'
+
+    # Database the Flask app under test uses
+    DATABASE_URI: str = 'sqlite:///:memory:'
+
+    def setUp(self) -> None:
+        """Set up test database and seed data"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = self.DATABASE_URI
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        # Streams end after their first poll
+        self.app.config['CHANGE_STREAM_MAX_AGE'] = 0
+
+        self.app.register_blueprint(games_bp)
+        self.app.register_blueprint(game_changes_bp)
+        self.client = self.app.test_client()
+
+        init_db(self.app, testing=True)
+
+        with self.app.app_context():
+            db.create_all()
+            publisher = Publisher(name="DevGames Inc")
+            category = Category(name="Strategy")
+            db.session.add_all(
+                Game(publisher=publisher, category=category, **data) for data in self.TEST_GAMES
+            )
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _get_changes(self, query: str = '') -> dict:
+        """Helper method to read a page of the change feed"""
+        response = self.client.get(f'{self.CHANGES_API_PATH}{query}')
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.data)
+
+    def _parse_events(self, body: str) -> list[dict[str, str]]:
+        """Helper method to split a Server-Sent Events body into its events"""
+        events = []
+        for block in body.split('\n\n'):
+            fields = {}
+            for line in block.splitlines():
+                if line and not line.startswith(':'):
+                    name, _, value = line.partition(': ')
+                    fields[name] = value
+            if fields:
+                events.append(fields)
+        return events
+
+    def test_get_changes_from_start(self) -> None:
+        """Test that the feed from 0 lists every game as created, in order"""
+        # Act
+        data = self._get_changes()
+
+        # Assert
+        changes = data['changes']
+        self.assertEqual([c['op'] for c in changes], ['create', 'create'])
+        self.assertEqual([c['game']['title'] for c in changes], [g['title'] for g in self.TEST_GAMES])
+        self.assertEqual([c['game_id'] for c in changes], [c['game']['id'] for c in changes])
+        self.assertEqual(data['next_since'], changes[-1]['seq'])
+        self.assertFalse(data['has_more'])
+        self.assertTrue(changes[0]['changed_at'].endswith('Z'))
+        self.assertIn('T', changes[0]['changed_at'])
+
+    def test_get_changes_after_writes(self) -> None:
+        """Test that updates and deletes after a sequence number are reported"""
+        # Arrange
+        since = self._get_changes()['next_since']
+
+        # Act
+        self.client.put(
+            f'{self.GAMES_API_PATH}/1',
+            data=json.dumps({"title": "Kubernetes Kingdom"}),
+            content_type='application/json'
+        )
+        self.client.delete(f'{self.GAMES_API_PATH}/2')
+        data = self._get_changes(f'?since={since}')
+
+        # Assert
+        changes = data['changes']
+        self.assertEqual([(c['game_id'], c['op']) for c in changes], [(1, 'update'), (2, 'delete')])
+        self.assertEqual(changes[0]['game']['title'], "Kubernetes Kingdom")
+        self.assertEqual(changes[0]['game']['publisher']['name'], "DevGames Inc")
+        self.assertIsNone(changes[1]['game'])
+        self.assertGreater(changes[0]['seq'], since)
+        self.assertEqual(self._get_changes(f"?since={data['next_since']}")['changes'], [])
+
+    def test_get_changes_latest_per_game(self) -> None:
+        """Test that a game changed several times appears once, with its latest change"""
+        # Arrange
+        since = self._get_changes()['next_since']
+        for title in ("Kubernetes Kingdom", "Container Chaos"):
+            self.client.put(
+                f'{self.GAMES_API_PATH}/1',
+                data=json.dumps({"title": title}),
+                content_type='application/json'
+            )
+
+        # Act
+        data = self._get_changes(f'?since={since}')
+
+        # Assert
+        self.assertEqual(len(data['changes']), 1)
+        self.assertEqual(data['changes'][0]['game']['title'], "Container Chaos")
+
+    def test_get_changes_pages(self) -> None:
+        """Test that next_since and has_more page through the feed"""
+        # Act
+        first = self._get_changes('?limit=1')
+        second = self._get_changes(f"?limit=1&since={first['next_since']}")
+
+        # Assert
+        self.assertTrue(first['has_more'])
+        self.assertFalse(second['has_more'])
+        self.assertEqual(first['changes'][0]['game_id'], 1)
+        self.assertEqual(second['changes'][0]['game_id'], 2)
+
+    def test_get_changes_invalid_since(self) -> None:
+        """Test that since must be a non-negative integer"""
+        for since in ('-1', 'abc'):
+            with self.subTest(since=since):
+                # Act
+                response = self.client.get(f'{self.CHANGES_API_PATH}?since={since}')
+                data = json.loads(response.data)
+
+                # Assert
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(data['error'], "since must be a non-negative integer")
+
+    def test_change_log_backfilled(self) -> None:
+        """Test that a change log created for an existing database lists its games"""
+        # Arrange
+        with self.app.app_context():
+            with db.engine.begin() as connection:
+                connection.exec_driver_sql("DROP TABLE game_changes")
+
+            # Act
+            create_game_change_log(db.engine)
+
+        data = self._get_changes()
+
+        # Assert
+        self.assertEqual([(c['game_id'], c['op']) for c in data['changes']], [(1, 'create'), (2, 'create')])
+
+    def test_stream_changes(self) -> None:
+        """Test that the stream sends each change as an event whose id is its sequence number"""
+        # Act
+        response = self.client.get(self.STREAM_API_PATH)
+        body = response.get_data(as_text=True)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        self.assertEqual(response.headers['Cache-Control'], 'no-cache')
+        self.assertTrue(body.startswith('retry: '))
+        events = [e for e in self._parse_events(body) if 'event' in e]
+        self.assertEqual([e['event'] for e in events], ['change', 'change'])
+        changes = [json.loads(e['data']) for e in events]
+        self.assertEqual([e['id'] for e in events], [str(c['seq']) for c in changes])
+        self.assertEqual([c['game']['title'] for c in changes], [g['title'] for g in self.TEST_GAMES])
+
+    def test_stream_changes_resumes_from_last_event_id(self) -> None:
+        """Test that a reconnecting client only gets the changes after its Last-Event-ID"""
+        # Arrange
+        first = self._get_changes('?limit=1')
+
+        # Act
+        response = self.client.get(
+            f'{self.STREAM_API_PATH}?since=0',
+            headers={'Last-Event-ID': str(first['next_since'])}
+        )
+
+        # Assert
+        events = [e for e in self._parse_events(response.get_data(as_text=True)) if 'event' in e]
+        self.assertEqual([json.loads(e['data'])['game_id'] for e in events], [2])
+
+    def test_stream_changes_invalid_since(self) -> None:
+        """Test that the stream rejects an invalid since"""
+        # Act
+        response = self.client.get(f'{self.STREAM_API_PATH}?since=-1')
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
+
+    def test_stream_changes_capped_per_worker(self) -> None:
+        """Test that streams beyond CHANGE_STREAM_MAX_STREAMS get 503 until one closes"""
+        # Arrange
+        self.app.config['CHANGE_STREAM_MAX_STREAMS'] = 1
+        first = self.client.get(self.STREAM_API_PATH, buffered=False)
+
+        # Act
+        rejected = self.client.get(self.STREAM_API_PATH)
+        first.close()
+        accepted = self.client.get(self.STREAM_API_PATH)
+
+        # Assert
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(rejected.status_code, 503)
+        self.assertEqual(rejected.headers['Retry-After'], '3')
+        self.assertEqual(json.loads(rejected.data)['error'], "Too many open change streams, retry later")
+        self.assertEqual(accepted.status_code, 200)
+
+@unittest.skipUnless(
+    importlib.util.find_spec('quart') and importlib.util.find_spec('aiosqlite'),
+    "quart and aiosqlite are required for the ASGI variant"
+)
+class TestAsyncGameChangesRoutes(TestGameChangesRoutes):
+    """Run the change feed tests against the ASGI variant of the API"""
+
+    def setUp(self) -> None:
+        """Seed a file database through Flask, then serve it with the async app"""
+        from app_factory import create_async_app
+        from tests.helpers import ASGITestClient
+
+        # The async engine cannot see a Flask in-memory database
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.DATABASE_URI = f"sqlite:///{os.path.join(self.temp_dir.name, 'test.db')}"
+        super().setUp()
+
+        self.client = ASGITestClient(create_async_app(self.DATABASE_URI, {'CHANGE_STREAM_MAX_AGE': 0}))
+
+    @unittest.skip("Streams of the ASGI variant hold no worker thread and are not capped")
+    def test_stream_changes_capped_per_worker(self) -> None:
+        pass
+
+    def tearDown(self) -> None:
+        """Shut down the async app before dropping the database"""
+        self.client.close()
+        super().tearDown()
+        self.temp_dir.cleanup()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,17 @@
+import importlib.util
+import os
+import tempfile
 import unittest
 import json
 from typing import Dict, List, Any, Optional
 from flask import Flask, Response
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from models import Game, Publisher, Category, db, init_db
-from routes.games import games_bp
+from routes.games import games_bp, get_games_projection_query
+from utils.catalog_version import bump_catalog_version
+from utils.pagination import encode_cursor
+from tests.helpers import QueryCounter
 
 class TestGamesRoutes(unittest.TestCase):
     # Test data as complete objects
@@ -36,13 +44,16 @@ class TestGamesRoutes(unittest.TestCase):
     
     # API paths
     GAMES_API_PATH: str = '/api/games'
+    
+    # Database the Flask app under test uses
+    DATABASE_URI: str = 'sqlite:///:memory:'
 
     def setUp(self) -> None:
         """Set up test database and seed data"""
         # Create a fresh Flask app for testing
         self.app = Flask(__name__)
         self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = self.DATABASE_URI
         self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
         
         # Register the games blueprint
@@ -103,6 +114,15 @@ class TestGamesRoutes(unittest.TestCase):
         """Helper method to parse response data"""
         return json.loads(response.data)
 
+    def _assert_query_count(self, expected: int, method: str, url: str, **kwargs: Any) -> Response:
+        """Helper method to assert the number of SQL statements a request executes"""
+        with self.app.app_context():
+            engine = db.engine
+        with QueryCounter(engine) as counter:
+            response = self.client.open(url, method=method, **kwargs)
+        self.assertEqual(counter.count, expected, counter.statements)
+        return response
+
     def test_get_games_success(self) -> None:
         """Test successful retrieval of multiple games"""
         # Act
@@ -219,6 +239,541 @@ class TestGamesRoutes(unittest.TestCase):
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]['category']['id'], category_id)
         self.assertEqual(data[0]['publisher']['id'], publisher_id)
+
+
+    def test_get_games_paginated_first_page(self) -> None:
+        """Test that a limit returns one page of games and a cursor for the next"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?limit=1')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), 1)
+        self.assertEqual(data['games'][0]['title'], self.TEST_DATA["games"][0]["title"])
+        self.assertIsNotNone(data['next_cursor'])
+
+    def test_get_games_paginated_follows_cursor(self) -> None:
+        """Test that following next_cursor walks the whole catalog without repeats"""
+        # Act
+        titles = []
+        cursor = None
+        while True:
+            url = f'{self.GAMES_API_PATH}?limit=1' + (f'&cursor={cursor}' if cursor else '')
+            data = self._get_response_data(self.client.get(url))
+            titles.extend(game['title'] for game in data['games'])
+            cursor = data['next_cursor']
+            if cursor is None:
+                break
+        
+        # Assert
+        self.assertEqual(titles, [game["title"] for game in self.TEST_DATA["games"]])
+
+    def test_get_games_paginated_with_filter(self) -> None:
+        """Test that pagination respects the category filter"""
+        # Get the first game to get its category ID
+        response = self.client.get(self.GAMES_API_PATH)
+        games = self._get_response_data(response)
+        category_id = games[0]['category']['id']
+        
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?category_id={category_id}&limit=5')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), 1)
+        self.assertEqual(data['games'][0]['category']['id'], category_id)
+        self.assertIsNone(data['next_cursor'])
+
+    def test_get_games_paginated_invalid_cursor(self) -> None:
+        """Test that a malformed cursor is rejected"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?cursor=not-a-cursor')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['error'], "Invalid cursor")
+
+    def test_get_games_paginated_cursor_out_of_range(self) -> None:
+        """Test that cursors holding integers SQLite cannot bind are rejected"""
+        for query in (
+            f'cursor={encode_cursor([10 ** 23])}',
+            f"sort=rating&cursor={encode_cursor(['rating', 'asc', 10 ** 23, 1])}",
+            f"sort=rating&cursor={encode_cursor(['rating', 'asc', 4.5, -2 ** 63 - 1])}"
+        ):
+            with self.subTest(query=query):
+                # Act
+                response = self.client.get(f'{self.GAMES_API_PATH}?{query}')
+                data = self._get_response_data(response)
+                
+                # Assert
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(data['error'], "Invalid cursor")
+
+    def test_get_games_paginated_invalid_limit(self) -> None:
+        """Test that an out-of-range limit is rejected"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?limit=0')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('limit', data['error'])
+
+    def _add_rated_games(self, ratings: List[Optional[float]]) -> None:
+        """Helper method to add games with the given star ratings"""
+        with self.app.app_context():
+            publisher = db.session.get(Publisher, 1)
+            category = db.session.get(Category, 1)
+            db.session.add_all(
+                Game(
+                    title=f"Rated Game {i}",
+                    description="A game added to test sorting by rating",
+                    publisher=publisher,
+                    category=category,
+                    star_rating=rating
+                )
+                for i, rating in enumerate(ratings)
+            )
+            db.session.commit()
+
+    def test_get_games_sorted_by_rating(self) -> None:
+        """Test that rating sorts are deterministic, with ties broken by id and unrated games lowest"""
+        # Arrange - ids 3 to 6
+        self._add_rated_games([4.5, None, 3.0, None])
+        
+        # Act
+        ascending = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}?sort=rating'))
+        descending = self._get_response_data(
+            self.client.get(f'{self.GAMES_API_PATH}?sort=rating&order=desc')
+        )
+        
+        # Assert
+        self.assertEqual([game['id'] for game in ascending], [4, 6, 5, 2, 1, 3])
+        self.assertEqual([game['id'] for game in descending], [3, 1, 2, 5, 6, 4])
+
+    def test_get_games_sorted_by_title(self) -> None:
+        """Test sorting by title in both directions"""
+        # Act
+        ascending = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}?sort=title'))
+        descending = self._get_response_data(
+            self.client.get(f'{self.GAMES_API_PATH}?sort=title&order=desc')
+        )
+        
+        # Assert
+        self.assertEqual([game['title'] for game in ascending], ["Agile Adventures", "Pipeline Panic"])
+        self.assertEqual([game['title'] for game in descending], ["Pipeline Panic", "Agile Adventures"])
+
+    def test_get_games_top_rated(self) -> None:
+        """Test that top returns only the highest rated games, combined with filters"""
+        # Arrange
+        self._add_rated_games([4.9, 3.0, None])
+        
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?sort=rating&order=desc&top=2')
+        filtered = self._get_response_data(
+            self.client.get(f'{self.GAMES_API_PATH}?sort=rating&order=desc&top=2&publisher_id=2')
+        )
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['starRating'] for game in data], [4.9, 4.5])
+        self.assertEqual([game['title'] for game in filtered], ["Agile Adventures"])
+
+    def test_get_games_sorted_pagination_follows_cursor(self) -> None:
+        """Test that cursors walk a sorted listing with ties and unrated games without repeats"""
+        # Arrange
+        self._add_rated_games([4.5, None, 4.2, None, 4.5, 3.0])
+        
+        for order in ('asc', 'desc'):
+            with self.subTest(order=order):
+                expected = [
+                    game['id'] for game in self._get_response_data(
+                        self.client.get(f'{self.GAMES_API_PATH}?sort=rating&order={order}')
+                    )
+                ]
+                
+                # Act
+                ids = []
+                cursor = None
+                while True:
+                    url = f'{self.GAMES_API_PATH}?sort=rating&order={order}&limit=2'
+                    data = self._get_response_data(self.client.get(url + (f'&cursor={cursor}' if cursor else '')))
+                    ids.extend(game['id'] for game in data['games'])
+                    cursor = data['next_cursor']
+                    if cursor is None:
+                        break
+                
+                # Assert
+                self.assertEqual(ids, expected)
+                self.assertEqual(len(ids), 8)
+
+    def test_get_games_invalid_sort(self) -> None:
+        """Test that unsupported sort parameters and mismatched cursors are rejected"""
+        # Arrange
+        page = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}?sort=rating&limit=1'))
+        
+        # Act
+        bad_sort = self.client.get(f'{self.GAMES_API_PATH}?sort=price')
+        bad_order = self.client.get(f'{self.GAMES_API_PATH}?order=up')
+        bad_top = self.client.get(f'{self.GAMES_API_PATH}?top=0')
+        top_with_limit = self.client.get(f'{self.GAMES_API_PATH}?top=5&limit=5')
+        other_order = self.client.get(
+            f"{self.GAMES_API_PATH}?sort=title&limit=1&cursor={page['next_cursor']}"
+        )
+        
+        # Assert
+        for response in (bad_sort, bad_order, bad_top, top_with_limit, other_order):
+            self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._get_response_data(bad_sort)['error'], "sort must be one of: id, rating, title")
+        self.assertIn('top', self._get_response_data(bad_top)['error'])
+        self.assertEqual(self._get_response_data(other_order)['error'], "Invalid cursor")
+
+
+    def test_get_games_fields(self) -> None:
+        """Test that fields limits each listed game to the requested fields"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?fields=id,title,starRating')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data), len(self.TEST_DATA["games"]))
+        for game, test_game in zip(data, self.TEST_DATA["games"]):
+            self.assertEqual(set(game), {'id', 'title', 'starRating'})
+            self.assertEqual(game['title'], test_game["title"])
+            self.assertEqual(game['starRating'], test_game["star_rating"])
+        
+    def test_get_game_fields(self) -> None:
+        """Test that fields limits a single game to the requested fields"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/1?fields=publisher,category')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data, {
+            'publisher': {'id': 1, 'name': self.TEST_DATA["publishers"][0]["name"]},
+            'category': {'id': 1, 'name': self.TEST_DATA["categories"][0]["name"]}
+        })
+        
+    def test_get_games_fields_with_sorted_pages(self) -> None:
+        """Test that pages sorted by a field left out of fields still chain"""
+        # Act
+        first = self._get_response_data(
+            self.client.get(f'{self.GAMES_API_PATH}?sort=rating&order=desc&limit=1&fields=id')
+        )
+        second = self._get_response_data(self.client.get(
+            f"{self.GAMES_API_PATH}?sort=rating&order=desc&limit=1&fields=id&cursor={first['next_cursor']}"
+        ))
+        
+        # Assert
+        self.assertEqual(first['games'], [{'id': 1}])
+        self.assertEqual(second['games'], [{'id': 2}])
+        self.assertIsNone(second['next_cursor'])
+        
+    def test_get_games_fields_invalid(self) -> None:
+        """Test that unknown or empty fields are rejected"""
+        # Act
+        unknown = self.client.get(f'{self.GAMES_API_PATH}?fields=id,price')
+        empty = self.client.get(f'{self.GAMES_API_PATH}?fields=')
+        detail = self.client.get(f'{self.GAMES_API_PATH}/1?fields=star_rating')
+        
+        # Assert
+        for response in (unknown, empty, detail):
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('id, title, description, publisher, category, starRating',
+                          self._get_response_data(response)['error'])
+        self.assertIn('Unknown fields: price', self._get_response_data(unknown)['error'])
+        self.assertIn('Unknown fields: star_rating', self._get_response_data(detail)['error'])
+        
+    def test_get_games_fields_query_columns(self) -> None:
+        """Test that unrequested columns and joins are left out of the SQL"""
+        # Act
+        sql = str(get_games_projection_query(('id', 'title', 'starRating')))
+        with_publisher = str(get_games_projection_query(('publisher',)))
+        
+        # Assert
+        self.assertNotIn('description', sql)
+        self.assertNotIn('JOIN', sql)
+        self.assertIn('JOIN publishers', with_publisher)
+        self.assertNotIn('categories', with_publisher)
+        
+    def test_get_games_by_ids(self) -> None:
+        """Test looking up games by id in requested order, reporting missing ids"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?ids=2,99,1,2')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['id'] for game in data['games']], [2, 1])
+        self.assertEqual(data['games'][0]['title'], self.TEST_DATA["games"][1]["title"])
+        self.assertEqual(data['games'][0]['publisher']['name'], self.TEST_DATA["publishers"][1]["name"])
+        self.assertEqual(data['missing'], [99])
+        
+    def test_get_games_by_ids_with_fields(self) -> None:
+        """Test that a lookup by ids honours the fields parameter"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?ids=1&fields=title')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(data, {"games": [{"title": self.TEST_DATA["games"][0]["title"]}], "missing": []})
+        
+    def test_get_games_by_ids_invalid(self) -> None:
+        """Test that malformed, oversized and conflicting lookups are rejected"""
+        too_many = ','.join(str(id) for id in range(1, 102))
+        cases = {
+            'ids=abc': "ids must be positive integers",
+            'ids=1,0': "ids must be positive integers",
+            'ids=99999999999999999999999': "ids must be positive integers",
+            'ids=': "ids must list at least one game id",
+            f'ids={too_many}': "ids must list at most 100 games",
+            'ids=1&sort=title&limit=5': "ids cannot be combined with sort, limit"
+        }
+        for query, error in cases.items():
+            with self.subTest(query=query[:20]):
+                # Act
+                response = self.client.get(f'{self.GAMES_API_PATH}?{query}')
+                
+                # Assert
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(self._get_response_data(response)['error'], error)
+        
+    def test_get_games_by_ids_query_count(self) -> None:
+        """Test that a lookup by ids runs a single query for all the games"""
+        # Catalog version lookup, games query
+        response = self._assert_query_count(2, 'GET', f'{self.GAMES_API_PATH}?ids=1,2,3')
+        self.assertEqual(response.status_code, 200)
+        
+    def test_lookup_games(self) -> None:
+        """Test looking up games by id from a POST body"""
+        # Act
+        response = self.client.post(
+            f'{self.GAMES_API_PATH}/lookup?fields=id,starRating',
+            data=json.dumps({"ids": [2, 1, 3]}),
+            content_type='application/json'
+        )
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['games'], [
+            {"id": 2, "starRating": self.TEST_DATA["games"][1]["star_rating"]},
+            {"id": 1, "starRating": self.TEST_DATA["games"][0]["star_rating"]}
+        ])
+        self.assertEqual(data['missing'], [3])
+        
+    def test_lookup_games_invalid(self) -> None:
+        """Test that lookup bodies without a valid ids list are rejected"""
+        cases = [
+            ({"games": [1]}, "Request body must contain an 'ids' list"),
+            ({"ids": "1,2"}, "Request body must contain an 'ids' list"),
+            ({"ids": []}, "ids must list at least one game id"),
+            ({"ids": [1, True]}, "ids must be positive integers"),
+            ({"ids": [1.5]}, "ids must be positive integers"),
+            ({"ids": [2 ** 63]}, "ids must be positive integers")
+        ]
+        for body, error in cases:
+            with self.subTest(body=body):
+                # Act
+                response = self.client.post(
+                    f'{self.GAMES_API_PATH}/lookup',
+                    data=json.dumps(body),
+                    content_type='application/json'
+                )
+                
+                # Assert
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(self._get_response_data(response)['error'], error)
+        
+    def test_get_games_stream_ndjson(self) -> None:
+        """Test streaming games as newline-delimited JSON"""
+        # Act
+        response = self.client.get(self.GAMES_API_PATH, headers={'Accept': 'application/x-ndjson'})
+        lines = response.get_data(as_text=True).splitlines()
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertEqual(len(lines), len(self.TEST_DATA["games"]))
+        for line, test_game in zip(lines, self.TEST_DATA["games"]):
+            self.assertEqual(json.loads(line)['title'], test_game["title"])
+
+    def test_get_games_stream_json_array(self) -> None:
+        """Test that the streamed JSON array matches the regular listing"""
+        # Act
+        expected = self._get_response_data(self.client.get(self.GAMES_API_PATH))
+        response = self.client.get(f'{self.GAMES_API_PATH}?stream=1')
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(self._get_response_data(response), expected)
+
+
+    def test_get_games_query_count(self) -> None:
+        """Test that listing games runs a single query regardless of result size"""
+        # Catalog version lookup, games query
+        response = self._assert_query_count(2, 'GET', self.GAMES_API_PATH)
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_game_by_id_query_count(self) -> None:
+        """Test that fetching one game runs a single query"""
+        # Catalog version lookup, game query
+        response = self._assert_query_count(2, 'GET', f'{self.GAMES_API_PATH}/1')
+        self.assertEqual(response.status_code, 200)
+
+
+    def test_get_games_etag_not_modified(self) -> None:
+        """Test that revalidating with a current ETag returns 304 without querying games"""
+        # Arrange
+        response = self.client.get(self.GAMES_API_PATH)
+        etag = response.headers['ETag']
+        
+        # Act - only the catalog version lookup runs
+        response = self._assert_query_count(
+            1, 'GET', self.GAMES_API_PATH, headers={'If-None-Match': etag}
+        )
+        
+        # Assert
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.data, b'')
+
+    def test_get_game_etag_not_modified(self) -> None:
+        """Test conditional GET on a single game"""
+        # Arrange
+        response = self.client.get(f'{self.GAMES_API_PATH}/1')
+        etag = response.headers['ETag']
+        
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/1', headers={'If-None-Match': etag})
+        
+        # Assert
+        self.assertEqual(response.status_code, 304)
+
+    def test_get_games_etag_varies_by_query(self) -> None:
+        """Test that filtered listings get their own ETag"""
+        # Act
+        unfiltered = self.client.get(self.GAMES_API_PATH)
+        filtered = self.client.get(f'{self.GAMES_API_PATH}?category_id=1')
+        
+        # Assert
+        self.assertNotEqual(unfiltered.headers['ETag'], filtered.headers['ETag'])
+
+    def test_get_games_etag_changes_after_write(self) -> None:
+        """Test that a write invalidates previously issued ETags"""
+        # Arrange
+        response = self.client.get(self.GAMES_API_PATH)
+        etag = response.headers['ETag']
+        self.client.put(
+            f'{self.GAMES_API_PATH}/1',
+            data=json.dumps({"title": "Updated Pipeline Panic"}),
+            content_type='application/json'
+        )
+        
+        # Act
+        response = self.client.get(self.GAMES_API_PATH, headers={'If-None-Match': etag})
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(data[0]['title'], "Updated Pipeline Panic")
+
+    def test_get_game_not_found_has_no_etag(self) -> None:
+        """Test that error responses are not tagged"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/999')
+        
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response.headers)
+
+
+    def test_search_games_by_word(self) -> None:
+        """Test searching games by a word in the title or description"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/search?q=sprints')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['title'] for game in data], ["Agile Adventures"])
+        self.assertIn('publisher', data[0])
+
+    def test_search_games_prefix_match(self) -> None:
+        """Test that every word is matched as a prefix"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/search?q=pipe%20dev')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['title'] for game in data], ["Pipeline Panic"])
+
+    def test_search_games_ranks_title_matches_first(self) -> None:
+        """Test that a title match outranks a description-only match"""
+        # Arrange
+        self.client.post(
+            self.GAMES_API_PATH,
+            data=json.dumps({
+                "title": "Release Train",
+                "description": "Keep the pipeline green until the release train departs",
+                "category_id": 1,
+                "publisher_id": 1
+            }),
+            content_type='application/json'
+        )
+        
+        # Act
+        data = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}/search?q=pipeline'))
+        
+        # Assert
+        self.assertEqual([game['title'] for game in data], ["Pipeline Panic", "Release Train"])
+
+    def test_search_games_with_filter(self) -> None:
+        """Test that search respects the publisher filter"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/search?q=your&publisher_id=2')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['title'] for game in data], ["Agile Adventures"])
+
+    def test_search_games_index_follows_writes(self) -> None:
+        """Test that the search index tracks updates and deletes"""
+        # Act
+        self.client.put(
+            f'{self.GAMES_API_PATH}/1',
+            data=json.dumps({"title": "Kubernetes Kingdom"}),
+            content_type='application/json'
+        )
+        renamed = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}/search?q=kubernetes'))
+        old_title = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}/search?q=panic'))
+        self.client.delete(f'{self.GAMES_API_PATH}/1')
+        deleted = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}/search?q=kubernetes'))
+        
+        # Assert
+        self.assertEqual([game['id'] for game in renamed], [1])
+        self.assertEqual(old_title, [])
+        self.assertEqual(deleted, [])
+
+    def test_search_games_missing_query(self) -> None:
+        """Test that a search without words is rejected"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/search?q=%22*')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['error'], "Search query must contain at least one word")
           
     def test_delete_game_success(self) -> None:
         """Test successful deletion of an existing game"""
@@ -275,6 +830,122 @@ class TestGamesRoutes(unittest.TestCase):
         self.assertEqual(data['starRating'], new_game_data['star_rating'])
         self.assertIn('id', data)
         
+    def test_write_response_matches_get(self) -> None:
+        """Test that create and update respond with the same bytes as a later GET, integer ratings included"""
+        # Arrange
+        new_game_data = {
+            "title": "Code Review Quest",
+            "description": "A collaborative adventure through pull requests and code reviews",
+            "category_id": 1,
+            "publisher_id": 1,
+            "star_rating": 4
+        }
+        
+        # Act
+        created = self.client.post(
+            self.GAMES_API_PATH,
+            data=json.dumps(new_game_data),
+            content_type='application/json'
+        )
+        game_path = f"{self.GAMES_API_PATH}/{self._get_response_data(created)['id']}"
+        created_read = self.client.get(game_path)
+        updated = self.client.put(
+            game_path,
+            data=json.dumps({"star_rating": 3}),
+            content_type='application/json'
+        )
+        updated_read = self.client.get(game_path)
+        
+        # Assert
+        self.assertEqual(created.status_code, 201)
+        self.assertEqual(updated.status_code, 200)
+        self.assertEqual(created.data, created_read.data)
+        self.assertEqual(updated.data, updated_read.data)
+        self.assertEqual(self._get_response_data(created)['starRating'], 4.0)
+        self.assertIn(b'"starRating":3.0', updated.data)
+        
+    def test_create_game_query_count(self) -> None:
+        """Test that creating a game takes an insert and a version bump, without lookups or a re-fetch"""
+        # Arrange - the first write reads the publisher and category names
+        new_game_data = {
+            "title": "Code Review Quest",
+            "description": "A collaborative adventure through pull requests and code reviews",
+            "category_id": 1,
+            "publisher_id": 1
+        }
+        self.client.post(self.GAMES_API_PATH, data=json.dumps(new_game_data), content_type='application/json')
+        
+        # Act - insert returning the game, version bump
+        response = self._assert_query_count(
+            2, 'POST', self.GAMES_API_PATH,
+            data=json.dumps(new_game_data),
+            content_type='application/json'
+        )
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(data['publisher'], {"id": 1, "name": self.TEST_DATA["publishers"][0]["name"]})
+        self.assertEqual(data['category'], {"id": 1, "name": self.TEST_DATA["categories"][0]["name"]})
+        
+    def test_update_game_query_count(self) -> None:
+        """Test that updating a game takes an update and a version bump, plus a read of a moved game's old listing"""
+        # Arrange - the first write reads the publisher and category names
+        self.client.put(f'{self.GAMES_API_PATH}/1', data=json.dumps({"star_rating": 3.0}), content_type='application/json')
+        
+        # Act - update returning the game, version bump
+        response = self._assert_query_count(
+            2, 'PUT', f'{self.GAMES_API_PATH}/1',
+            data=json.dumps({"title": "Updated Pipeline Panic"}),
+            content_type='application/json'
+        )
+        # Old category and publisher, update returning the game, version bump
+        moved = self._assert_query_count(
+            3, 'PUT', f'{self.GAMES_API_PATH}/1',
+            data=json.dumps({"category_id": 2}),
+            content_type='application/json'
+        )
+        
+        # Assert
+        self.assertEqual(self._get_response_data(response)['title'], "Updated Pipeline Panic")
+        self.assertEqual(
+            self._get_response_data(moved)['category'],
+            {"id": 2, "name": self.TEST_DATA["categories"][1]["name"]}
+        )
+        
+    def test_write_after_external_publisher_change(self) -> None:
+        """Test that a write response picks up a publisher renamed by another writer"""
+        # Arrange - warm the names, then rename the publisher outside the API
+        self.client.put(f'{self.GAMES_API_PATH}/1', data=json.dumps({"star_rating": 3.0}), content_type='application/json')
+        with self.app.app_context():
+            db.session.get(Publisher, 1).name = "Renamed Games Inc"
+            bump_catalog_version()
+            db.session.commit()
+        
+        # Act
+        response = self.client.put(
+            f'{self.GAMES_API_PATH}/1',
+            data=json.dumps({"star_rating": 4.0}),
+            content_type='application/json'
+        )
+        
+        # Assert
+        self.assertEqual(self._get_response_data(response)['publisher']['name'], "Renamed Games Inc")
+        
+    def test_create_game_foreign_key_enforced(self) -> None:
+        """Test that the database itself rejects a game whose publisher does not exist"""
+        with self.app.app_context():
+            # Act
+            with self.assertRaises(IntegrityError):
+                db.session.execute(insert(Game).values(
+                    title="Orphaned Game",
+                    description="A game whose publisher does not exist",
+                    category_id=1,
+                    publisher_id=999
+                ))
+            db.session.rollback()
+        
+
     def test_create_game_missing_required_field(self) -> None:
         """Test creation with missing required field"""
         # Arrange - missing title
@@ -417,6 +1088,20 @@ class TestGamesRoutes(unittest.TestCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(data['error'], "Game not found")
         
+    def test_update_game_not_found_without_json_data(self) -> None:
+        """Test that updating a non-existent game is a 404 even without a valid body"""
+        # Act
+        no_body = self.client.put(f'{self.GAMES_API_PATH}/999')
+        invalid = self.client.put(
+            f'{self.GAMES_API_PATH}/999',
+            data=json.dumps({"title": ""}),
+            content_type='application/json'
+        )
+        
+        # Assert
+        self.assertEqual(no_body.status_code, 404)
+        self.assertEqual(invalid.status_code, 404)
+        
     def test_update_game_no_json_data(self) -> None:
         """Test update without JSON data"""
         # Get the first game's ID
@@ -480,5 +1165,66 @@ class TestGamesRoutes(unittest.TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(data['error'], "Category not found")
 
+@unittest.skipUnless(
+    importlib.util.find_spec('quart') and importlib.util.find_spec('aiosqlite'),
+    "quart and aiosqlite are required for the ASGI variant"
+)
+class TestAsyncGamesRoutes(TestGamesRoutes):
+    """Run the games route tests against the ASGI variant of the API"""
+
+    def setUp(self) -> None:
+        """Seed a file database through Flask, then serve it with the async app"""
+        from app_factory import create_async_app
+        from tests.helpers import ASGITestClient
+        
+        # The async engine cannot see a Flask in-memory database
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.DATABASE_URI = f"sqlite:///{os.path.join(self.temp_dir.name, 'test.db')}"
+        super().setUp()
+        
+        self.client = ASGITestClient(create_async_app(self.DATABASE_URI))
+
+    def tearDown(self) -> None:
+        """Shut down the async app before dropping the database"""
+        self.client.close()
+        super().tearDown()
+        self.temp_dir.cleanup()
+
+    @unittest.skip("Statement counts are pinned for the Flask app's engine")
+    def test_get_games_query_count(self) -> None:
+        pass
+
+    @unittest.skip("Statement counts are pinned for the Flask app's engine")
+    def test_get_game_by_id_query_count(self) -> None:
+        pass
+
+    @unittest.skip("Statement counts are pinned for the Flask app's engine")
+    def test_get_games_by_ids_query_count(self) -> None:
+        pass
+
+    @unittest.skip("Statement counts are pinned for the Flask app's engine")
+    def test_create_game_query_count(self) -> None:
+        pass
+
+    @unittest.skip("Statement counts are pinned for the Flask app's engine")
+    def test_update_game_query_count(self) -> None:
+        pass
+
+    @unittest.skip("The ASGI variant does not send ETags")
+    def test_get_games_etag_not_modified(self) -> None:
+        pass
+
+    @unittest.skip("The ASGI variant does not send ETags")
+    def test_get_game_etag_not_modified(self) -> None:
+        pass
+
+    @unittest.skip("The ASGI variant does not send ETags")
+    def test_get_games_etag_varies_by_query(self) -> None:
+        pass
+
+    @unittest.skip("The ASGI variant does not send ETags")
+    def test_get_games_etag_changes_after_write(self) -> None:
+        pass
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,247 @@
+import unittest
+import json
+from typing import Any, Dict
+from flask import Flask, Response
+from models import Game, Publisher, Category, db, init_db
+from routes.games import games_bp
+from routes.games_bulk import games_bulk_bp, MAX_BULK_SIZE
+from tests.helpers import QueryCounter
+
+class TestGamesBulkRoutes(unittest.TestCase):
+    # Test data as complete objects
+    TEST_DATA: Dict[str, Any] = {
+        "publishers": [
+            {"name": "DevGames Inc"},
+            {"name": "Scrum Masters"}
+        ],
+        "categories": [
+            {"name": "Strategy"},
+            {"name": "Card Game"}
+        ],
+        "games": [
+            {
+                "title": "Pipeline Panic",
+                "description": "Build your DevOps pipeline before chaos ensues",
+                "publisher_index": 0,
+                "category_index": 0,
+                "star_rating": 4.5
+            },
+            {
+                "title": "Agile Adventures",
+                "description": "Navigate your team through sprints and releases",
+                "publisher_index": 1,
+                "category_index": 1,
+                "star_rating": 4.2
+            }
+        ]
+    }
+
+    # A valid game for bulk creation
+    NEW_GAME: Dict[str, Any] = {
+        "title": "Code Review Quest",
+        "description": "A collaborative adventure through pull requests and code reviews",
+        "category_id": 1,
+        "publisher_id": 1,
+        "star_rating": 4.8
+    }
+
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+    BULK_API_PATH: str = '/api/games/bulk'
+
+    def setUp(self) -> None:
+        """Set up test database and seed data"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        self.app.register_blueprint(games_bp)
+        self.app.register_blueprint(games_bulk_bp)
+        self.client = self.app.test_client()
+
+        init_db(self.app, testing=True)
+
+        with self.app.app_context():
+            db.create_all()
+            self._seed_test_data()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _seed_test_data(self) -> None:
+        """Helper method to seed test data"""
+        publishers = [Publisher(**data) for data in self.TEST_DATA["publishers"]]
+        categories = [Category(**data) for data in self.TEST_DATA["categories"]]
+        db.session.add_all(publishers + categories)
+        db.session.commit()
+
+        for game_data in self.TEST_DATA["games"]:
+            game_dict = game_data.copy()
+            publisher_index = game_dict.pop("publisher_index")
+            category_index = game_dict.pop("category_index")
+            db.session.add(Game(
+                **game_dict,
+                publisher=publishers[publisher_index],
+                category=categories[category_index]
+            ))
+        db.session.commit()
+
+    def _get_response_data(self, response: Response) -> Any:
+        """Helper method to parse response data"""
+        return json.loads(response.data)
+
+    def _send(self, method: str, body: Any) -> Response:
+        """Helper method to send a JSON body to the bulk endpoint"""
+        return self.client.open(
+            self.BULK_API_PATH,
+            method=method,
+            data=json.dumps(body),
+            content_type='application/json'
+        )
+
+    def test_bulk_create_success(self) -> None:
+        """Test creating several games in one request"""
+        # Arrange
+        games = [
+            {**self.NEW_GAME, "title": f"Code Review Quest {i}"} for i in range(3)
+        ]
+
+        # Act
+        response = self._send('POST', {"games": games})
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['created'], 3)
+        self.assertEqual(data['failed'], 0)
+        self.assertEqual([r['game']['title'] for r in data['results']], [g['title'] for g in games])
+        self.assertEqual(data['results'][0]['game']['publisher']['name'], "DevGames Inc")
+
+        listing = self._get_response_data(self.client.get(self.GAMES_API_PATH))
+        self.assertEqual(len(listing), len(self.TEST_DATA["games"]) + 3)
+
+    def test_bulk_create_reports_invalid_items(self) -> None:
+        """Test that invalid games are reported per item while valid ones are created"""
+        # Arrange
+        games = [
+            self.NEW_GAME,
+            {**self.NEW_GAME, "publisher_id": 999},
+            {**self.NEW_GAME, "category_id": 999},
+            {"description": "A game without a title", "category_id": 1, "publisher_id": 1},
+            {**self.NEW_GAME, "title": "X"}
+        ]
+
+        # Act
+        response = self._send('POST', {"games": games})
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['created'], 1)
+        self.assertEqual(data['failed'], 4)
+        self.assertEqual([r['status'] for r in data['results']], [201, 400, 400, 400, 400])
+        self.assertEqual(data['results'][1]['error'], "Publisher not found")
+        self.assertEqual(data['results'][2]['error'], "Category not found")
+        self.assertEqual(data['results'][3]['error'], "Missing required field: title")
+
+    def test_bulk_create_query_count_is_constant(self) -> None:
+        """Test that the number of queries does not grow with the batch size"""
+        # Arrange
+        games = [{**self.NEW_GAME, "title": f"Bulk Game {i}"} for i in range(50)]
+        with self.app.app_context():
+            engine = db.engine
+        # The first write reads the publishers and categories into the reference cache
+        self._send('POST', {"games": games[:1]})
+
+        # Act - catalog version lookup for the reference check, insert returning the games, version bump
+        with QueryCounter(engine) as counter:
+            response = self._send('POST', {"games": games})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(counter.count, 3, counter.statements)
+
+    def test_bulk_create_invalid_batch(self) -> None:
+        """Test that malformed and oversized batches are rejected"""
+        # Act
+        missing = self.client.post(self.BULK_API_PATH)
+        wrong_shape = self._send('POST', [self.NEW_GAME])
+        too_large = self._send('POST', {"games": [self.NEW_GAME] * (MAX_BULK_SIZE + 1)})
+
+        # Assert
+        self.assertEqual(missing.status_code, 400)
+        self.assertEqual(self._get_response_data(missing)['error'], "No JSON data provided")
+        self.assertEqual(wrong_shape.status_code, 400)
+        self.assertEqual(too_large.status_code, 400)
+
+    def test_bulk_update(self) -> None:
+        """Test updating several games and reporting unknown ids"""
+        # Arrange
+        updates = [
+            {"id": 1, "title": "Updated Pipeline Panic"},
+            {"id": 2, "star_rating": 5.0, "category_id": 1},
+            {"id": 999, "title": "Missing Game"},
+            {"id": 1, "publisher_id": 999}
+        ]
+
+        # Act
+        response = self._send('PATCH', {"games": updates})
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['updated'], 2)
+        self.assertEqual([r['status'] for r in data['results']], [200, 200, 404, 400])
+        self.assertEqual(data['results'][0]['game']['title'], "Updated Pipeline Panic")
+        self.assertEqual(data['results'][1]['game']['starRating'], 5.0)
+        self.assertEqual(data['results'][1]['game']['category']['id'], 1)
+        self.assertEqual(data['results'][3]['error'], "Publisher not found")
+
+        filtered = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}?category_id=1'))
+        self.assertEqual(len(filtered), 2)
+
+    def test_bulk_delete(self) -> None:
+        """Test deleting several games and reporting unknown ids"""
+        # Act
+        response = self._send('DELETE', {"ids": [1, 999]})
+        data = self._get_response_data(response)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['deleted'], 1)
+        self.assertEqual(data['failed'], 1)
+        self.assertEqual(data['results'][1]['error'], "Game not found")
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1').status_code, 404)
+
+    def test_bulk_delete_invalid_ids(self) -> None:
+        """Test that non-integer ids and ids beyond 64 bits are rejected"""
+        for ids in ([1, "two"], [1, 2 ** 63]):
+            with self.subTest(ids=ids):
+                # Act
+                response = self._send('DELETE', {"ids": ids})
+
+                # Assert
+                self.assertEqual(response.status_code, 400)
+
+    def test_bulk_write_ids_out_of_range(self) -> None:
+        """Test that ids beyond 64 bits are reported per item instead of failing the batch"""
+        # Act
+        created = self._get_response_data(self._send('POST', {"games": [
+            {**self.NEW_GAME, "publisher_id": 2 ** 63},
+            {**self.NEW_GAME, "category_id": -2 ** 63 - 1}
+        ]}))
+        updated = self._get_response_data(self._send('PATCH', {"games": [{"id": 2 ** 63, "title": "Too Big"}]}))
+
+        # Assert
+        self.assertEqual([r['status'] for r in created['results']], [400, 400])
+        self.assertEqual(created['results'][0]['error'], "publisher_id must be an integer")
+        self.assertEqual(updated['results'][0]['status'], 400)
+        self.assertEqual(updated['results'][0]['error'], "Each game must have an integer id")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import runpy
+import unittest
+from unittest import mock
+
+# Path of the gunicorn settings file, relative to this test
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'gunicorn.conf.py')
+
+class TestGunicornConfig(unittest.TestCase):
+    def _load(self, **environ: str) -> dict:
+        """Helper method to evaluate the settings file with the given environment"""
+        with mock.patch.dict(os.environ, environ, clear=True):
+            settings = runpy.run_path(CONFIG_PATH)
+            settings['environ'] = dict(os.environ)
+        return settings
+
+    def test_defaults(self) -> None:
+        """Test that the app is preloaded into threaded workers with the production profile"""
+        settings = self._load()
+
+        self.assertTrue(settings['preload_app'])
+        self.assertEqual(settings['worker_class'], 'gthread')
+        self.assertEqual(settings['bind'], '0.0.0.0:5100')
+        self.assertGreaterEqual(settings['workers'], 3)
+        self.assertEqual(settings['max_requests'], 1000)
+        self.assertEqual(settings['max_requests_jitter'], 100)
+        self.assertEqual(settings['environ']['DATABASE_PROFILE'], 'production')
+        self.assertTrue(callable(settings['post_fork']))
+
+    def test_environment_overrides(self) -> None:
+        """Test that worker, thread and recycling settings come from the environment"""
+        settings = self._load(
+            PORT='8000',
+            GUNICORN_WORKERS='3',
+            GUNICORN_THREADS='8',
+            GUNICORN_MAX_REQUESTS='0',
+            DATABASE_PROFILE='default'
+        )
+
+        self.assertEqual(settings['bind'], '0.0.0.0:8000')
+        self.assertEqual(settings['workers'], 3)
+        self.assertEqual(settings['threads'], 8)
+        self.assertEqual(settings['max_requests'], 0)
+        self.assertEqual(settings['environ']['DATABASE_PROFILE'], 'default')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from typing import Any
+from benchmarks.http_benchmark import compare_results, percentile, run_benchmark, summarize
+
+class TestHttpBenchmark(unittest.TestCase):
+    def _result(self, throughput: float, p95: float, p99: float, errors: int = 0) -> dict[str, Any]:
+        """Helper method to build a run with a single scenario"""
+        return {"scenarios": {"games_list": {
+            "requests": 100,
+            "errors": errors,
+            "throughput_rps": throughput,
+            "latency_ms": {"mean": p95 / 2, "p50": p95 / 2, "p95": p95, "p99": p99, "max": p99}
+        }}}
+
+    def test_percentile(self) -> None:
+        """Test nearest-rank percentiles"""
+        values = [float(i) for i in range(1, 101)]
+
+        self.assertEqual(percentile(values, 0.50), 50.0)
+        self.assertEqual(percentile(values, 0.95), 95.0)
+        self.assertEqual(percentile(values, 0.99), 99.0)
+        self.assertEqual(percentile([7.0], 0.99), 7.0)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_summarize(self) -> None:
+        """Test that latencies are reported in milliseconds with throughput"""
+        summary = summarize([0.001, 0.002, 0.003, 0.004], errors=1, elapsed=2.0)
+
+        self.assertEqual(summary['requests'], 5)
+        self.assertEqual(summary['throughput_rps'], 2.0)
+        self.assertEqual(summary['latency_ms']['p50'], 2.0)
+        self.assertEqual(summary['latency_ms']['max'], 4.0)
+
+    def test_compare_results_within_threshold(self) -> None:
+        """Test that changes within the threshold are not regressions"""
+        baseline = self._result(throughput=100, p95=10, p99=20)
+        current = self._result(throughput=85, p95=11.5, p99=23)
+
+        self.assertEqual(compare_results(current, baseline, threshold=0.2), [])
+
+    def test_compare_results_reports_regressions(self) -> None:
+        """Test that throughput drops, latency growth and new errors are reported"""
+        baseline = self._result(throughput=100, p95=10, p99=20)
+        current = self._result(throughput=70, p95=13, p99=30, errors=2)
+
+        regressions = compare_results(current, baseline, threshold=0.2)
+
+        self.assertEqual(len(regressions), 4)
+        self.assertTrue(all(r.startswith('games_list: ') for r in regressions))
+
+    def test_run_benchmark_smoke(self) -> None:
+        """Test a tiny end-to-end run against a real server"""
+        results = run_benchmark(
+            game_count=50, publisher_count=5, category_count=3,
+            requests=8, concurrency=2, warmup=1,
+            scenario_names=['games_by_category', 'game_detail', 'game_create']
+        )
+
+        self.assertEqual(set(results['scenarios']), {'games_by_category', 'game_detail', 'game_create'})
+        for name, summary in results['scenarios'].items():
+            with self.subTest(scenario=name):
+                self.assertEqual(summary['requests'], 8)
+                self.assertEqual(summary['errors'], 0)
+                self.assertGreater(summary['throughput_rps'], 0)
+        self.assertEqual(results['meta']['games'], 50)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,19 @@
+import unittest
+from benchmarks.compression_benchmark import SCENARIOS
+from benchmarks.json_benchmark import ENCODERS, run_benchmark
+
+class TestJSONBenchmark(unittest.TestCase):
+    def test_run_benchmark_smoke(self) -> None:
+        """Test a tiny run and that both encoders produce the same bytes"""
+        results = run_benchmark(game_count=50, publisher_count=5, category_count=3, requests=2)
+
+        self.assertEqual(set(results['scenarios']), {'catalog', *SCENARIOS})
+        for name, by_encoder in results['scenarios'].items():
+            with self.subTest(scenario=name):
+                self.assertTrue(by_encoder['identical'])
+                for encoder in ENCODERS:
+                    self.assertGreater(by_encoder[encoder]['bytes'], 0)
+                self.assertEqual(by_encoder['fast']['bytes'], by_encoder['default']['bytes'])
+
+if __name__ == '__main__':
+    unittest.main()
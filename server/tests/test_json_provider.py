@@ -0,0 +1,186 @@
+import importlib.util
+import json
+import unittest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from models import Game, Publisher, Category, db, init_db
+from routes.games import games_bp
+from utils import json_provider
+from utils.json_provider import FastJSONProvider, init_json
+from utils.profiling import PROFILING_HEADER, init_profiling
+
+class TestJSONProvider(unittest.TestCase):
+    # Test data
+    TEST_GAMES: list[dict] = [
+        {
+            "title": "Pipeline Panic",
+            "description": "Build your DevOps pipeline before chaos ensues",
+            "star_rating": 4.5
+        },
+        {
+            "title": "Café Crunch",
+            "description": "Ship the release before the espresso runs out ☕",
+            "star_rating": None
+        }
+    ]
+
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+
+    def setUp(self) -> None:
+        """Set up test database, seed data and an app using the FastJSONProvider"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.config['PROFILING_TOKEN'] = 'test-token'
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+
+        init_db(self.app, testing=True)
+        init_json(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            publisher = Publisher(name="DevGames Inc")
+            category = Category(name="Strategy")
+            db.session.add_all(
+                Game(publisher=publisher, category=category, **data) for data in self.TEST_GAMES
+            )
+            db.session.commit()
+
+        self.default = DefaultJSONProvider(self.app)
+
+    def tearDown(self) -> None:
+        """Clean up test database"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _default_body(self, obj) -> bytes:
+        """Helper method to encode data as Flask's default provider does in jsonify"""
+        with self.app.app_context():
+            return self.default.response(obj).get_data()
+
+    def test_init_json_installs_provider(self) -> None:
+        """Test that init_json replaces the app's provider"""
+        # Assert
+        self.assertIsInstance(self.app.json, FastJSONProvider)
+
+    def test_init_json_disabled(self) -> None:
+        """Test that FAST_JSON_ENABLED = False keeps Flask's default provider"""
+        # Arrange
+        app = Flask(__name__)
+        app.config['FAST_JSON_ENABLED'] = False
+
+        # Act
+        init_json(app)
+
+        # Assert
+        self.assertNotIsInstance(app.json, FastJSONProvider)
+
+    def test_games_identical_to_default_provider(self) -> None:
+        """Test that the games listing has the same bytes as with the default provider"""
+        # Arrange
+        with self.app.app_context():
+            games = [game.to_dict() for game in db.session.query(Game).order_by(Game.id)]
+
+        # Act
+        response = self.client.get(self.GAMES_API_PATH)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(response.data, self._default_body(games))
+
+    def test_identical_for_values_orjson_cannot_encode(self) -> None:
+        """Test that non-ASCII text, dates, decimals, int keys and big ints match the default provider"""
+        for value in (
+            {"title": "Café Crunch ☕"},
+            {"updated": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "day": date(2024, 1, 2)},
+            {"price": Decimal('19.99')},
+            {10: "ten", 2: "two"},
+            {"big": 2 ** 70}
+        ):
+            with self.subTest(value=value):
+                # Act
+                with self.app.app_context():
+                    body = self.app.json.response(value).get_data()
+
+                # Assert
+                self.assertEqual(body, self._default_body(value))
+
+    @unittest.skipUnless(importlib.util.find_spec('orjson'), "orjson is not installed")
+    def test_non_ascii_encoded_once(self) -> None:
+        """Test that non-ASCII bodies are escaped from orjson's output without encoding them again"""
+        # Arrange
+        value = {"title": "Café Crunch ☕ 🎲", "description": "Tab\t, DEL\x7f, \\xe9 and \"quotes\" 🎲"}
+        expected = self._default_body(value)
+
+        # Act
+        with patch.object(DefaultJSONProvider, 'dumps', side_effect=AssertionError("stdlib used")), \
+                self.app.app_context():
+            body = self.app.json.response(value).get_data()
+
+        # Assert
+        self.assertEqual(body, expected)
+        self.assertTrue(body.isascii())
+
+    def test_identical_without_orjson(self) -> None:
+        """Test that the stdlib fallback produces the same bytes"""
+        # Arrange
+        value = {"title": "Pipeline Panic", "starRating": 4.5, "publisher": None}
+
+        # Act
+        with patch.object(json_provider, 'orjson', None), self.app.app_context():
+            body = self.app.json.response(value).get_data()
+
+        # Assert
+        self.assertEqual(body, self._default_body(value))
+
+    def test_not_pretty_printed_in_debug(self) -> None:
+        """Test that responses stay compact in debug mode"""
+        # Arrange
+        self.app.debug = True
+
+        # Act
+        with self.app.app_context():
+            body = self.app.json.response({"b": 1, "a": [1, 2]}).get_data()
+
+        # Assert
+        self.assertEqual(body, b'{"a":[1,2],"b":1}\n')
+
+    def test_dumps_returns_str(self) -> None:
+        """Test that dumps still returns a string, as streamed responses expect"""
+        # Act
+        text = self.app.json.dumps({"b": 1, "a": "é"})
+
+        # Assert
+        self.assertEqual(text, '{"a":"\\u00e9","b":1}')
+        self.assertEqual(json.loads(text), {"a": "é", "b": 1})
+        self.assertEqual(self.app.json.dumps({"a": 1}, indent=2), '{\n  "a": 1\n}')
+
+    def test_profiling_times_serialization(self) -> None:
+        """Test that profiled requests still report serialization time"""
+        # Arrange
+        init_profiling(self.app)
+
+        # Act
+        response = self.client.get(self.GAMES_API_PATH, headers={PROFILING_HEADER: 'test-token'})
+
+        # Assert
+        self.assertIsInstance(self.app.json, FastJSONProvider)
+        self.assertIn('serialize;dur=', response.headers['Server-Timing'])
+
+    @unittest.skipUnless(importlib.util.find_spec('orjson'), "orjson is not installed")
+    def test_uses_orjson(self) -> None:
+        """Test that orjson encodes the responses when it is installed"""
+        # Assert
+        self.assertEqual(json_provider.json_encoder_name(), 'orjson')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from flask import Flask
+from models import Game, Publisher, Category, db, init_db
+from routes.games import games_bp
+from utils.metrics import PROMETHEUS_MIMETYPE, init_metrics
+
+class TestMetrics(unittest.TestCase):
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+    METRICS_PATH: str = '/metrics'
+
+    def setUp(self) -> None:
+        """Set up test database, seed data and metrics"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+
+        init_db(self.app, testing=True)
+        init_metrics(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            publisher = Publisher(name="DevGames Inc")
+            category = Category(name="Strategy")
+            db.session.add(Game(
+                title="Pipeline Panic",
+                description="Build your DevOps pipeline before chaos ensues",
+                publisher=publisher,
+                category=category,
+                star_rating=4.5
+            ))
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _scrape(self) -> dict[str, float]:
+        """Helper method to fetch /metrics and parse its samples"""
+        response = self.client.get(self.METRICS_PATH)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content_type, PROMETHEUS_MIMETYPE)
+        samples = {}
+        for line in response.get_data(as_text=True).splitlines():
+            if line and not line.startswith('#'):
+                name, value = line.rsplit(' ', 1)
+                samples[name] = float(value)
+        return samples
+
+    def test_request_metrics(self) -> None:
+        """Test that latency, status codes and SQL usage are recorded per endpoint"""
+        # Arrange
+        listing = 'endpoint="games.get_games",method="GET"'
+        detail = 'endpoint="games.get_game",method="GET"'
+
+        # Act
+        self.client.get(self.GAMES_API_PATH)
+        self.client.get(self.GAMES_API_PATH)
+        self.client.get(f'{self.GAMES_API_PATH}/999')
+        samples = self._scrape()
+
+        # Assert
+        self.assertEqual(samples[f'http_requests_total{{{listing},status="200"}}'], 2)
+        self.assertEqual(samples[f'http_requests_total{{{detail},status="404"}}'], 1)
+        self.assertEqual(samples[f'http_request_duration_seconds_count{{{listing}}}'], 2)
+        self.assertEqual(samples[f'http_request_duration_seconds_bucket{{{listing},le="+Inf"}}'], 2)
+        self.assertGreater(samples[f'http_request_duration_seconds_sum{{{listing}}}'], 0)
+        # The first listing queries version and games; the second is served from the response cache
+        self.assertEqual(samples[f'db_statements_per_request_sum{{{listing}}}'], 3)
+        self.assertEqual(samples[f'db_statements_per_request_bucket{{{listing},le="1"}}'], 1)
+        self.assertEqual(samples['http_requests_in_flight{endpoint="games.get_games"}'], 0)
+        self.assertEqual(samples['http_requests_in_flight{endpoint="metrics"}'], 1)
+        self.assertEqual(samples['response_cache_hits_total'], 1)
+
+    def test_unmatched_requests_share_a_label(self) -> None:
+        """Test that unknown paths do not create a series per path"""
+        # Act
+        self.client.get('/no/such/path')
+        self.client.get('/another/missing/path')
+        samples = self._scrape()
+
+        # Assert
+        self.assertEqual(
+            samples['http_requests_total{endpoint="<unmatched>",method="GET",status="404"}'], 2
+        )
+
+    def test_metrics_disabled(self) -> None:
+        """Test that METRICS_ENABLED=False registers nothing"""
+        # Arrange
+        app = Flask(__name__)
+        app.config['METRICS_ENABLED'] = False
+
+        # Act
+        metrics = init_metrics(app)
+
+        # Assert
+        self.assertIsNone(metrics)
+        self.assertEqual(app.test_client().get(self.METRICS_PATH).status_code, 404)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import logging
+import unittest
+from flask import Flask
+from models import Game, Publisher, Category, db, init_db
+from routes.games import games_bp
+from utils.profiling import PROFILING_HEADER, init_profiling, slow_query_logger
+
+class TestProfiling(unittest.TestCase):
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+    PROFILING_TOKEN: str = 'test-token'
+
+    def _create_app(self, **config) -> Flask:
+        """Helper method to create an app with profiling and seed data"""
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        app.config['PROFILING_TOKEN'] = self.PROFILING_TOKEN
+        app.config.update(config)
+        app.register_blueprint(games_bp)
+
+        init_db(app, testing=True)
+        init_profiling(app)
+
+        with app.app_context():
+            db.create_all()
+            db.session.add(Game(
+                title="Pipeline Panic",
+                description="Build your DevOps pipeline before chaos ensues",
+                publisher=Publisher(name="DevGames Inc"),
+                category=Category(name="Strategy"),
+                star_rating=4.5
+            ))
+            db.session.commit()
+        self.apps.append(app)
+        return app
+
+    def setUp(self) -> None:
+        """Set up the list of apps to clean up and silence slow queries from seeding"""
+        self.apps: list[Flask] = []
+        self.null_handler = logging.NullHandler()
+        slow_query_logger.addHandler(self.null_handler)
+
+    def tearDown(self) -> None:
+        """Clean up test databases and ensure proper connection closure"""
+        for app in self.apps:
+            with app.app_context():
+                db.session.remove()
+                db.drop_all()
+                db.engine.dispose()
+        slow_query_logger.removeHandler(self.null_handler)
+
+    def _timings(self, header: str) -> dict[str, str]:
+        """Helper method to parse a Server-Timing header into name -> parameters"""
+        return {
+            entry.split(';', 1)[0].strip(): entry.split(';', 1)[1]
+            for entry in header.split(',')
+        }
+
+    def test_server_timing_with_trusted_header(self) -> None:
+        """Test that a request carrying the profiling token gets a Server-Timing header"""
+        # Arrange
+        client = self._create_app().test_client()
+
+        # Act
+        response = client.get(self.GAMES_API_PATH, headers={PROFILING_HEADER: self.PROFILING_TOKEN})
+        timings = self._timings(response.headers['Server-Timing'])
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(timings), {'db', 'serialize', 'app', 'total'})
+        # Catalog version lookup, games query
+        self.assertIn('desc="2 queries"', timings['db'])
+
+    def test_no_server_timing_without_trusted_header(self) -> None:
+        """Test that profiling stays off for requests without the right token"""
+        # Arrange
+        client = self._create_app().test_client()
+
+        # Act
+        plain = client.get(self.GAMES_API_PATH)
+        wrong_token = client.get(self.GAMES_API_PATH, headers={PROFILING_HEADER: 'guess'})
+
+        # Assert
+        self.assertNotIn('Server-Timing', plain.headers)
+        self.assertNotIn('Server-Timing', wrong_token.headers)
+
+    def test_profiling_enabled_by_config(self) -> None:
+        """Test that PROFILING_ENABLED profiles every request"""
+        # Arrange
+        client = self._create_app(PROFILING_ENABLED=True).test_client()
+
+        # Act
+        response = client.get(f'{self.GAMES_API_PATH}/1')
+
+        # Assert
+        self.assertIn('Server-Timing', response.headers)
+
+    def test_slow_query_log(self) -> None:
+        """Test that statements over the threshold are logged with parameters and plan"""
+        # Arrange
+        client = self._create_app(SLOW_QUERY_THRESHOLD_MS=0).test_client()
+
+        # Act
+        with self.assertLogs('tailspin.slow_queries', level='WARNING') as logs:
+            client.get(f'{self.GAMES_API_PATH}?category_id=1')
+
+        # Assert
+        games_query = next(line for line in logs.output if 'FROM games' in line)
+        self.assertIn('parameters: (1,)', games_query)
+        self.assertIn('SEARCH games USING INDEX', games_query)
+
+    def test_slow_query_log_disabled(self) -> None:
+        """Test that a threshold of None turns the slow-query log off"""
+        # Arrange
+        client = self._create_app(SLOW_QUERY_THRESHOLD_MS=None).test_client()
+
+        # Act / Assert
+        with self.assertNoLogs('tailspin.slow_queries'):
+            client.get(self.GAMES_API_PATH)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,13 @@
+import importlib.util
+import os
+import tempfile
 import unittest
 import json
 from flask import Flask
-from models import Publisher, db, init_db
+from sqlalchemy.orm import undefer
+from models import Publisher, Category, Game, db, init_db
 from routes.publishers import publishers_bp
+from tests.helpers import QueryCounter
 
 class TestPublishersRoutes(unittest.TestCase):
     # Test data
@@ -13,12 +18,15 @@ class TestPublishersRoutes(unittest.TestCase):
     
     # API paths
     PUBLISHERS_API_PATH = '/api/publishers'
+    
+    # Database the Flask app under test uses
+    DATABASE_URI = 'sqlite:///:memory:'
 
     def setUp(self) -> None:
         """Set up test database and seed data"""
         self.app = Flask(__name__)
         self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = self.DATABASE_URI
         self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
         
         self.app.register_blueprint(publishers_bp)
@@ -66,6 +74,101 @@ class TestPublishersRoutes(unittest.TestCase):
         required_fields = ['id', 'name']
         for field in required_fields:
             self.assertIn(field, data[0])
+        self.assertEqual(set(data[0]), set(required_fields))
+
+    def test_get_publishers_query_count(self) -> None:
+        """Test that publishers are read once, then served from the reference cache"""
+        with self.app.app_context():
+            engine = db.engine
+        with QueryCounter(engine) as first:
+            self.client.get(self.PUBLISHERS_API_PATH)
+        with QueryCounter(engine) as counter:
+            response = self.client.get(self.PUBLISHERS_API_PATH)
+        
+        # Catalog version lookup, publishers and categories queries
+        self.assertEqual(first.count, 3, first.statements)
+        # Catalog version lookup only
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(counter.count, 1, counter.statements)
+
+    def test_get_publishers_etag_not_modified(self) -> None:
+        """Test that revalidating with a current ETag returns 304"""
+        response = self.client.get(self.PUBLISHERS_API_PATH)
+        etag = response.headers['ETag']
+        
+        response = self.client.get(self.PUBLISHERS_API_PATH, headers={'If-None-Match': etag})
+        
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+
+    def test_publisher_game_count(self) -> None:
+        """Test that game_count is computed with a single aggregate query"""
+        with self.app.app_context():
+            category = Category(name="Strategy")
+            publisher = db.session.query(Publisher).first()
+            db.session.add(Game(
+                title="Pipeline Panic",
+                description="Build your DevOps pipeline before chaos ensues",
+                publisher=publisher,
+                category=category
+            ))
+            db.session.commit()
+            db.session.expunge_all()
+            
+            with QueryCounter(db.engine) as counter:
+                publishers = db.session.query(Publisher).options(
+                    undefer(Publisher.game_count)
+                ).order_by(Publisher.id).all()
+                counts = [p.to_dict()['game_count'] for p in publishers]
+        
+        self.assertEqual(counts, [1, 0])
+        self.assertEqual(counter.count, 1, counter.statements)
+
+    def test_publisher_to_dict_without_undefer(self) -> None:
+        """Test that to_dict does not load the deferred game_count row by row"""
+        with self.app.app_context():
+            db.session.expunge_all()
+            
+            with QueryCounter(db.engine) as counter:
+                publishers = db.session.query(Publisher).order_by(Publisher.id).all()
+                data = [p.to_dict() for p in publishers]
+        
+        self.assertEqual([p['name'] for p in data], [p['name'] for p in self.TEST_PUBLISHERS])
+        self.assertTrue(all('game_count' not in p for p in data))
+        self.assertEqual(counter.count, 1, counter.statements)
+
+@unittest.skipUnless(
+    importlib.util.find_spec('quart') and importlib.util.find_spec('aiosqlite'),
+    "quart and aiosqlite are required for the ASGI variant"
+)
+class TestAsyncPublishersRoutes(TestPublishersRoutes):
+    """Run the publishers route tests against the ASGI variant of the API"""
+
+    def setUp(self) -> None:
+        """Seed a file database through Flask, then serve it with the async app"""
+        from app_factory import create_async_app
+        from tests.helpers import ASGITestClient
+        
+        # The async engine cannot see a Flask in-memory database
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.DATABASE_URI = f"sqlite:///{os.path.join(self.temp_dir.name, 'test.db')}"
+        super().setUp()
+        
+        self.client = ASGITestClient(create_async_app(self.DATABASE_URI))
+
+    def tearDown(self) -> None:
+        """Shut down the async app before dropping the database"""
+        self.client.close()
+        super().tearDown()
+        self.temp_dir.cleanup()
+
+    @unittest.skip("Statement counts are pinned for the Flask app's engine")
+    def test_get_publishers_query_count(self) -> None:
+        pass
+
+    @unittest.skip("The ASGI variant does not send ETags")
+    def test_get_publishers_etag_not_modified(self) -> None:
+        pass
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from flask import Flask
+from models import Game, db, init_db
+from routes.game_changes import get_changes_query
+from routes.games import get_games_base_query, get_games_projection_query, get_games_search_query, _apply_game_sort
+from utils.query_plan import explain_query_plan, find_full_table_scans
+
+class TestGameQueryPlans(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up an empty test database; plans depend on the schema, not the data"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        init_db(self.app, testing=True)
+
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _assert_no_full_scans(self, name: str, statement) -> None:
+        """Helper method to fail if a statement's plan scans a whole table"""
+        plan = explain_query_plan(db.session.connection(), statement)
+        self.assertEqual(find_full_table_scans(plan), [], f"{name}: {plan}")
+
+    def _filtered_queries(self, base_query) -> dict:
+        """Helper method to build every filtered variant of a games query"""
+        return {
+            'by id': base_query.filter(Game.id == 1),
+            'by category': base_query.filter(Game.category_id == 1),
+            'by publisher': base_query.filter(Game.publisher_id == 1),
+            'by category and publisher': base_query.filter(
+                Game.category_id == 1, Game.publisher_id == 1
+            ),
+            'page after cursor': base_query.filter(Game.id > 100).order_by(Game.id).limit(20)
+        }
+
+    def test_base_query_uses_indexes(self) -> None:
+        """Test that filtered ORM queries avoid full table scans"""
+        with self.app.app_context():
+            for name, query in self._filtered_queries(get_games_base_query()).items():
+                with self.subTest(name=name):
+                    self._assert_no_full_scans(name, query)
+
+    def test_projection_query_uses_indexes(self) -> None:
+        """Test that filtered projected queries avoid full table scans"""
+        with self.app.app_context():
+            for name, query in self._filtered_queries(get_games_projection_query()).items():
+                with self.subTest(name=name):
+                    self._assert_no_full_scans(name, query)
+
+    def test_rating_sort_uses_index_order(self) -> None:
+        """Test that top-rated queries read an index in order instead of sorting"""
+        with self.app.app_context():
+            for descending in (False, True):
+                query = _apply_game_sort(get_games_projection_query(), 'rating', descending)
+                for name, filtered in self._filtered_queries(query).items():
+                    if name == 'page after cursor':
+                        continue
+                    with self.subTest(name=name, descending=descending):
+                        plan = explain_query_plan(db.session.connection(), filtered.limit(10))
+                        self.assertFalse(any('TEMP B-TREE' in step for step in plan), plan)
+                        self.assertEqual(find_full_table_scans(plan), [], plan)
+
+    def test_search_query_uses_full_text_index(self) -> None:
+        """Test that search is driven by the FTS index rather than a scan of games"""
+        with self.app.app_context():
+            query = get_games_search_query('"pipe"*').filter(Game.category_id == 1).limit(20)
+            plan = explain_query_plan(db.session.connection(), query)
+
+        self.assertEqual(find_full_table_scans(plan), [], plan)
+        self.assertTrue(plan[0].startswith('SCAN games_fts VIRTUAL TABLE'), plan)
+
+    def test_changes_query_uses_indexes(self) -> None:
+        """Test that the change feed seeks from since and finds later changes by index"""
+        with self.app.app_context():
+            query = get_changes_query(100).limit(21)
+            self._assert_no_full_scans('changes', query)
+            plan = explain_query_plan(db.session.connection(), query)
+            self.assertTrue(any('ix_game_changes_game_id_seq' in step for step in plan), plan)
+
+    def test_full_scan_detection(self) -> None:
+        """Test that an unindexed filter is reported as a full table scan"""
+        with self.app.app_context():
+            plan = explain_query_plan(
+                db.session.connection(),
+                get_games_base_query().filter(Game.description == 'x')
+            )
+
+        self.assertEqual(find_full_table_scans(plan), ['SCAN games'])
+
+if __name__ == '__main__':
+    unittest.main()
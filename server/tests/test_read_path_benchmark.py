@@ -0,0 +1,15 @@
+import unittest
+from benchmarks.read_path_benchmark import READ_PATHS, run_benchmark
+
+class TestReadPathBenchmark(unittest.TestCase):
+    def test_run_benchmark_smoke(self) -> None:
+        """Test a tiny run and that both read paths produce the same output"""
+        results = run_benchmark(game_count=50, publisher_count=5, category_count=3, runs=1)
+
+        self.assertEqual(set(results['read_paths']), set(READ_PATHS))
+        self.assertTrue(results['identical'])
+        for timing in results['read_paths'].values():
+            self.assertGreater(timing['ms'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# Equivalence of the games read paths.
+# Runs against a larger in-memory catalog than the functional tests and checks
+# that the column-projected path serializes exactly like the ORM path it
+# replaced. Their timings are compared by benchmarks/read_path_benchmark.py.
+import unittest
+from flask import Flask
+from sqlalchemy import insert
+from models import Game, Publisher, Category, db, init_db
+from routes.games import games_bp
+from benchmarks.read_path_benchmark import orm_read, projected_read
+
+class TestReadPaths(unittest.TestCase):
+    # Size of the seeded catalog
+    GAME_COUNT: int = 2000
+    PUBLISHER_COUNT: int = 50
+    CATEGORY_COUNT: int = 10
+
+    def setUp(self) -> None:
+        """Set up test database and seed a larger catalog"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+
+        init_db(self.app, testing=True)
+
+        with self.app.app_context():
+            db.create_all()
+            self._seed_test_data()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _seed_test_data(self) -> None:
+        """Helper method to bulk insert the benchmark catalog"""
+        db.session.execute(insert(Publisher), [
+            {"id": i, "name": f"Publisher {i}", "description": f"Publisher number {i}"}
+            for i in range(1, self.PUBLISHER_COUNT + 1)
+        ])
+        db.session.execute(insert(Category), [
+            {"id": i, "name": f"Category {i}", "description": f"Category number {i}"}
+            for i in range(1, self.CATEGORY_COUNT + 1)
+        ])
+        db.session.execute(insert(Game), [
+            {
+                "title": f"Game {i}",
+                "description": f"Description of game {i}. " * 10,
+                "star_rating": round(3.0 + (i % 20) / 10, 1),
+                "publisher_id": i % self.PUBLISHER_COUNT + 1,
+                "category_id": i % self.CATEGORY_COUNT + 1
+            }
+            for i in range(self.GAME_COUNT)
+        ])
+        db.session.commit()
+
+    def test_projected_read_matches_orm_read(self) -> None:
+        """Test that the projected path serializes identically to to_dict"""
+        with self.app.app_context():
+            self.assertEqual(projected_read(), orm_read())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,226 @@
+import json
+import os
+import tempfile
+import unittest
+from flask import Flask
+from models import Game, Publisher, Category, db, init_db
+from routes.games import games_bp
+from routes.games_bulk import games_bulk_bp
+from routes.publishers import publishers_bp
+from utils.catalog_version import get_catalog_version
+from utils.reference_cache import get_reference_cache, init_reference_cache
+from tests.helpers import QueryCounter
+
+class TestReferenceCache(unittest.TestCase):
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+    PUBLISHERS_API_PATH: str = '/api/publishers'
+
+    def setUp(self) -> None:
+        """Set up test database, seed data and a warm reference cache"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        self.app.register_blueprint(games_bp)
+        self.app.register_blueprint(games_bulk_bp)
+        self.app.register_blueprint(publishers_bp)
+        self.client = self.app.test_client()
+
+        init_db(self.app, testing=True)
+
+        with self.app.app_context():
+            db.create_all()
+            publisher = Publisher(name="DevGames Inc")
+            category = Category(name="Strategy")
+            db.session.add(Game(
+                title="Pipeline Panic",
+                description="Build your DevOps pipeline before chaos ensues",
+                publisher=publisher,
+                category=category,
+                star_rating=4.5
+            ))
+            db.session.commit()
+
+        init_reference_cache(self.app)
+        self.cache = get_reference_cache(self.app)
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _publisher_names(self) -> list[str]:
+        """Helper method to list the publisher names the API returns"""
+        response = self.client.get(self.PUBLISHERS_API_PATH)
+        self.assertEqual(response.status_code, 200)
+        return [publisher['name'] for publisher in json.loads(response.data)]
+
+    def _create_game(self, **overrides) -> dict:
+        """Helper method to create a game through the API"""
+        response = self.client.post(self.GAMES_API_PATH, data=json.dumps({
+            "title": "Code Review Quest",
+            "description": "A collaborative adventure through pull requests",
+            "category_id": 1,
+            "publisher_id": 1,
+            **overrides
+        }), content_type='application/json')
+        return json.loads(response.data)
+
+    def _bulk_create_game(self, client, **overrides) -> dict:
+        """Helper method to create a game through the bulk API"""
+        response = client.post('/api/games/bulk', data=json.dumps({"games": [{
+            "title": "Sprint Planner",
+            "description": "Fit the backlog into a two-week sprint",
+            "category_id": 1,
+            "publisher_id": 1,
+            **overrides
+        }]}), content_type='application/json')
+        return json.loads(response.data)
+
+    def _file_app(self, uri: str) -> Flask:
+        """Helper method to create an app with a warm reference cache on a file database"""
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        app.config['SQLALCHEMY_DATABASE_URI'] = uri
+        app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        app.register_blueprint(games_bp)
+        app.register_blueprint(games_bulk_bp)
+        app.register_blueprint(publishers_bp)
+        init_db(app, testing=True)
+        init_reference_cache(app)
+        return app
+
+    def test_warm_at_startup(self) -> None:
+        """Test that a warmed cache serves the first request without reading publishers"""
+        # Arrange
+        with self.app.app_context():
+            engine = db.engine
+
+        # Act
+        with QueryCounter(engine) as counter:
+            names = self._publisher_names()
+
+        # Assert
+        self.assertEqual(names, ["DevGames Inc"])
+        self.assertEqual(counter.count, 1, counter.statements)
+        self.assertEqual(self.cache.loads, 1)
+
+    def test_game_writes_keep_cache(self) -> None:
+        """Test that game writes of this process do not reload the cache"""
+        # Act
+        created = self._create_game()
+        self.client.put(
+            f"{self.GAMES_API_PATH}/{created['id']}",
+            data=json.dumps({"title": "Merge Conflict Mayhem"}),
+            content_type='application/json'
+        )
+        self.client.delete(f"{self.GAMES_API_PATH}/{created['id']}")
+        self._publisher_names()
+
+        # Assert
+        self.assertEqual(created['publisher']['name'], "DevGames Inc")
+        self.assertEqual(self.cache.loads, 1)
+
+    def test_reference_writes_bump_catalog_version(self) -> None:
+        """Test that inserting, updating and deleting publishers and categories bumps the catalog version"""
+        for statement in (
+            "INSERT INTO publishers (name) VALUES ('Scrum Masters')",
+            "UPDATE publishers SET description = 'Agile games' WHERE id = 2",
+            "DELETE FROM publishers WHERE id = 2",
+            "INSERT INTO categories (name) VALUES ('Card Game')",
+            "UPDATE categories SET name = 'Card Games' WHERE id = 2",
+            "DELETE FROM categories WHERE id = 2"
+        ):
+            with self.subTest(statement=statement):
+                # Arrange
+                with self.app.app_context():
+                    before = get_catalog_version()
+
+                    # Act
+                    with db.engine.begin() as connection:
+                        connection.exec_driver_sql(statement)
+                    db.session.commit()
+
+                    # Assert
+                    self.assertEqual(get_catalog_version(), before + 1)
+
+    def test_orm_change_reloads_cache(self) -> None:
+        """Test that a publisher added through the ORM is seen by listings and game writes"""
+        # Act
+        with self.app.app_context():
+            db.session.add(Publisher(name="Scrum Masters"))
+            db.session.commit()
+        created = self._create_game(publisher_id=2)
+        bulk = self._bulk_create_game(self.client, publisher_id=2)
+
+        # Assert
+        self.assertEqual(created['publisher'], {"id": 2, "name": "Scrum Masters"})
+        self.assertEqual(bulk['results'][0]['game']['publisher']['name'], "Scrum Masters")
+        self.assertEqual(self._publisher_names(), ["DevGames Inc", "Scrum Masters"])
+
+    def test_change_in_another_app_reloads_cache(self) -> None:
+        """Test that a publisher added by another app on the same database is seen by this one"""
+        # Arrange - two apps, as two worker processes, sharing a file database
+        with tempfile.TemporaryDirectory() as temp_dir:
+            uri = f"sqlite:///{os.path.join(temp_dir, 'test.db')}"
+            writer, reader = self._file_app(uri), self._file_app(uri)
+            try:
+                with writer.app_context():
+                    db.session.add_all([Publisher(name="DevGames Inc"), Category(name="Strategy")])
+                    db.session.commit()
+                client = reader.test_client()
+                client.get(self.PUBLISHERS_API_PATH)
+
+                # Act
+                with writer.app_context():
+                    db.session.add(Publisher(name="Scrum Masters"))
+                    db.session.commit()
+                publishers = json.loads(client.get(self.PUBLISHERS_API_PATH).data)
+                bulk = self._bulk_create_game(client, publisher_id=2)
+                created = json.loads(client.post(self.GAMES_API_PATH, data=json.dumps({
+                    "title": "Code Review Quest",
+                    "description": "A collaborative adventure through pull requests",
+                    "category_id": 1,
+                    "publisher_id": 2
+                }), content_type='application/json').data)
+            finally:
+                for app in (writer, reader):
+                    with app.app_context():
+                        db.session.remove()
+                        db.engine.dispose()
+
+        # Assert
+        self.assertEqual([p['name'] for p in publishers], ["DevGames Inc", "Scrum Masters"])
+        self.assertEqual(bulk['results'][0]['game']['publisher']['name'], "Scrum Masters")
+        self.assertEqual(created['publisher'], {"id": 2, "name": "Scrum Masters"})
+
+    def test_external_change_reloads_cache(self) -> None:
+        """Test that a write by another process, seen as a catalog version change, reloads the cache"""
+        # Arrange - write through Core, as another process would
+        with self.app.app_context():
+            with db.engine.begin() as connection:
+                connection.exec_driver_sql("UPDATE publishers SET name = 'Renamed Games Inc' WHERE id = 1")
+
+        # Act
+        names = self._publisher_names()
+
+        # Assert
+        self.assertEqual(names, ["Renamed Games Inc"])
+        self.assertEqual(self.cache.loads, 2)
+
+    def test_unknown_references_rejected(self) -> None:
+        """Test that writes referencing unknown publishers or categories get the usual errors"""
+        # Act
+        publisher = self._create_game(publisher_id=99)
+        category = self._create_game(category_id=99)
+
+        # Assert
+        self.assertEqual(publisher['error'], "Publisher not found")
+        self.assertEqual(category['error'], "Category not found")
+
+if __name__ == '__main__':
+    unittest.main()
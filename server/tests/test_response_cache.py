@@ -0,0 +1,259 @@
+import unittest
+import json
+from typing import Any, Dict
+from flask import Flask, Response
+from models import Game, Publisher, Category, db, init_db
+from routes.games import games_bp
+from utils.catalog_version import bump_catalog_version
+from utils.response_cache import get_response_cache
+from tests.helpers import QueryCounter
+
+class TestResponseCache(unittest.TestCase):
+    # Test data as complete objects
+    TEST_DATA: Dict[str, Any] = {
+        "publishers": [
+            {"name": "DevGames Inc"},
+            {"name": "Scrum Masters"}
+        ],
+        "categories": [
+            {"name": "Strategy"},
+            {"name": "Card Game"}
+        ],
+        "games": [
+            {
+                "title": "Pipeline Panic",
+                "description": "Build your DevOps pipeline before chaos ensues",
+                "publisher_index": 0,
+                "category_index": 0,
+                "star_rating": 4.5
+            },
+            {
+                "title": "Agile Adventures",
+                "description": "Navigate your team through sprints and releases",
+                "publisher_index": 1,
+                "category_index": 1,
+                "star_rating": 4.2
+            }
+        ]
+    }
+
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+
+    def setUp(self) -> None:
+        """Set up test database and seed data"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+
+        init_db(self.app, testing=True)
+
+        with self.app.app_context():
+            db.create_all()
+            self._seed_test_data()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _seed_test_data(self) -> None:
+        """Helper method to seed test data"""
+        publishers = [Publisher(**data) for data in self.TEST_DATA["publishers"]]
+        categories = [Category(**data) for data in self.TEST_DATA["categories"]]
+        db.session.add_all(publishers + categories)
+        db.session.commit()
+
+        for game_data in self.TEST_DATA["games"]:
+            game_dict = game_data.copy()
+            publisher_index = game_dict.pop("publisher_index")
+            category_index = game_dict.pop("category_index")
+            db.session.add(Game(
+                **game_dict,
+                publisher=publishers[publisher_index],
+                category=categories[category_index]
+            ))
+        db.session.commit()
+
+    def _get_response_data(self, response: Response) -> Any:
+        """Helper method to parse response data"""
+        return json.loads(response.data)
+
+    def _stats(self) -> dict[str, int]:
+        """Helper method to read the app's cache counters"""
+        return get_response_cache(self.app).stats()
+
+    def _update_game(self, game_id: int, data: dict[str, Any]) -> Response:
+        """Helper method to update a game through the API"""
+        return self.client.put(
+            f'{self.GAMES_API_PATH}/{game_id}',
+            data=json.dumps(data),
+            content_type='application/json'
+        )
+
+    def test_repeated_get_is_served_from_cache(self) -> None:
+        """Test that a repeated listing is a hit that only looks up the catalog version"""
+        # Arrange
+        first = self.client.get(self.GAMES_API_PATH)
+        with self.app.app_context():
+            engine = db.engine
+
+        # Act
+        with QueryCounter(engine) as counter:
+            second = self.client.get(self.GAMES_API_PATH)
+
+        # Assert
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(counter.count, 1, counter.statements)
+        self.assertEqual(self._stats()['hits'], 1)
+        self.assertEqual(self._stats()['misses'], 1)
+
+    def test_update_invalidates_only_affected_listings(self) -> None:
+        """Test that a write drops listings matching the game's category but keeps others"""
+        # Arrange
+        self.client.get(self.GAMES_API_PATH)
+        self.client.get(f'{self.GAMES_API_PATH}?category_id=1')
+        self.client.get(f'{self.GAMES_API_PATH}?category_id=2')
+        self.client.get(f'{self.GAMES_API_PATH}/2')
+
+        # Act
+        self._update_game(1, {"title": "Updated Pipeline Panic"})
+
+        # Assert
+        self.assertEqual(self._stats()['size'], 2)
+        data = self._get_response_data(self.client.get(self.GAMES_API_PATH))
+        self.assertEqual(data[0]['title'], "Updated Pipeline Panic")
+
+    def test_update_invalidates_old_and_new_category(self) -> None:
+        """Test that moving a game between categories refreshes both filtered listings"""
+        # Arrange
+        self.client.get(f'{self.GAMES_API_PATH}?category_id=1')
+        self.client.get(f'{self.GAMES_API_PATH}?category_id=2')
+
+        # Act
+        self._update_game(1, {"category_id": 2})
+        old_category = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}?category_id=1'))
+        new_category = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}?category_id=2'))
+
+        # Assert
+        self.assertEqual(old_category, [])
+        self.assertEqual(len(new_category), 2)
+
+    def test_lookup_invalidated_only_by_its_games(self) -> None:
+        """Test that a lookup by ids is dropped by writes to its games, found or missing"""
+        # Arrange
+        lookup_path = f'{self.GAMES_API_PATH}?ids=1,99'
+        self.client.get(lookup_path)
+
+        # Act
+        self._update_game(2, {"title": "Updated Agile Adventures"})
+        kept = self._stats()['size']
+        self._update_game(1, {"title": "Updated Pipeline Panic"})
+        data = self._get_response_data(self.client.get(lookup_path))
+
+        # Assert
+        self.assertEqual(kept, 1)
+        self.assertEqual(data['games'][0]['title'], "Updated Pipeline Panic")
+        self.assertEqual(data['missing'], [99])
+
+    def test_search_with_ids_invalidated_by_any_game(self) -> None:
+        """Test that a search ignoring ids is still dropped by writes to other games"""
+        # Arrange
+        search_path = f'{self.GAMES_API_PATH}/search?q=pipeline&ids=1'
+        self.client.get(search_path)
+
+        # Act
+        self._update_game(2, {"title": "Pipeline Pioneers"})
+        data = self._get_response_data(self.client.get(search_path))
+
+        # Assert
+        self.assertEqual(sorted(game['id'] for game in data), [1, 2])
+
+    def test_delete_invalidates_game(self) -> None:
+        """Test that deleting a game drops its cached detail response"""
+        # Arrange
+        self.client.get(f'{self.GAMES_API_PATH}/1')
+
+        # Act
+        self.client.delete(f'{self.GAMES_API_PATH}/1')
+        response = self.client.get(f'{self.GAMES_API_PATH}/1')
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+
+    def test_external_write_clears_cache(self) -> None:
+        """Test that a version bump made outside this cache clears every entry"""
+        # Arrange
+        self.client.get(self.GAMES_API_PATH)
+        with self.app.app_context():
+            db.session.query(Game).filter(Game.id == 1).update({"title": "Renamed Elsewhere"})
+            bump_catalog_version()
+            db.session.commit()
+
+        # Act
+        data = self._get_response_data(self.client.get(self.GAMES_API_PATH))
+
+        # Assert
+        self.assertEqual(data[0]['title'], "Renamed Elsewhere")
+        self.assertEqual(self._stats()['hits'], 0)
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted beyond the max size"""
+        # Arrange
+        self.app.config['RESPONSE_CACHE_MAX_SIZE'] = 1
+
+        # Act
+        self.client.get(f'{self.GAMES_API_PATH}/1')
+        self.client.get(f'{self.GAMES_API_PATH}/2')
+
+        # Assert
+        self.assertEqual(self._stats()['size'], 1)
+        self.assertEqual(self._stats()['evictions'], 1)
+
+    def test_ttl_expiry(self) -> None:
+        """Test that expired entries are treated as misses"""
+        # Arrange
+        self.app.config['RESPONSE_CACHE_TTL'] = 0
+
+        # Act
+        self.client.get(self.GAMES_API_PATH)
+        self.client.get(self.GAMES_API_PATH)
+
+        # Assert
+        self.assertEqual(self._stats()['hits'], 0)
+        self.assertEqual(self._stats()['misses'], 2)
+
+    def test_streamed_listing_is_not_cached(self) -> None:
+        """Test that streamed responses bypass the cache"""
+        # Act
+        self.client.get(f'{self.GAMES_API_PATH}?stream=1')
+
+        # Assert
+        self.assertEqual(self._stats()['size'], 0)
+
+    def test_cache_can_be_disabled(self) -> None:
+        """Test that RESPONSE_CACHE_ENABLED turns the cache off"""
+        # Arrange
+        self.app.config['RESPONSE_CACHE_ENABLED'] = False
+        self.client.get(self.GAMES_API_PATH)
+        with self.app.app_context():
+            engine = db.engine
+
+        # Act
+        with QueryCounter(engine) as counter:
+            response = self.client.get(self.GAMES_API_PATH)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(get_response_cache(self.app))
+        self.assertEqual(counter.count, 2, counter.statements)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from flask import Flask
+from sqlalchemy import func, select
+from models import Game, Publisher, Category, db, init_db
+from utils.catalog_version import get_catalog_version
+from utils.seed_database import bulk_load_catalog, generate_synthetic_catalog, load_csv_catalog
+from tests.helpers import QueryCounter
+
+class TestSeedDatabase(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up an empty test database"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        init_db(self.app, testing=True)
+
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _count(self, model) -> int:
+        """Helper method to count the rows of a table"""
+        return db.session.execute(select(func.count()).select_from(model)).scalar()
+
+    def test_load_csv_catalog(self) -> None:
+        """Test that the seed CSV is loaded with matching references"""
+        with self.app.app_context():
+            game_count, category_count, publisher_count = load_csv_catalog()
+            db.session.commit()
+
+            self.assertEqual(self._count(Game), game_count)
+            self.assertEqual(self._count(Category), category_count)
+            self.assertEqual(self._count(Publisher), publisher_count)
+            game = db.session.query(Game).filter(Game.title == "DevOps Dominion").one()
+            self.assertEqual(game.category.name, "Strategy")
+            self.assertEqual(game.publisher.name, "CodeForge Studios")
+            # One bump per publisher and category from the triggers, one for the games
+            self.assertEqual(get_catalog_version(), category_count + publisher_count + 1)
+
+    def test_synthetic_catalog_is_deterministic(self) -> None:
+        """Test that the same seed always generates the same catalog"""
+        first = generate_synthetic_catalog(50, 5, 3, seed=7)
+        second = generate_synthetic_catalog(50, 5, 3, seed=7)
+        other = generate_synthetic_catalog(50, 5, 3, seed=8)
+
+        first_games = list(first[2])
+        self.assertEqual(first[:2], second[:2])
+        self.assertEqual(first_games, list(second[2]))
+        self.assertNotEqual(first_games, list(other[2]))
+
+    def test_bulk_load_synthetic_catalog_in_batches(self) -> None:
+        """Test that games are inserted with one statement per batch"""
+        with self.app.app_context():
+            categories, publishers, games = generate_synthetic_catalog(250, 20, 5, seed=1)
+
+            # Category insert, publisher insert, 3 game batches, version bump
+            with QueryCounter(db.engine) as counter:
+                inserted = bulk_load_catalog(categories, publishers, games, batch_size=100)
+            db.session.commit()
+
+            self.assertEqual(inserted, 250)
+            self.assertEqual(self._count(Game), 250)
+            self.assertEqual(self._count(Publisher), 20)
+            self.assertEqual(self._count(Category), 5)
+            self.assertEqual(counter.count, 6, counter.statements)
+
+if __name__ == '__main__':
+    unittest.main()
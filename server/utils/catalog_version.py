@@ -0,0 +1,76 @@
+# Helpers for the catalog version counter stored in the catalog_version table.
+# Every write to games, publishers or categories bumps the counter in the same
+# transaction, so its value identifies a snapshot of the catalog and can be
+# used to validate cached responses. Game writers bump it themselves; triggers
+# bump it for publishers and categories.
+from sqlalchemy import Insert, Update, select, update, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import db, CatalogVersion
+
+CATALOG_VERSION_ID: int = 1
+
+def get_catalog_version() -> int:
+    """
+    Read the current catalog version with a single primary-key lookup.
+    
+    Returns:
+        int: The current catalog version, or 0 if it has never been bumped
+    """
+    table = CatalogVersion.__table__
+    version = db.session.execute(
+        select(table.c.version).where(table.c.id == CATALOG_VERSION_ID)
+    ).scalar()
+    return version or 0
+
+def bump_catalog_version() -> int:
+    """
+    Increment the catalog version as part of the current transaction.
+    
+    Call this before committing any change to games. Changes to publishers
+    and categories are bumped by database triggers.
+    
+    Returns:
+        int: The new catalog version, visible to others once the transaction commits
+    """
+    version = db.session.execute(_bump_statement()).scalar()
+    if version is None:
+        db.session.execute(_create_statement())
+        version = 1
+    return version
+
+async def bump_catalog_version_async(session: AsyncSession) -> int:
+    """
+    Increment the catalog version as part of the current transaction of an async session.
+    
+    Args:
+        session (AsyncSession): The session holding the write
+        
+    Returns:
+        int: The new catalog version, visible to others once the transaction commits
+    """
+    version = (await session.execute(_bump_statement())).scalar()
+    if version is None:
+        await session.execute(_create_statement())
+        version = 1
+    return version
+
+def _bump_statement() -> Update:
+    """
+    Returns:
+        Update: Statement incrementing the version and returning the new value
+    """
+    table = CatalogVersion.__table__
+    return (
+        update(table)
+        .where(table.c.id == CATALOG_VERSION_ID)
+        .values(version=table.c.version + 1)
+        .returning(table.c.version)
+    )
+
+def _create_statement() -> Insert:
+    """
+    Returns:
+        Insert: Statement creating the version row at version 1
+    """
+    table = CatalogVersion.__table__
+    return insert(table).values(id=CATALOG_VERSION_ID, version=1)
@@ -0,0 +1,107 @@
+# Content negotiation and compression of JSON responses.
+# Responses at least COMPRESSION_MIN_SIZE bytes long are compressed with
+# brotli (when the brotli package is installed) or gzip, whichever the
+# client's Accept-Encoding prefers. When the body came from the response
+# cache, the compressed bytes are kept with the cache entry, so a cached
+# catalog is compressed once per encoding rather than on every request.
+import gzip
+from flask import Flask, Response, current_app, request
+from werkzeug.datastructures import Accept
+from utils.response_cache import get_or_encode_cached
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+# Mimetypes of the responses that are compressed; streamed responses never are
+COMPRESSIBLE_MIMETYPES: frozenset[str] = frozenset({'application/json'})
+
+DEFAULT_COMPRESSION_MIN_SIZE: int = 1024
+DEFAULT_GZIP_LEVEL: int = 6
+DEFAULT_BROTLI_QUALITY: int = 5
+
+def supported_encodings() -> list[str]:
+    """
+    Returns:
+        list[str]: The content codings this server can produce, most preferred first
+    """
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+def negotiate_encoding(accept_encodings: Accept) -> str | None:
+    """
+    Pick the content coding for a response from the client's Accept-Encoding.
+
+    Args:
+        accept_encodings (Accept): The parsed Accept-Encoding header of the request
+
+    Returns:
+        str | None: 'br' or 'gzip', or None to send the body uncompressed
+    """
+    return accept_encodings.best_match(supported_encodings())
+
+def compress(body: bytes, encoding: str, gzip_level: int = DEFAULT_GZIP_LEVEL,
+             brotli_quality: int = DEFAULT_BROTLI_QUALITY) -> bytes:
+    """
+    Compress a response body.
+
+    Args:
+        body (bytes): The uncompressed body
+        encoding (str): 'br' or 'gzip'
+        gzip_level (int): gzip compression level, 1-9
+        brotli_quality (int): brotli quality, 0-11
+
+    Returns:
+        bytes: The compressed body
+
+    Raises:
+        ValueError: If the encoding is not supported
+    """
+    if encoding == 'gzip':
+        # mtime=0 keeps the output identical for identical bodies
+        return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(body, mode=brotli.MODE_TEXT, quality=brotli_quality)
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+def _compress_response(response: Response) -> Response:
+    """Compress a large enough JSON response in the encoding the client prefers."""
+    if (response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    config = current_app.config
+    body = response.get_data()
+    if len(body) < config.get('COMPRESSION_MIN_SIZE', DEFAULT_COMPRESSION_MIN_SIZE):
+        return response
+
+    # The representation depends on Accept-Encoding even when it is sent uncompressed
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    gzip_level = config.get('COMPRESSION_GZIP_LEVEL', DEFAULT_GZIP_LEVEL)
+    brotli_quality = config.get('COMPRESSION_BROTLI_QUALITY', DEFAULT_BROTLI_QUALITY)
+    response.set_data(get_or_encode_cached(
+        body, encoding, lambda data: compress(data, encoding, gzip_level, brotli_quality)
+    ))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+def init_compression(app: Flask) -> None:
+    """
+    Compress the app's JSON responses for clients that accept it.
+
+    Configured with the COMPRESSION_ENABLED (default True),
+    COMPRESSION_MIN_SIZE (bytes, default 1024), COMPRESSION_GZIP_LEVEL
+    (default 6) and COMPRESSION_BROTLI_QUALITY (default 5) app config keys.
+
+    Args:
+        app (Flask): The Flask app
+    """
+    if not app.config.get('COMPRESSION_ENABLED', True) or 'compression' in app.extensions:
+        return
+    app.extensions['compression'] = True
+    app.after_request(_compress_response)
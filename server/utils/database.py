@@ -1,22 +1,159 @@
 import os
-from models import init_db as models_init_db
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from models import db, enable_foreign_keys, init_db as models_init_db
 
-def init_db(app, connection_string=None, testing=False):
+# SQLite settings applied to every new connection by the "production" profile:
+# write-ahead logging so readers don't block the writer, relaxed fsyncs that
+# are still safe in WAL mode, a memory-mapped and larger page cache, and a
+# busy timeout so contending writers wait instead of failing with
+# "database is locked".
+PRODUCTION_SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 268435456,  # 256 MiB
+    'cache_size': -65536,  # Negative values are KiB, so 64 MiB
+    'busy_timeout': 5000,  # Milliseconds
+    'temp_store': 'MEMORY'
+}
+
+# Connection pool settings for the "production" profile
+PRODUCTION_ENGINE_OPTIONS = {
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_timeout': 30,
+    'pool_recycle': 3600
+}
+
+def init_db(app, connection_string=None, testing=False, profile=None):
     """
     Initializes the database with the given Flask app and connection string.
     If no connection string is provided, a default SQLite connection string is used.
     
+    The engine profile is taken from the profile argument, the DATABASE_PROFILE
+    app config key or the DATABASE_PROFILE environment variable, in that order.
+    "default" keeps SQLAlchemy's defaults; "production" applies
+    PRODUCTION_ENGINE_OPTIONS and, for SQLite, PRODUCTION_SQLITE_PRAGMAS. Either
+    can be overridden with the SQLALCHEMY_ENGINE_OPTIONS and SQLITE_PRAGMAS
+    app config keys.
+    
     Args:
         app: The Flask application instance
         connection_string: Optional database connection string
         testing: If True, allows reinitialization for testing
+        profile: Optional engine profile name, "default" or "production"
     """
     if connection_string is None:
         connection_string = __get_connection_string()
+    if profile is None:
+        profile = app.config.get('DATABASE_PROFILE', os.environ.get('DATABASE_PROFILE', 'default'))
+    if profile not in ('default', 'production'):
+        raise ValueError(f"Unknown database profile: {profile}")
+
     app.config['SQLALCHEMY_DATABASE_URI'] = connection_string
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+    engine_options, pragmas = __profile_settings(app.config, profile, connection_string.startswith('sqlite'))
+    if profile == 'production':
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+
     models_init_db(app, testing=testing)
 
+    if pragmas:
+        with app.app_context():
+            engine = db.engine
+            event.listen(engine, 'connect', __make_pragma_hook(pragmas))
+            # Drop the connection used to create tables so every pooled
+            # connection is opened through the hook
+            engine.dispose()
+
+def init_async_db(app, connection_string=None, profile=None):
+    """
+    Initializes an asyncio engine for an ASGI app and stores a session factory
+    for it in app.extensions['async_db'].
+    
+    The schema, search index and facet summary are created with init_db on a
+    throwaway Flask app, so both variants of the API share one database
+    layout. SQLite databases are opened with the aiosqlite driver, using the
+    same engine profile, pragmas included, as init_db. In-memory SQLite
+    databases cannot be shared between the two engines, so use a file.
+    
+    Args:
+        app: The ASGI (Quart) application instance
+        connection_string: Optional database connection string
+        profile: Optional engine profile name, "default" or "production"
+        
+    Returns:
+        The AsyncEngine
+    """
+    schema_app = Flask(__name__)
+    for key in ('DATABASE_PROFILE', 'SQLALCHEMY_ENGINE_OPTIONS', 'SQLITE_PRAGMAS'):
+        if key in app.config:
+            schema_app.config[key] = app.config[key]
+    init_db(schema_app, connection_string=connection_string, profile=profile)
+
+    with schema_app.app_context():
+        url = db.engine.url
+        is_sqlite = db.engine.dialect.name == 'sqlite'
+        db.engine.dispose()
+    if profile is None:
+        profile = schema_app.config.get('DATABASE_PROFILE', os.environ.get('DATABASE_PROFILE', 'default'))
+
+    engine_options, pragmas = __profile_settings(schema_app.config, profile, is_sqlite)
+    if is_sqlite:
+        url = url.set(drivername='sqlite+aiosqlite')
+    engine = create_async_engine(url, **engine_options)
+    enable_foreign_keys(engine.sync_engine)
+    if pragmas:
+        event.listen(engine.sync_engine, 'connect', __make_pragma_hook(pragmas))
+
+    app.extensions['async_db'] = async_sessionmaker(engine, expire_on_commit=False)
+    return engine
+
+def __profile_settings(config, profile, is_sqlite):
+    """
+    Resolve the engine options and SQLite pragmas of an engine profile.
+
+    Args:
+        config: The app config, whose SQLALCHEMY_ENGINE_OPTIONS and SQLITE_PRAGMAS override the profile
+        profile: The engine profile name, "default" or "production"
+        is_sqlite: True if the database is SQLite
+
+    Returns:
+        A tuple of the engine options and the pragmas to apply to new connections
+    """
+    engine_options = config.get('SQLALCHEMY_ENGINE_OPTIONS', {})
+    pragmas = {}
+    if profile == 'production':
+        engine_options = {**PRODUCTION_ENGINE_OPTIONS, **engine_options}
+        if is_sqlite:
+            pragmas = {**PRODUCTION_SQLITE_PRAGMAS, **config.get('SQLITE_PRAGMAS', {})}
+    elif is_sqlite:
+        pragmas = config.get('SQLITE_PRAGMAS', {})
+    return engine_options, pragmas
+
+def __make_pragma_hook(pragmas):
+    """
+    Build a connect-event handler that applies SQLite pragmas to a new connection.
+
+    Args:
+        pragmas: Mapping of pragma name to value
+
+    Returns:
+        The event handler function
+    """
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Apply the configured pragmas to a newly opened DBAPI connection.
+        """
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+    return set_sqlite_pragmas
+
 def __get_connection_string():
     """
     Returns the connection string for the database.
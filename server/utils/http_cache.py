@@ -0,0 +1,61 @@
+# Conditional GET support for read endpoints.
+# Responses carry a strong ETag derived from the catalog version and the
+# request, so a client revalidating with If-None-Match gets a 304 after a
+# single version lookup instead of a re-query and re-serialization.
+import hashlib
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+from flask import Response, request, make_response, g
+from utils.catalog_version import get_catalog_version
+
+def make_etag(version: int) -> str:
+    """
+    Build the ETag for the current request at the given catalog version.
+    
+    The query string, Accept and Accept-Encoding headers are part of the tag
+    because they select different representations of the same path.
+    
+    Args:
+        version (int): The catalog version the response is built from
+        
+    Returns:
+        str: The unquoted ETag value
+    """
+    variant = (
+        f"{request.full_path}|{request.headers.get('Accept', '')}"
+        f"|{request.headers.get('Accept-Encoding', '')}"
+    )
+    digest = hashlib.sha1(variant.encode('utf-8')).hexdigest()[:16]
+    return f"{version}-{digest}"
+
+def conditional_get(view: Callable[..., Any]) -> Callable[..., Response]:
+    """
+    Decorate a read endpoint with ETag / If-None-Match handling.
+    
+    Args:
+        view (Callable[..., Any]): The Flask view function to wrap
+        
+    Returns:
+        Callable[..., Response]: View that returns 304 when the client's copy is current
+    """
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Response:
+        """Return 304 for a matching If-None-Match, otherwise tag the response."""
+        # Remember the version so the view can reuse it without another lookup
+        g.catalog_version = get_catalog_version()
+        etag = make_etag(g.catalog_version)
+        
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        
+        response = make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+        return response
+    
+    return wrapper
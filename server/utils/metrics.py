@@ -0,0 +1,350 @@
+# Request and SQL metrics exposed in the Prometheus text format.
+# Hooks registered once per app time every request by endpoint, count
+# responses by status code, track in-flight requests, and attribute the SQL
+# statements executed during a request to its endpoint. Metrics are kept in
+# process memory, so each worker process reports its own values.
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import Any
+from flask import Flask, Response, current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from models import db
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds of the statements-per-request buckets
+STATEMENT_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+PROMETHEUS_MIMETYPE: str = 'text/plain; version=0.0.4; charset=utf-8'
+METRICS_PATH: str = '/metrics'
+
+# Label used for requests that did not match any route
+UNMATCHED_ENDPOINT: str = '<unmatched>'
+
+Labels = tuple[tuple[str, str], ...]
+
+class Histogram:
+    """
+    Cumulative histogram with a fixed set of buckets per label set.
+    """
+
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float]) -> None:
+        """
+        Args:
+            name (str): The metric name
+            help_text (str): The HELP text of the metric
+            buckets (Iterable[float]): Sorted bucket upper bounds, excluding +Inf
+        """
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._series: dict[Labels, list[float]] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        """
+        Record one observation. The caller holds the registry lock.
+
+        Args:
+            labels (Labels): The label set of the series
+            value (float): The observed value
+        """
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> list[str]:
+        """
+        Returns:
+            list[str]: The metric in Prometheus text format, one line per entry
+        """
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float('inf')), series):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else _format_value(bound)
+                lines.append(f'{self.name}_bucket{_format_labels(labels + (("le", le),))} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(labels)} {_format_value(series[-1])}')
+            lines.append(f'{self.name}_count{_format_labels(labels)} {cumulative}')
+        return lines
+
+class Counter:
+    """
+    Monotonic counter per label set. Also used for gauges, which may go down.
+    """
+
+    def __init__(self, name: str, help_text: str, kind: str = 'counter') -> None:
+        """
+        Args:
+            name (str): The metric name
+            help_text (str): The HELP text of the metric
+            kind (str): The Prometheus metric type, 'counter' or 'gauge'
+        """
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self._values: dict[Labels, float] = {}
+
+    def add(self, labels: Labels, amount: float = 1) -> None:
+        """
+        Add to the value of a series. The caller holds the registry lock.
+
+        Args:
+            labels (Labels): The label set of the series
+            amount (float): The amount to add, negative only for gauges
+        """
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        """
+        Returns:
+            list[str]: The metric in Prometheus text format, one line per entry
+        """
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} {self.kind}']
+        for labels, value in sorted(self._values.items()):
+            lines.append(f'{self.name}{_format_labels(labels)} {_format_value(value)}')
+        return lines
+
+class Metrics:
+    """
+    Thread-safe registry of the request and SQL metrics of one app.
+    """
+
+    def __init__(self) -> None:
+        self.request_duration = Histogram(
+            'http_request_duration_seconds', 'Time spent handling requests, by endpoint.', LATENCY_BUCKETS
+        )
+        self.requests = Counter('http_requests_total', 'Requests handled, by endpoint and status code.')
+        self.in_flight = Counter('http_requests_in_flight', 'Requests currently being handled.', kind='gauge')
+        self.request_statements = Histogram(
+            'db_statements_per_request', 'SQL statements executed per request, by endpoint.', STATEMENT_BUCKETS
+        )
+        self.request_db_time = Histogram(
+            'db_time_per_request_seconds', 'Time spent executing SQL per request, by endpoint.', LATENCY_BUCKETS
+        )
+        self._lock = threading.Lock()
+
+    def request_started(self, endpoint: str) -> None:
+        """
+        Args:
+            endpoint (str): The endpoint label of the request
+        """
+        with self._lock:
+            self.in_flight.add((('endpoint', endpoint),), 1)
+
+    def request_finished(self, endpoint: str) -> None:
+        """
+        Args:
+            endpoint (str): The endpoint label of the request
+        """
+        with self._lock:
+            self.in_flight.add((('endpoint', endpoint),), -1)
+
+    def observe_request(self, endpoint: str, method: str, status: int, duration: float,
+                        statements: int, db_time: float) -> None:
+        """
+        Record a completed request.
+
+        Args:
+            endpoint (str): The endpoint label of the request
+            method (str): The HTTP method
+            status (int): The response status code
+            duration (float): Seconds spent handling the request
+            statements (int): Number of SQL statements executed
+            db_time (float): Seconds spent executing SQL
+        """
+        labels = (('endpoint', endpoint), ('method', method))
+        with self._lock:
+            self.request_duration.observe(labels, duration)
+            self.requests.add(labels + (('status', str(status)),))
+            self.request_statements.observe(labels, statements)
+            self.request_db_time.observe(labels, db_time)
+
+    def render(self, extra: Iterable[str] = ()) -> str:
+        """
+        Render every metric in Prometheus text format.
+
+        Args:
+            extra (Iterable[str]): Additional pre-rendered lines to append
+
+        Returns:
+            str: The exposition text
+        """
+        with self._lock:
+            lines = [
+                *self.request_duration.render(),
+                *self.requests.render(),
+                *self.in_flight.render(),
+                *self.request_statements.render(),
+                *self.request_db_time.render()
+            ]
+        lines.extend(extra)
+        return '\n'.join(lines) + '\n'
+
+def _format_labels(labels: Labels) -> str:
+    """
+    Format a label set, escaping the values.
+
+    Args:
+        labels (Labels): The label names and values
+
+    Returns:
+        str: The label set in braces, or an empty string
+    """
+    if not labels:
+        return ''
+    escaped = (
+        (name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+def _format_value(value: float) -> str:
+    """
+    Format a sample value, dropping the fraction of whole numbers.
+
+    Args:
+        value (float): The sample value
+
+    Returns:
+        str: The formatted value
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+def _endpoint_label() -> str:
+    """
+    Returns:
+        str: The endpoint of the current request, e.g. "games.get_games"
+    """
+    return request.endpoint or UNMATCHED_ENDPOINT
+
+def _before_request() -> None:
+    """Start timing the request and counting its SQL statements."""
+    g.metrics_start = time.perf_counter()
+    g.metrics_endpoint = _endpoint_label()
+    g.sql_statements = 0
+    g.sql_time = 0.0
+    current_app.extensions['metrics'].request_started(g.metrics_endpoint)
+
+def _after_request(response: Response) -> Response:
+    """Record the latency, status and SQL usage of the request."""
+    start = g.get('metrics_start')
+    if start is not None:
+        current_app.extensions['metrics'].observe_request(
+            g.metrics_endpoint,
+            request.method,
+            response.status_code,
+            time.perf_counter() - start,
+            g.sql_statements,
+            g.sql_time
+        )
+    return response
+
+def _teardown_request(exc: BaseException | None) -> None:
+    """Leave the in-flight gauge once the request, including any streamed body, is done."""
+    endpoint = g.pop('metrics_endpoint', None)
+    if endpoint is not None:
+        current_app.extensions['metrics'].request_finished(endpoint)
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any,
+                           context: Any, executemany: bool) -> None:
+    """Remember when a statement started."""
+    conn.info.setdefault('metrics_statement_start', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any,
+                          context: Any, executemany: bool) -> None:
+    """Attribute a finished statement to the current request."""
+    elapsed = time.perf_counter() - conn.info['metrics_statement_start'].pop()
+    if has_request_context() and 'sql_statements' in g:
+        g.sql_statements += 1
+        g.sql_time += elapsed
+
+def _handle_error(exception_context: Any) -> None:
+    """Drop the start time of a statement that failed."""
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('metrics_statement_start'):
+        connection.info['metrics_statement_start'].pop()
+
+def _render_cache_stats(app: Flask) -> list[str]:
+    """
+    Render the response cache counters, if the app has a cache.
+
+    Args:
+        app (Flask): The Flask app
+
+    Returns:
+        list[str]: Prometheus text lines
+    """
+    cache = app.extensions.get('response_cache')
+    if cache is None:
+        return []
+    stats = cache.stats()
+    lines = [
+        '# HELP response_cache_entries Entries currently held by the response cache.',
+        '# TYPE response_cache_entries gauge',
+        f"response_cache_entries {stats['size']}"
+    ]
+    counters = {
+        'hits': 'Response cache hits.',
+        'misses': 'Response cache misses.',
+        'evictions': 'Response cache evictions.',
+        'invalidations': 'Response cache invalidations.',
+        'encoded_hits': 'Compressed bodies served from the response cache.'
+    }
+    for name, help_text in counters.items():
+        lines += [
+            f'# HELP response_cache_{name}_total {help_text}',
+            f'# TYPE response_cache_{name}_total counter',
+            f'response_cache_{name}_total {stats[name]}'
+        ]
+    return lines
+
+def metrics_view() -> Response:
+    """
+    Serve the metrics of this process in Prometheus text format.
+
+    Returns:
+        Response: The exposition text
+    """
+    app = current_app._get_current_object()
+    body = app.extensions['metrics'].render(_render_cache_stats(app))
+    return Response(body, content_type=PROMETHEUS_MIMETYPE)
+
+def init_metrics(app: Flask) -> Metrics | None:
+    """
+    Register the metrics hooks, SQL event listeners and /metrics route on an app.
+
+    Must be called after the database is initialized. Disabled by setting the
+    METRICS_ENABLED app config key to False.
+
+    Args:
+        app (Flask): The Flask app
+
+    Returns:
+        Metrics | None: The app's metrics registry, or None if metrics are disabled
+    """
+    if not app.config.get('METRICS_ENABLED', True):
+        return None
+    if 'metrics' in app.extensions:
+        return app.extensions['metrics']
+
+    metrics = app.extensions['metrics'] = Metrics()
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+    app.add_url_rule(METRICS_PATH, 'metrics', metrics_view, methods=['GET'])
+
+    with app.app_context():
+        engine: Engine = db.engine
+    if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(engine, 'handle_error', _handle_error)
+
+    return metrics
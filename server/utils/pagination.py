@@ -0,0 +1,90 @@
+# Helpers for keyset (cursor) pagination of API listings.
+# Cursors are opaque, URL-safe tokens that encode the sort key of the last
+# row on a page, so the next page can seek directly past it in SQL instead
+# of using OFFSET.
+import base64
+import json
+from typing import Any
+
+DEFAULT_PAGE_SIZE: int = 20
+MAX_PAGE_SIZE: int = 100
+
+# Range of the 64-bit integers SQLite can bind; larger Python ints overflow
+MIN_SQL_INT: int = -2 ** 63
+MAX_SQL_INT: int = 2 ** 63 - 1
+
+def encode_cursor(key: list[Any]) -> str:
+    """
+    Encode the sort key of the last row on a page into an opaque cursor.
+
+    Args:
+        key (list[Any]): The sort key values of the last row, in sort order
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    raw = json.dumps(key, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def is_sql_int(value: Any) -> bool:
+    """
+    Check whether a decoded JSON value is an integer that can be bound to SQL.
+
+    Args:
+        value (Any): The value to check
+
+    Returns:
+        bool: True for ints other than booleans within the 64-bit range
+    """
+    return isinstance(value, int) and not isinstance(value, bool) and MIN_SQL_INT <= value <= MAX_SQL_INT
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """
+    Decode a cursor produced by encode_cursor back into its sort key.
+
+    Args:
+        cursor (str): The cursor string supplied by the client
+
+    Returns:
+        list[Any]: The sort key values encoded in the cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(key, list) or not key:
+        raise ValueError("Invalid cursor")
+
+    return key
+
+def parse_limit(value: str | None, name: str = 'limit') -> int:
+    """
+    Parse and validate a page size query parameter.
+
+    Args:
+        value (str | None): The raw limit parameter, or None for the default
+        name (str): The parameter name used in error messages
+
+    Returns:
+        int: The validated page size
+
+    Raises:
+        ValueError: If the limit is not an integer between 1 and MAX_PAGE_SIZE
+    """
+    if value is None:
+        return DEFAULT_PAGE_SIZE
+
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer between 1 and {MAX_PAGE_SIZE}")
+
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise ValueError(f"{name} must be an integer between 1 and {MAX_PAGE_SIZE}")
+
+    return limit
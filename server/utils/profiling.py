@@ -0,0 +1,214 @@
+# Opt-in request profiling and the slow-query log.
+# A profiled request gets a Server-Timing header splitting its time into SQL,
+# JSON serialization and the rest, with the number of statements executed.
+# Profiling is switched on for every request with PROFILING_ENABLED, or per
+# request by sending PROFILING_HEADER with the secret PROFILING_TOKEN.
+# Independently, statements slower than SLOW_QUERY_THRESHOLD_MS are logged
+# with their parameters and query plan.
+import hmac
+import logging
+import time
+from typing import Any
+from flask import Flask, Response, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from models import db
+from utils.query_plan import explain_sql
+
+PROFILING_HEADER: str = 'X-Profile'
+DEFAULT_SLOW_QUERY_THRESHOLD_MS: float = 100.0
+
+slow_query_logger = logging.getLogger('tailspin.slow_queries')
+
+class RequestProfile:
+    """Time and statement counters of one profiled request."""
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.sql_statements = 0
+        self.sql_time = 0.0
+        self.serialize_time = 0.0
+
+    def server_timing(self) -> str:
+        """
+        Build the Server-Timing header value for the request so far.
+
+        Returns:
+            str: Metrics for SQL, serialization, the remaining app time and the total, in milliseconds
+        """
+        total = time.perf_counter() - self.start
+        app_time = max(total - self.sql_time - self.serialize_time, 0.0)
+        return ', '.join([
+            f'db;dur={self.sql_time * 1000:.2f};desc="{self.sql_statements} queries"',
+            f'serialize;dur={self.serialize_time * 1000:.2f}',
+            f'app;dur={app_time * 1000:.2f}',
+            f'total;dur={total * 1000:.2f}'
+        ])
+
+def _current_profile() -> RequestProfile | None:
+    """
+    Returns:
+        RequestProfile | None: The profile of the current request, if it is being profiled
+    """
+    return g.get('profile') if has_request_context() else None
+
+def _profiling_requested(app: Flask) -> bool:
+    """
+    Check whether the current request should be profiled.
+
+    Args:
+        app (Flask): The Flask app
+
+    Returns:
+        bool: True if profiling is enabled for every request, or the request carries the profiling token
+    """
+    if app.config.get('PROFILING_ENABLED', False):
+        return True
+    token = app.config.get('PROFILING_TOKEN')
+    supplied = request.headers.get(PROFILING_HEADER)
+    return bool(token) and supplied is not None and hmac.compare_digest(supplied, token)
+
+def _make_profiled_json_provider(app: Flask) -> Any:
+    """
+    Wrap the app's JSON provider so serialization time is added to the request profile.
+
+    Args:
+        app (Flask): The Flask app
+
+    Returns:
+        The wrapping provider instance, keeping the settings of the current one
+    """
+    provider = app.json
+
+    class ProfiledJSONProvider(type(provider)):
+        """JSON provider that times dumps for profiled requests."""
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            """Serialize obj, timing it when the request is profiled."""
+            profile = _current_profile()
+            if profile is None:
+                return super().dumps(obj, **kwargs)
+            start = time.perf_counter()
+            try:
+                return super().dumps(obj, **kwargs)
+            finally:
+                profile.serialize_time += time.perf_counter() - start
+
+        if hasattr(provider, 'dumps_bytes'):
+            # The FastJSONProvider encodes responses with dumps_bytes, not dumps
+            def dumps_bytes(self, obj: Any) -> bytes:
+                """Serialize obj to bytes, timing it when the request is profiled."""
+                profile = _current_profile()
+                if profile is None:
+                    return super().dumps_bytes(obj)
+                start = time.perf_counter()
+                try:
+                    return super().dumps_bytes(obj)
+                finally:
+                    profile.serialize_time += time.perf_counter() - start
+
+    profiled = ProfiledJSONProvider(app)
+    # Keep settings changed on the instance, e.g. json.sort_keys = False
+    profiled.__dict__.update(provider.__dict__)
+    return profiled
+
+def _log_slow_query(conn: Any, statement: str, parameters: Any, executemany: bool, elapsed: float) -> None:
+    """
+    Log a slow statement with its parameters and, on SQLite, its query plan.
+
+    Args:
+        conn (Any): The SQLAlchemy connection the statement ran on
+        statement (str): The SQL string
+        parameters (Any): The bound parameters
+        executemany (bool): True if the statement ran once per parameter set
+        elapsed (float): Seconds the statement took
+    """
+    plan = None
+    if conn.dialect.name == 'sqlite':
+        try:
+            # The plan does not depend on which parameter set of an executemany is used
+            plan = explain_sql(conn.connection.dbapi_connection, statement,
+                               parameters[0] if executemany and parameters else parameters)
+        except Exception:
+            # DDL, PRAGMA and the like cannot be explained
+            pass
+    slow_query_logger.warning(
+        'Slow query (%.1f ms): %s | parameters: %r | plan: %s',
+        elapsed * 1000, statement, parameters, ' / '.join(plan) if plan else 'n/a'
+    )
+
+def _make_cursor_listeners(slow_threshold: float | None) -> tuple[Any, Any, Any]:
+    """
+    Build the engine event handlers for profiling and the slow-query log.
+
+    Args:
+        slow_threshold (float | None): Seconds above which a statement is logged, or None to disable the log
+
+    Returns:
+        tuple: before_cursor_execute, after_cursor_execute and handle_error handlers
+    """
+    def before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any,
+                              context: Any, executemany: bool) -> None:
+        """Remember when a statement started."""
+        conn.info.setdefault('profiling_statement_start', []).append(time.perf_counter())
+
+    def after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any,
+                             context: Any, executemany: bool) -> None:
+        """Add the statement to the request profile and log it if it was slow."""
+        elapsed = time.perf_counter() - conn.info['profiling_statement_start'].pop()
+        profile = _current_profile()
+        if profile is not None:
+            profile.sql_statements += 1
+            profile.sql_time += elapsed
+        if slow_threshold is not None and elapsed >= slow_threshold:
+            _log_slow_query(conn, statement, parameters, executemany, elapsed)
+
+    def handle_error(exception_context: Any) -> None:
+        """Drop the start time of a statement that failed."""
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('profiling_statement_start'):
+            connection.info['profiling_statement_start'].pop()
+
+    return before_cursor_execute, after_cursor_execute, handle_error
+
+def init_profiling(app: Flask) -> None:
+    """
+    Register request profiling and the slow-query log on an app.
+
+    Must be called after the database is initialized and after the app's JSON
+    provider is set. Configured with the PROFILING_ENABLED (default False),
+    PROFILING_TOKEN and SLOW_QUERY_THRESHOLD_MS (default 100, None disables
+    the log) app config keys.
+
+    Args:
+        app (Flask): The Flask app
+    """
+    if 'profiling' in app.extensions:
+        return
+    app.extensions['profiling'] = True
+
+    def start_profile() -> None:
+        """Start a profile when the request asks for one."""
+        if _profiling_requested(app):
+            g.profile = RequestProfile()
+
+    def add_server_timing(response: Response) -> Response:
+        """Report the profile of the request in a Server-Timing header."""
+        profile = g.get('profile')
+        if profile is not None:
+            response.headers['Server-Timing'] = profile.server_timing()
+        return response
+
+    app.before_request(start_profile)
+    app.after_request(add_server_timing)
+    app.json = _make_profiled_json_provider(app)
+
+    threshold_ms = app.config.get('SLOW_QUERY_THRESHOLD_MS', DEFAULT_SLOW_QUERY_THRESHOLD_MS)
+    before, after, handle_error = _make_cursor_listeners(
+        threshold_ms / 1000 if threshold_ms is not None else None
+    )
+    with app.app_context():
+        engine: Engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before)
+    event.listen(engine, 'after_cursor_execute', after)
+    event.listen(engine, 'handle_error', handle_error)
@@ -0,0 +1,65 @@
+# Helpers for inspecting SQLite query plans.
+# Used by the tests to check that the listing queries are served by indexes
+# rather than full table scans, and by the slow-query log.
+from typing import Any
+from sqlalchemy import Executable
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Query
+
+def explain_query_plan(connection: Connection, statement: Executable | Query) -> list[str]:
+    """
+    Run EXPLAIN QUERY PLAN for a statement and return the plan steps.
+    
+    Args:
+        connection (Connection): A connection to the SQLite database
+        statement (Executable | Query): Core statement or ORM query to explain
+        
+    Returns:
+        list[str]: The detail column of each step of the plan, e.g. 'SCAN games'
+    """
+    if isinstance(statement, Query):
+        statement = statement.statement
+    compiled = statement.compile(dialect=connection.dialect)
+    parameters = tuple(compiled.params[name] for name in compiled.positiontup or ())
+    rows = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}', parameters)
+    return [row[3] for row in rows]
+
+def explain_sql(dbapi_connection: Any, statement: str, parameters: Any = ()) -> list[str]:
+    """
+    Run EXPLAIN QUERY PLAN for a compiled SQL string on a raw DBAPI connection.
+    
+    Bypasses SQLAlchemy, so it can be called from engine event handlers
+    without firing them again.
+    
+    Args:
+        dbapi_connection (Any): The sqlite3 connection the statement ran on
+        statement (str): The SQL string as sent to the driver
+        parameters (Any): The bound parameters of the statement
+        
+    Returns:
+        list[str]: The detail column of each step of the plan
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f'EXPLAIN QUERY PLAN {statement}', parameters)
+        return [row[3] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+def find_full_table_scans(plan: list[str]) -> list[str]:
+    """
+    Find the steps of a query plan that scan a table without an index.
+    
+    Virtual table steps (e.g. an FTS5 MATCH) are lookups served by the
+    table's own index and are not reported.
+    
+    Args:
+        plan (list[str]): Plan steps as returned by explain_query_plan
+        
+    Returns:
+        list[str]: The steps that read every row of a table
+    """
+    return [
+        step for step in plan
+        if step.startswith('SCAN ') and ' USING ' not in step and ' VIRTUAL TABLE ' not in step
+    ]
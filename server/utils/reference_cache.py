@@ -0,0 +1,173 @@
+# In-process cache of the publishers and categories, which change rarely but
+# are read constantly. Game writes check references and name the written
+# game's publisher and category from it instead of querying them, and the
+# publisher and category listings are served from it without a query.
+#
+# The data is stamped with the catalog version it was read at: a version this
+# process did not commit itself means another writer (e.g. the seeder or
+# another worker) may have changed it, so it is read again. Triggers bump the
+# version on every publisher and category write, in any process.
+import threading
+from typing import NamedTuple
+from flask import Flask, current_app
+from sqlalchemy import select
+from models import db, Publisher, Category
+from utils.catalog_version import get_catalog_version
+
+class Reference(NamedTuple):
+    """A cached publisher or category."""
+    id: int
+    name: str
+
+    def to_dict(self) -> dict:
+        """
+        Returns:
+            dict: The publisher or category for API responses
+        """
+        return {'id': self.id, 'name': self.name}
+
+class ReferenceData(NamedTuple):
+    """Publishers and categories by id as of a catalog version, in id order."""
+    version: int
+    publishers: dict[int, Reference]
+    categories: dict[int, Reference]
+
+class ReferenceCache:
+    """
+    Thread-safe holder of the latest ReferenceData of an app.
+    """
+
+    def __init__(self) -> None:
+        self._data: ReferenceData | None = None
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(self, version: int) -> ReferenceData:
+        """
+        Get the publishers and categories valid at a catalog version, reading
+        them again if the cached ones were read at another version.
+
+        Must be called inside an app context.
+
+        Args:
+            version (int): The current catalog version
+
+        Returns:
+            ReferenceData: The publishers and categories
+        """
+        data = self._data
+        if data is not None and data.version == version:
+            return data
+        return self.load(version)
+
+    def load(self, version: int | None = None) -> ReferenceData:
+        """
+        Read the publishers and categories and stamp them with the catalog version.
+
+        The version is read before the rows, so they are at least as new as
+        it; a write in between only makes the next lookup read them again.
+
+        Args:
+            version (int | None): The catalog version, if already read, otherwise it is read first
+
+        Returns:
+            ReferenceData: The freshly read publishers and categories
+        """
+        if version is None:
+            version = get_catalog_version()
+        data = ReferenceData(version, _read_references(Publisher), _read_references(Category))
+        with self._lock:
+            if self._data is None or self._data.version <= version:
+                self._data = data
+            self.loads += 1
+        return data
+
+    def apply_write(self, version: int) -> None:
+        """
+        Carry the data over to the catalog version a game write of this
+        process committed, since game writes do not change it.
+
+        Args:
+            version (int): The catalog version the write committed
+        """
+        with self._lock:
+            if self._data is not None and self._data.version == version - 1:
+                self._data = self._data._replace(version=version)
+
+    def clear(self) -> None:
+        """Drop the data, so the next lookup reads it again."""
+        with self._lock:
+            self._data = None
+
+def _read_references(model) -> dict[int, Reference]:
+    """
+    Read every row of a reference table.
+
+    Args:
+        model: Publisher or Category
+
+    Returns:
+        dict[int, Reference]: The rows by id, in id order
+    """
+    rows = db.session.execute(select(model.id, model.name).order_by(model.id))
+    return {row.id: Reference(*row) for row in rows}
+
+def get_reference_cache(app: Flask | None = None) -> ReferenceCache:
+    """
+    Get the reference cache of an app, creating it on first use.
+
+    Args:
+        app (Flask | None): The app, defaults to the current app
+
+    Returns:
+        ReferenceCache: The app's reference cache
+    """
+    app = app or current_app._get_current_object()
+    return app.extensions.setdefault('reference_cache', ReferenceCache())
+
+def get_reference_data(version: int | None = None) -> ReferenceData:
+    """
+    Get the current publishers and categories of the current app.
+
+    Args:
+        version (int | None): The current catalog version, if the request has already read it
+
+    Returns:
+        ReferenceData: The publishers and categories
+    """
+    if version is None:
+        version = get_catalog_version()
+    return get_reference_cache().get(version)
+
+def apply_game_write(version: int) -> None:
+    """
+    Keep the cached publishers and categories of the current app valid
+    across a committed game write, which does not change them.
+
+    Args:
+        version (int): The catalog version the write committed
+    """
+    get_reference_cache().apply_write(version)
+
+def get_reference_data_after_write(version: int) -> ReferenceData:
+    """
+    Get the publishers and categories for serializing games written by the current request.
+
+    Args:
+        version (int): The catalog version the write committed
+
+    Returns:
+        ReferenceData: The publishers and categories
+    """
+    apply_game_write(version)
+    return get_reference_cache().get(version)
+
+def init_reference_cache(app: Flask) -> None:
+    """
+    Warm the reference cache of an app, so the first requests do not read it.
+
+    Args:
+        app (Flask): The app, with its database initialized
+    """
+    with app.app_context():
+        get_reference_cache(app).load()
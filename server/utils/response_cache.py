@@ -0,0 +1,340 @@
+# In-process LRU cache of encoded JSON responses for the game read endpoints.
+# Entries remember which game or which category/publisher filters they cover,
+# so the write handlers can drop only the entries a change affects. Entries are
+# also tied to the catalog version: a version change this process did not make
+# (e.g. a write handled by another worker) clears the cache. Compressed
+# forms of a cached body are stored with its entry, see utils.compression.
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from functools import wraps
+from typing import Any, NamedTuple
+from flask import Flask, current_app, g, make_response
+from utils.catalog_version import get_catalog_version
+
+DEFAULT_MAX_SIZE: int = 256
+DEFAULT_TTL: float = 300.0
+
+class CacheScope(NamedTuple):
+    """
+    Identifies a cacheable response and the part of the catalog it depends on.
+
+    A scope with game_id set covers that single game, and one with game_ids
+    set covers a lookup of those games, found or not. Otherwise it covers a
+    listing filtered by category_id/publisher_id, where None means unfiltered.
+    """
+    key: Hashable
+    game_id: int | None = None
+    category_id: int | None = None
+    publisher_id: int | None = None
+    game_ids: frozenset[int] | None = None
+
+class _CacheEntry(NamedTuple):
+    """A cached response body with its scope, expiry time and compressed forms."""
+    scope: CacheScope
+    body: bytes
+    expires_at: float
+    # Content coding -> compressed body
+    encoded: dict[str, bytes]
+
+class _ServedBody(NamedTuple):
+    """The cache entry a response body was served from or stored in."""
+    cache: 'ResponseCache'
+    key: Hashable
+    body: bytes
+
+class ResponseCache:
+    """
+    Thread-safe, size- and TTL-bounded LRU cache of encoded response bodies.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL) -> None:
+        """
+        Args:
+            max_size (int): Maximum number of entries before the least recently used is evicted
+            ttl (float): Seconds an entry stays valid after it is stored
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.version: int | None = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.encoded_hits = 0
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: Number of entries currently cached
+        """
+        return len(self._entries)
+
+    def sync_version(self, version: int) -> None:
+        """
+        Align the cache with the current catalog version.
+
+        A newer version that was not applied through apply_write came from a
+        writer outside this process, so every entry is dropped.
+
+        Args:
+            version (int): The catalog version the current request observed
+        """
+        with self._lock:
+            if self.version is None or version > self.version:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self.version = version
+
+    def get(self, key: Hashable) -> bytes | None:
+        """
+        Look up a cached body, counting the hit or miss.
+
+        Args:
+            key (Hashable): The cache key of the response
+
+        Returns:
+            bytes | None: The cached body, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.body
+
+    def set(self, scope: CacheScope, body: bytes, version: int) -> None:
+        """
+        Store a body built from the given catalog version.
+
+        The body is discarded if the cache has moved past that version in the
+        meantime, so a response racing a write is never cached.
+
+        Args:
+            scope (CacheScope): The scope of the response
+            body (bytes): The encoded response body
+            version (int): The catalog version the body was built from
+        """
+        with self._lock:
+            if version != self.version:
+                return
+            self._entries[scope.key] = _CacheEntry(scope, body, time.monotonic() + self.ttl, {})
+            self._entries.move_to_end(scope.key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_encode(self, key: Hashable, body: bytes, encoding: str,
+                      encode: Callable[[bytes], bytes]) -> bytes:
+        """
+        Get the compressed form of a cached body, encoding and storing it on first use.
+
+        Nothing is stored if the entry was replaced or dropped while encoding.
+
+        Args:
+            key (Hashable): The cache key of the response
+            body (bytes): The cached body, as returned by get or passed to set
+            encoding (str): The content coding, e.g. 'gzip'
+            encode (Callable[[bytes], bytes]): Compresses the body in that coding
+
+        Returns:
+            bytes: The compressed body
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.body is body and encoding in entry.encoded:
+                self.encoded_hits += 1
+                return entry.encoded[encoding]
+
+        data = encode(body)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.body is body:
+                entry.encoded[encoding] = data
+        return data
+
+    def apply_write(self, version: int, game_ids: Iterable[int], category_ids: Iterable[int],
+                    publisher_ids: Iterable[int]) -> None:
+        """
+        Drop the entries affected by a committed write to one or more games.
+
+        Affected entries are the games themselves and every listing whose
+        filters match one of the games' old or new categories and publishers.
+
+        Args:
+            version (int): The catalog version the write committed
+            game_ids (Iterable[int]): The ids of the created, updated or deleted games
+            category_ids (Iterable[int]): Category ids the games had before and after the write
+            publisher_ids (Iterable[int]): Publisher ids the games had before and after the write
+        """
+        game_ids = set(game_ids)
+        category_ids = set(category_ids)
+        publisher_ids = set(publisher_ids)
+        with self._lock:
+            if self.version is None or version != self.version + 1:
+                # Another writer got in between, so precise invalidation is not safe
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self.version = max(version, self.version or 0)
+                return
+
+            stale = [
+                key for key, entry in self._entries.items()
+                if _is_affected(entry.scope, game_ids, category_ids, publisher_ids)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            self.version = version
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns:
+            dict[str, int]: Current size and hit, miss, eviction, invalidation and
+                compressed-body hit counters
+        """
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'encoded_hits': self.encoded_hits
+            }
+
+def _is_affected(scope: CacheScope, game_ids: set[int], category_ids: set[int],
+                 publisher_ids: set[int]) -> bool:
+    """
+    Check whether a write to some games can change a cached response.
+
+    Args:
+        scope (CacheScope): The scope of the cached response
+        game_ids (set[int]): The ids of the written games
+        category_ids (set[int]): Category ids the games had before and after the write
+        publisher_ids (set[int]): Publisher ids the games had before and after the write
+
+    Returns:
+        bool: True if the entry must be dropped
+    """
+    if scope.game_id is not None:
+        return scope.game_id in game_ids
+    if scope.game_ids is not None:
+        return not scope.game_ids.isdisjoint(game_ids)
+    return (
+        (scope.category_id is None or scope.category_id in category_ids)
+        and (scope.publisher_id is None or scope.publisher_id in publisher_ids)
+    )
+
+def get_response_cache(app: Flask | None = None) -> ResponseCache | None:
+    """
+    Get the response cache for an app, creating it from config on first use.
+
+    Configured with RESPONSE_CACHE_ENABLED (default True),
+    RESPONSE_CACHE_MAX_SIZE and RESPONSE_CACHE_TTL (seconds).
+
+    Args:
+        app (Flask | None): The Flask app, defaults to the current app
+
+    Returns:
+        ResponseCache | None: The app's cache, or None if caching is disabled
+    """
+    app = app or current_app._get_current_object()
+    if not app.config.get('RESPONSE_CACHE_ENABLED', True):
+        return None
+
+    cache = app.extensions.get('response_cache')
+    if cache is None:
+        cache = app.extensions.setdefault('response_cache', ResponseCache(
+            max_size=app.config.get('RESPONSE_CACHE_MAX_SIZE', DEFAULT_MAX_SIZE),
+            ttl=app.config.get('RESPONSE_CACHE_TTL', DEFAULT_TTL)
+        ))
+    return cache
+
+def cached_response(scope_for: Callable[..., CacheScope | None]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorate a read endpoint so its successful JSON responses are cached.
+
+    Args:
+        scope_for (Callable[..., CacheScope | None]): Called with the view arguments
+            to get the scope of the request, or None if it must not be cached
+
+    Returns:
+        Callable: Decorator to apply to the view function
+    """
+    def decorator(view: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap the view with cache lookup and storage."""
+        @wraps(view)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Serve the cached body when present, otherwise cache the view's response."""
+            cache = get_response_cache()
+            scope = scope_for(*args, **kwargs) if cache is not None else None
+            if scope is None:
+                return view(*args, **kwargs)
+
+            version = g.get('catalog_version')
+            if version is None:
+                version = get_catalog_version()
+            cache.sync_version(version)
+
+            body = cache.get(scope.key)
+            if body is not None:
+                g.served_body = _ServedBody(cache, scope.key, body)
+                return current_app.response_class(body, mimetype='application/json')
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                body = response.get_data()
+                cache.set(scope, body, version)
+                g.served_body = _ServedBody(cache, scope.key, body)
+            return response
+
+        return wrapper
+
+    return decorator
+
+def get_or_encode_cached(body: bytes, encoding: str, encode: Callable[[bytes], bytes]) -> bytes:
+    """
+    Compress a response body of the current request, reusing the cached
+    compressed form when the body came from the response cache.
+
+    Args:
+        body (bytes): The response body
+        encoding (str): The content coding, e.g. 'gzip'
+        encode (Callable[[bytes], bytes]): Compresses a body in that coding
+
+    Returns:
+        bytes: The compressed body
+    """
+    served = g.get('served_body')
+    if served is None or served.body != body:
+        return encode(body)
+    return served.cache.get_or_encode(served.key, served.body, encoding, encode)
+
+def invalidate_games(version: int, game_ids: Iterable[int], category_ids: Iterable[int],
+                     publisher_ids: Iterable[int]) -> None:
+    """
+    Drop cached responses affected by a committed game write in the current app.
+
+    Args:
+        version (int): The catalog version the write committed
+        game_ids (Iterable[int]): The ids of the created, updated or deleted games
+        category_ids (Iterable[int]): Category ids the games had before and after the write
+        publisher_ids (Iterable[int]): Publisher ids the games had before and after the write
+    """
+    cache = get_response_cache()
+    if cache is not None:
+        cache.apply_write(version, game_ids, category_ids, publisher_ids)
@@ -1,84 +1,254 @@
+import argparse
 import csv
 import os
 import random
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any
 from flask import Flask
+from sqlalchemy import insert
 from models import db, Category, Game, Publisher
+from utils.catalog_version import bump_catalog_version
 from utils.database import init_db
 
-def create_app():
-    """Create and configure Flask app for database operations"""
+# Number of game rows sent to the database per executemany call
+BATCH_SIZE = 10000
+
+# Word lists used to build synthetic catalog names and descriptions
+SYNTHETIC_GENRES = [
+    'Strategy', 'Puzzle', 'Card Game', 'Roguelike', 'Simulation', 'Platformer',
+    'Adventure', 'Tower Defense', 'Deck Builder', 'Party Game'
+]
+SYNTHETIC_ADJECTIVES = [
+    'Agile', 'Async', 'Binary', 'Cloud', 'Concurrent', 'Distributed', 'Elastic',
+    'Functional', 'Immutable', 'Lazy', 'Quantum', 'Recursive', 'Serverless', 'Stateless'
+]
+SYNTHETIC_NOUNS = [
+    'Pipeline', 'Merge', 'Refactor', 'Deploy', 'Sprint', 'Backlog', 'Commit',
+    'Container', 'Kernel', 'Compiler', 'Cache', 'Queue', 'Thread', 'Cluster'
+]
+SYNTHETIC_SENTENCES = [
+    'Lead your team through a gauntlet of failing builds and flaky tests.',
+    'Balance technical debt against feature deadlines in every turn.',
+    'Collaborate with Mona to untangle the legacy monolith.',
+    'Race rival teams to ship before the release train departs.',
+    'Automate everything, then debug the automation.',
+    'Every merge conflict hides a new strategic opportunity.'
+]
+
+def create_app(connection_string=None):
+    """
+    Create and configure Flask app for database operations
+
+    Args:
+        connection_string: Optional database connection string, defaults to the app database
+    """
     app = Flask(__name__)
 
     # Initialize the database with the app
-    init_db(app)
-    
+    init_db(app, connection_string=connection_string)
+
     return app
 
+def _batched(rows: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    """
+    Split an iterable of rows into lists of at most size rows.
+
+    Args:
+        rows (Iterable[dict[str, Any]]): The rows to split
+        size (int): The maximum batch size
+
+    Returns:
+        Iterator[list[dict[str, Any]]]: The batches, in order
+    """
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+def _insert_named(model, names: list[str], describe) -> dict[str, int]:
+    """
+    Insert named rows in one statement and return their ids.
+
+    Args:
+        model: Category or Publisher
+        names (list[str]): The unique names to insert
+        describe: Function building the description for a name
+
+    Returns:
+        dict[str, int]: Map of name to the new row id
+    """
+    if not names:
+        return {}
+    rows = db.session.execute(
+        insert(model).returning(model.id, model.name),
+        [{"name": name, "description": describe(name)} for name in names]
+    )
+    return {row.name: row.id for row in rows}
+
+def bulk_load_catalog(category_names: list[str], publisher_names: list[str],
+                      games: Iterable[dict[str, Any]], batch_size: int = BATCH_SIZE) -> int:
+    """
+    Load a catalog with Core executemany inserts instead of ORM objects.
+
+    Categories and publishers are inserted first to build name -> id maps,
+    then games are streamed to the database in batches, so memory use does
+    not grow with the number of games. Must be called inside an app context;
+    the caller commits.
+
+    Args:
+        category_names (list[str]): Unique category names
+        publisher_names (list[str]): Unique publisher names
+        games (Iterable[dict[str, Any]]): Games with title, description, star_rating,
+            category (name) and publisher (name) keys
+        batch_size (int): Number of games per executemany call
+
+    Returns:
+        int: Number of games inserted
+    """
+    category_ids = _insert_named(
+        Category, category_names,
+        lambda name: f"Collection of {name} games available for crowdfunding"
+    )
+    publisher_ids = _insert_named(
+        Publisher, publisher_names,
+        lambda name: f"{name} is a game publisher seeking funding for exciting new titles"
+    )
+
+    game_count = 0
+    for batch in _batched(games, batch_size):
+        db.session.execute(insert(Game), [
+            {
+                "title": game["title"],
+                "description": game["description"],
+                "star_rating": game["star_rating"],
+                "category_id": category_ids[game["category"]],
+                "publisher_id": publisher_ids[game["publisher"]]
+            }
+            for game in batch
+        ])
+        game_count += len(batch)
+
+    bump_catalog_version()
+    return game_count
+
+def load_csv_catalog() -> tuple[int, int, int]:
+    """
+    Load the games, categories and publishers from the seed CSV file.
+
+    Must be called inside an app context; the caller commits.
+
+    Returns:
+        tuple[int, int, int]: Number of games, categories and publishers inserted
+    """
+    csv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'seed_data', 'games.csv')
+
+    with open(csv_path, mode='r', encoding='utf-8') as csv_file:
+        rows = list(csv.DictReader(csv_file))
+
+    # dict.fromkeys keeps first-seen order while removing duplicates
+    category_names = list(dict.fromkeys(row['Category'] for row in rows))
+    publisher_names = list(dict.fromkeys(row['Publisher'] for row in rows))
+
+    games = (
+        {
+            "title": row['Title'],
+            "description": row['Description'] + " Support this game through our crowdfunding platform!",
+            "category": row['Category'],
+            "publisher": row['Publisher'],
+            # Generate random star rating between 3.0 and 5.0 (one decimal place)
+            "star_rating": round(random.uniform(3.0, 5.0), 1)
+        }
+        for row in rows
+    )
+    game_count = bulk_load_catalog(category_names, publisher_names, games)
+    return game_count, len(category_names), len(publisher_names)
+
+def generate_synthetic_catalog(game_count: int, publisher_count: int, category_count: int,
+                               seed: int = 0) -> tuple[list[str], list[str], Iterator[dict[str, Any]]]:
+    """
+    Generate a deterministic synthetic catalog for load tests and benchmarks.
+
+    The same arguments always produce the same catalog. Games are produced
+    lazily, so catalogs with millions of games can be streamed into
+    bulk_load_catalog.
+
+    Args:
+        game_count (int): Number of games to generate
+        publisher_count (int): Number of publishers to generate
+        category_count (int): Number of categories to generate
+        seed (int): Seed for the random number generator
+
+    Returns:
+        tuple[list[str], list[str], Iterator[dict[str, Any]]]: Category names,
+            publisher names and an iterator of games
+    """
+    category_names = [
+        f"{SYNTHETIC_GENRES[i % len(SYNTHETIC_GENRES)]} {i + 1}" for i in range(category_count)
+    ]
+    publisher_names = [f"Synthetic Studios {i + 1}" for i in range(publisher_count)]
+
+    def games() -> Iterator[dict[str, Any]]:
+        """Yield the generated games one at a time."""
+        rng = random.Random(seed)
+        for i in range(game_count):
+            yield {
+                "title": f"{rng.choice(SYNTHETIC_ADJECTIVES)} {rng.choice(SYNTHETIC_NOUNS)} {i + 1}",
+                "description": ' '.join(rng.sample(SYNTHETIC_SENTENCES, 3)),
+                "category": category_names[rng.randrange(category_count)],
+                "publisher": publisher_names[rng.randrange(publisher_count)],
+                "star_rating": round(rng.uniform(1.0, 5.0), 1)
+            }
+
+    return category_names, publisher_names, games()
+
 def create_games():
     """Create games, categories and publishers from CSV data for crowd funding platform"""
     app = create_app()
-    
+
     with app.app_context():
-        # Track which categories and publishers have been created
-        categories = {}  # name -> category object
-        publishers = {}  # name -> publisher object
-        
-        # Read the CSV file
-        csv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                              'seed_data', 'games.csv')
-        
-        game_count = 0
-        with open(csv_path, mode='r', encoding='utf-8') as csv_file:
-            csv_reader = csv.DictReader(csv_file)
-            
-            for row in csv_reader:
-                game_count += 1
-                # Process category
-                category_name = row['Category']
-                if category_name not in categories:
-                    # Create new category if it doesn't exist
-                    category_description = f"Collection of {category_name} games available for crowdfunding"
-                    category = Category(
-                        name=category_name,
-                        description=category_description
-                    )
-                    db.session.add(category)
-                    db.session.flush()  # Get ID without committing
-                    categories[category_name] = category
-                
-                # Process publisher
-                publisher_name = row['Publisher']
-                if publisher_name not in publishers:
-                    # Create new publisher if it doesn't exist
-                    publisher_description = f"{publisher_name} is a game publisher seeking funding for exciting new titles"
-                    publisher = Publisher(
-                        name=publisher_name,
-                        description=publisher_description
-                    )
-                    db.session.add(publisher)
-                    db.session.flush()  # Get ID without committing
-                    publishers[publisher_name] = publisher
-                
-                # Generate random star rating between 3.0 and 5.0 (one decimal place)
-                star_rating = round(random.uniform(3.0, 5.0), 1)
-                
-                # Create the game with enhanced description for crowdfunding context
-                game = Game(
-                    title=row['Title'],
-                    description=row['Description'] + " Support this game through our crowdfunding platform!",
-                    category_id=categories[category_name].id,
-                    publisher_id=publishers[publisher_name].id,
-                    star_rating=star_rating,
-                )
-                db.session.add(game)
-            
-            # Commit all changes at once
-            db.session.commit()
-            
-        print(f"Added {game_count} games with {len(categories)} categories and {len(publishers)} publishers")
+        game_count, category_count, publisher_count = load_csv_catalog()
+        db.session.commit()
+
+    print(f"Added {game_count} games with {category_count} categories and {publisher_count} publishers")
+
+def create_synthetic_games(game_count, publisher_count, category_count, seed=0, connection_string=None):
+    """
+    Create a synthetic catalog of the given size
+
+    Args:
+        game_count: Number of games to generate
+        publisher_count: Number of publishers to generate
+        category_count: Number of categories to generate
+        seed: Seed for the random number generator
+        connection_string: Optional database connection string, defaults to the app database
+    """
+    app = create_app(connection_string)
+
+    with app.app_context():
+        category_names, publisher_names, games = generate_synthetic_catalog(
+            game_count, publisher_count, category_count, seed
+        )
+        inserted = bulk_load_catalog(category_names, publisher_names, games)
+        db.session.commit()
+
+    print(f"Added {inserted} synthetic games with {category_count} categories and {publisher_count} publishers")
 
 def seed_database():
     create_games()
 
 if __name__ == '__main__':
-    seed_database()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Seed the Tailspin Toys database')
+    parser.add_argument('--synthetic', action='store_true',
+                        help='Generate a synthetic catalog instead of loading games.csv')
+    parser.add_argument('--games', type=int, default=100000, help='Number of synthetic games')
+    parser.add_argument('--publishers', type=int, default=1000, help='Number of synthetic publishers')
+    parser.add_argument('--categories', type=int, default=50, help='Number of synthetic categories')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for synthetic data')
+    parser.add_argument('--database', default=None, help='Database connection string')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        create_synthetic_games(args.games, args.publishers, args.categories, args.seed, args.database)
+    else:
+        seed_database()